@@ -13,3 +13,6 @@ from pyioflash.postprocess import elements
 
 # Used to provide most simple time-series like analysis
 from pyioflash.postprocess import analyses 
+
+# Used to provide memoization of shared intermediates of sources and elements
+from pyioflash.postprocess import cache
@@ -11,4 +11,7 @@ from pyioflash.postprocess.analyses import series
 from pyioflash.postprocess.utility import make_sourceable
 from pyioflash.postprocess.utility import make_stackable
 
+# Used to provide instrumentation of sources and elements
+from pyioflash.postprocess.utility import Profiler
+
 #### Define other sub-sub-package modules as analyses ###
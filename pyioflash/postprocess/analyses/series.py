@@ -1,16 +1,31 @@
 """
 
+This module defines the time-series like analysis methods of the post-processing
+subpackage of the pyioflash library; part of the analyses set of routines.
+
+This module currently defines the following methods:
+
+    simple  -> perform a simple time-series like analysis of a source and stack
+
+Todo:
+
 """
 
 
-from typing import Optional, TYPE_CHECKING
+from typing import Any, Tuple, List, Dict, Iterator, Callable, Optional, TYPE_CHECKING
+from itertools import islice
 
 
-from pyioflash.postprocess.utility import StackableMethods, Output, _ingest_source, _make_unwrapper
+import numpy
+
+
+from pyioflash.postprocess.utility import StackableMethods, ExecutorMethods, Output, _ingest_source, _iter_source, \
+                                          _make_accumulator, _make_unwrapper, _prefetch
+from pyioflash.postprocess.cache import persist as _persist
 
 
 if TYPE_CHECKING:
-    from pyioflash.postprocess.utility import Type_Source, Type_Sourceby, Type_Stack, Type_Output
+    from pyioflash.postprocess.utility import Type_Source, Type_Sourceby, Type_Stack, Type_Output, Stackable, Profiler
     from pyioflash.simulation.utility import DataPath
 
 
@@ -21,7 +36,10 @@ def __dir__() -> List[str]:
 
 def simple(source: 'Type_Source', sourceby: Optional['Type_SourceBy'] = None, 
            stack: Optional['Type_Stack'] = None, *, 
-           path: Optional['DataPath'] = None) -> 'Type_Output':
+           path: Optional['DataPath'] = None, stream: bool = False, 
+           workers: Optional[int] = None, executor: str = 'thread', persist: bool = False,
+           prefetch: Optional[int] = None, report: Optional[Dict[str, Any]] = None,
+           batch: int = 16, profile: Optional['Profiler'] = None) -> 'Type_Output':
     """
     Provides a method to perform a simple time-series like post-processing of 
     simulation data; specificaly, this method consumes a source + sourceby, and a 
@@ -29,22 +47,88 @@ def simple(source: 'Type_Source', sourceby: Optional['Type_SourceBy'] = None,
     permutation analysis.
 
     Attributes:
+        source: a source object, name, or function for producing a source
+        sourceby: an object which provides specification of items in the source (optional)
+        stack: stackable element, or tuple of such, to operate on the source in turn (optional)
+        path: object specifing where to source the data; necessary if named source (optional)
+        stream: consume the source as a generator rather than materializing the series (optional)
+        workers: number of workers to concurrently evaluate a 'step' method source (optional)
+        executor: kind of workers to use; must be one of {'thread', 'process'} (optional)
+        persist: whether to cache the result on disk, if a directory is configured (optional)
+        prefetch: number of items to source ahead of the stack on a background thread, if streaming (optional)
+        report: dictionary updated in place with statistics of the prefetch pipeline (optional)
+        batch: number of consecutive items provided to each invocation of a 'batch' element (optional)
+        profile: record the calls of the source and each stack element with the provided profiler (optional)
+
+    Note:
+        Elements with the 'batch' method are provided chunks of (up to) batch consecutive items stacked
+        along a new leading axis (e.g., [k, blks, k, j, i]), and must return a result with the same
+        leading axis; such that vectorized elements amortize the overhead of invocation. The chunk size
+        trades the memory of a chunk against the number of invocations.
 
+        When streaming, 'part' elements are applied to each item as it is sourced, and 'whole'
+        elements which support the accumulator protocol (e.g., integral.time) are fed the series
+        incrementally; such that the peak memory does not grow with the length of the series, provided
+        the source reads only the field data of each step (e.g., energy.kinetic; see _field_from_step).
+        A 'whole' element which does not support (or declines) the protocol is provided the 
+        materialized series, and the remaining stack is processed as if not streaming.
+
+        If workers are provided, the steps of a 'step' method Sourceable are evaluated concurrently
+        and produced in order; per-step sources (e.g., energy.kinetic) are independent across steps.
+
+        If prefetching, items n+1 .. n+prefetch are sourced (e.g., read from hdf5 and guard filled)
+        while the stack processes item n; such that the throughput approaches the greater of the sourcing
+        and the processing rates, rather than their sum. The time the stack stalled waiting on the 
+        prefetch, and the average and maximum number of items ready, are provided in report; see 
+        pyioflash.postprocess.utility._prefetch.
+
+        If persisted, the result is keyed by the source, sourceby, and stack (including the sizes and
+        modification times of the simulation output files); see pyioflash.postprocess.cache.
+
+        If profiled, the wall time, calls, bytes in and out (and peak allocation if desired) of the source
+        and of each stack element are recorded by name; see pyioflash.postprocess.utility.Profiler. The 
+        calls of a source evaluated by process workers are not recorded.
+
+        The execution options must be consistent, rather than being silently ignored; a ValueError is
+        raised if prefetch is provided without stream, report without prefetch, a process executor
+        without workers, or if workers or batch are not positive (or prefetch is negative).
 
     """
+    # need consistent execution options
+    _validate_options(stream=stream, workers=workers, executor=executor, prefetch=prefetch,
+                      report=report, batch=batch)
+
+    # load (or store) the result from the disk cache if desired
+    if persist:
+        return _simple_persisted(source, sourceby, stack, path=path, stream=stream, workers=workers, 
+                                 executor=executor, prefetch=prefetch, report=report, batch=batch,
+                                 profile=profile)
+
     # specify supported methods
     methods = StackableMethods
 
+    # make stack if single provided
+    if stack is not None and type(stack) is not tuple:
+        stack = (stack, )
+
+    # instrument each stack element if desired
+    if stack is not None and profile is not None:
+        stack = tuple(item._replace(element=profile.wrap(item.element)) for item in stack)
+
+    # consume source and leading stack elements as a stream if desired
+    if stream:
+        parts = _iter_source(source, sourceby, path=path, workers=workers, executor=executor, profile=profile)
+        if prefetch:
+            parts = _prefetch(parts, prefetch, report=report)
+        result, stack = _stream(parts, stack, batch)
+
     # injest source from provided information 
-    result = _ingest_source(source, sourceby, path=path)
+    else:
+        result = _ingest_source(source, sourceby, path=path, workers=workers, executor=executor, profile=profile)
     
     # Use stack to operate on source if provided
     if stack is not None:
 
-        # make stack if single provided
-        if type(stack) is not tuple:
-            stack = (stack, )
-
         # Operate on source result by each element in the stack in turn
         unwrap, rewrap, refresh = _make_unwrapper()
         for item in stack:
@@ -69,6 +153,13 @@ def simple(source: 'Type_Source', sourceby: Optional['Type_SourceBy'] = None,
                     result = rewrap([unwrap(item.element(part))
                                      for part in result])
 
+            # operate on consecutive chunks of the previous result with current element
+            elif item.method == 'batch':
+                options = _options(result)
+                chunks = _unwrap(result)
+                result = _concatenate([item.element(numpy.asarray(chunks[start:start + batch]), **options)
+                                       for start in range(0, len(chunks), batch)])
+
             # operate on the previous result as a whole with current element
             elif item.method == 'whole':
 
@@ -85,7 +176,135 @@ def simple(source: 'Type_Source', sourceby: Optional['Type_SourceBy'] = None,
 
             # Unkown method of stack operation provided
             else:
-                raise ValueError(f"Unsupported method of operation '{method}'; must specify {methods}!")
+                raise ValueError(f"Unsupported method of operation '{item.method}'; must specify {methods}!")
 
     return result
 
+
+def _validate_options(*, stream: bool, workers: Optional[int], executor: str, prefetch: Optional[int],
+                      report: Optional[Dict[str, Any]], batch: int) -> None:
+    """Method (internal) provided to reject inconsistent execution options of series.simple; see series.simple"""
+    if executor not in ExecutorMethods:
+        raise ValueError(f"Unsupported executor '{executor}'; must specify {ExecutorMethods}!")
+    if workers is not None and workers < 1:
+        raise ValueError(f'Unsupported number of workers {workers}; must specify a positive integer!')
+    if executor != 'thread' and workers is None:
+        raise ValueError(f"Executor '{executor}' provided without workers; must specify workers!")
+    if prefetch is not None and prefetch < 0:
+        raise ValueError(f'Unsupported prefetch {prefetch}; must specify a non-negative integer!')
+    if prefetch and not stream:
+        raise ValueError(f'Prefetch {prefetch} provided without streaming; must specify stream=True!')
+    if report is not None and not prefetch:
+        raise ValueError(f'Report provided without prefetching; must specify prefetch (and stream=True)!')
+    if batch < 1:
+        raise ValueError(f'Unsupported batch {batch}; must specify a positive integer!')
+
+
+@_persist(ignore=('workers', 'executor', 'prefetch', 'report', 'batch', 'profile'))
+def _simple_persisted(source: 'Type_Source', sourceby: Optional['Type_SourceBy'] = None, 
+                      stack: Optional['Type_Stack'] = None, *, 
+                      path: Optional['DataPath'] = None, stream: bool = False, 
+                      workers: Optional[int] = None, executor: str = 'thread',
+                      prefetch: Optional[int] = None, report: Optional[Dict[str, Any]] = None,
+                      batch: int = 16, profile: Optional['Profiler'] = None) -> 'Type_Output':
+    """Method (internal) provided to persist the result of series.simple; see series.simple"""
+    return simple(source, sourceby, stack, path=path, stream=stream, workers=workers, 
+                  executor=executor, prefetch=prefetch, report=report, batch=batch, profile=profile)
+
+
+def _stream(parts: Iterator['Type_Output'], stack: Optional['Type_Stack'], 
+            batch: int = 16) -> Tuple['Type_Output', Tuple['Stackable']]:
+    """
+    Method (internal) provided to consume a sourced stream by the leading elements of a stack; 
+    returning the result and the remaining (non-streamable) elements of the stack.
+
+    Attributes:
+        parts: generator of sourced items (e.g., the output of each step)
+        stack: tuple of stackable elements to operate on the stream in turn
+        batch: number of consecutive items provided to each invocation of a 'batch' element (optional)
+
+    Todo:
+
+    """
+    # specify supported methods
+    methods = StackableMethods
+
+    # apply elements to the stream in turn until a reduction is no longer streamable
+    stack = () if stack is None else stack
+    for position, item in enumerate(stack):
+
+        # lazily apply stack element to each part of the stream
+        if item.method == 'part':
+            parts = map(lambda part, element=item.element: element(_unwrap(part), **_options(part)), parts)
+
+        # lazily apply stack element to consecutive chunks of the stream
+        elif item.method == 'batch':
+            parts = _batched(parts, item.element, batch)
+
+        # feed the stream to an element operating on the whole by accumulation if supported
+        elif item.method == 'whole':
+
+            # need the first part to provide context to the accumulator
+            parts = iter(parts)
+            first = next(parts, None)
+            accumulator = None if first is None else _make_accumulator(item.element, **_options(first))
+
+            # materialize the stream; element does not support (or declined) accumulation
+            if accumulator is None:
+                parts = [] if first is None else [first] + list(parts)
+                return _materialize(parts), stack[position:]
+
+            # feed the stream to the accumulator
+            accumulator.push(_unwrap(first))
+            for part in parts:
+                accumulator.push(_unwrap(part))
+            return accumulator.result(), stack[position + 1:]
+
+        # Unkown method of stack operation provided
+        else:
+            raise ValueError(f"Unsupported method of operation '{item.method}'; must specify {methods}!")
+
+    return _materialize(list(parts)), ()
+
+
+def _batched(parts: Iterator['Type_Output'], element: Callable[..., 'Type_Output'], 
+             batch: int) -> Iterator['Type_Output']:
+    """Method (internal) provided to apply an element to consecutive chunks of a stream; producing the
+    result of the element one item at a time"""
+    parts = iter(parts)
+    while True:
+        chunk = list(islice(parts, batch))
+        if not chunk:
+            return
+        result = element(numpy.stack([_unwrap(part) for part in chunk]), **_options(chunk[0]))
+        if isinstance(result, Output):
+            yield from (Output(item, result.context, result.mapping) for item in result.data)
+        else:
+            yield from result
+
+
+def _concatenate(chunks: List['Type_Output']) -> 'Type_Output':
+    """Method (internal) provided to collect the results of chunks into a series, rewrapping context if provided"""
+    if chunks and isinstance(chunks[0], Output):
+        return Output(numpy.concatenate([chunk.data for chunk in chunks]), chunks[0].context, chunks[0].mapping)
+    return numpy.concatenate(chunks) if chunks else numpy.array([])
+
+
+def _options(part: 'Type_Output') -> Dict[str, Any]:
+    """Method (internal) provided to map the context of wrapped output to the options of the next element"""
+    if isinstance(part, Output):
+        return {part.mapping[option]: value for option, value in part.context.items() if option in part.mapping}
+    return {}
+
+
+def _unwrap(part: 'Type_Output') -> 'Type_Output':
+    """Method (internal) provided to strip the context of wrapped output"""
+    return part.data if isinstance(part, Output) else part
+
+
+def _materialize(parts: List['Type_Output']) -> 'Type_Output':
+    """Method (internal) provided to collect streamed parts into a series, rewrapping context if provided"""
+    if parts and isinstance(parts[0], Output):
+        return Output(numpy.array([part.data for part in parts]), parts[0].context, parts[0].mapping)
+    return numpy.array(parts)
+
@@ -0,0 +1,458 @@
+"""
+
+This module defines the memoization methods of the post-processing
+subpackage of the pyioflash library; such that shared intermediates of
+sources and elements (e.g., mean fields, interpolated velocities, and volume
+weights) are computed once for each SimulationData object.
+
+Optionally (i.e., once a directory is configured) expensive results are also 
+persisted to disk; such that re-running an analysis on unchanged simulation 
+output loads the results rather than recomputing them. Persisted results are
+keyed by the source of the package, and are not reused after an upgrade; the
+directory should be cleared upon an upgrade to reclaim the space.
+
+This module currently defines the following methods:
+
+    memoize     -> decorator caching the results of a source or element
+    persist     -> decorator caching the results of a function on disk only
+    configure   -> set the byte budgets of the caches and the disk cache directory
+    clear       -> remove cached results of one or all SimulationData objects
+    stats       -> report the counters and memory footprint of a cache
+
+Todo:
+
+"""
+
+
+from typing import Any, Tuple, List, Dict, Iterable, Callable, Optional, TYPE_CHECKING
+from functools import partial, wraps
+from hashlib import blake2b
+from inspect import signature
+from json import dumps, loads
+from tempfile import mkstemp
+from weakref import WeakKeyDictionary
+import os
+
+
+import numpy
+
+
+from pyioflash.simulation.collections import LRUDict
+from pyioflash.simulation.data import SimulationData
+from pyioflash.simulation.utility import _memory_entry
+
+
+# define the module api
+def __dir__() -> List[str]:
+    return ["memoize", "persist", "configure", "clear", "stats"]
+
+
+# byte budget of the cache of each SimulationData object
+_MAX_BYTES: Optional[float] = 2**30
+
+# directory and byte budget of the disk cache; disabled if no directory
+_DIRECTORY: Optional[str] = None
+_DISK_BYTES: Optional[float] = 2**34
+
+# cached results of each SimulationData object; released with the object
+_CACHES: 'WeakKeyDictionary[SimulationData, LRUDict]' = WeakKeyDictionary()
+
+# version of the field data of each SimulationData object when its cache was last used
+_VERSIONS: 'WeakKeyDictionary[SimulationData, int]' = WeakKeyDictionary()
+
+# sentinal of a cache miss
+_MISSING = object()
+
+# salt of every cache key; increment when the format of cached results (or keys) changes
+_CACHE_VERSION: int = 1
+
+# digest of the source of the pyioflash package; computed once, upon first use
+_SOURCE_DIGEST: Optional[str] = None
+
+
+def configure(*, max_bytes: Optional[float] = 2**30, 
+              directory: Optional[str] = None, disk_bytes: Optional[float] = 2**34) -> None:
+    """
+    Provides a method to set the byte budget of the cache of each SimulationData object;
+    existing caches are updated (and evict as necessary upon the next insertion). Additionally,
+    provides a method to enable (or disable) the disk cache of persisted results.
+
+    Attributes:
+        max_bytes: byte budget of each cache; None results in no eviction (optional)
+        directory: path in which to store persisted results; None disables the disk cache (optional)
+        disk_bytes: byte budget of the disk cache; None results in no eviction (optional)
+
+    Note:
+        Persisted results are stored as '.npz' files, which are evicted from least recently used
+        (by modification time, which is updated upon each load) once the budget is exceeded.
+
+        Persisted results are keyed by the source of the pyioflash package, such that results are
+        never reused after an upgrade (or any modification) of the package; however, the results of
+        the previous version are only evicted by the budget, so the directory should be cleared (e.g.,
+        removed) upon an upgrade in order to reclaim the space.
+
+    Todo:
+
+    """
+    global _MAX_BYTES, _DIRECTORY, _DISK_BYTES
+    _MAX_BYTES = max_bytes
+    _DIRECTORY = directory
+    _DISK_BYTES = disk_bytes
+    if directory is not None:
+        os.makedirs(directory, exist_ok=True)
+    for cache in list(_CACHES.values()):
+        cache.max_bytes = max_bytes
+
+
+def clear(data: Optional['SimulationData'] = None) -> None:
+    """
+    Provides a method to remove the cached results of a SimulationData object, or all if not provided.
+
+    Attributes:
+        data: object whose cached results are to be removed (optional)
+
+    Todo:
+
+    """
+    if data is None:
+        caches = list(_CACHES.values())
+    else:
+        caches = [_CACHES[data]] if data in _CACHES else []
+    for cache in caches:
+        cache.clear()
+
+
+def stats(data: 'SimulationData') -> Dict[str, Any]:
+    """
+    Provides a method to report the counters and memory footprint of the cache of a SimulationData object.
+
+    Attributes:
+        data: object whose cache is to be reported
+
+    Todo:
+
+    """
+    return _cache_from_data(data).stats()
+
+
+def memoize(function: Optional[Callable] = None, *, 
+            times: Iterable[str] = (), persist: bool = False) -> Callable:
+    """
+    Provides a decorator which caches the results of a source or element, whose first positional
+    argument is a SimulationData object; results are keyed by the function, the identity of the
+    data, and the normalized (remaining) arguments after defaults are applied.
+
+    Attributes:
+        function: source or element to memoize; allows use with or without arguments (optional)
+        times: names of arguments which are time-like specifications; normalized to indices (optional)
+        persist: whether to also cache results on disk, if a directory is configured (optional)
+
+    Note:
+        Arguments are normalized such that equivalent requests share an entry; e.g., slices and tuples
+        are compared by value, numpy arrays by content, and time-like specifications by the indices of
+        the simulation keys they select (such that a step may be provided as either a key or an index).
+
+        Cached arrays are made read-only, as they are shared by every subsequent request; the memoized
+        function returns a writable copy of the cached result, while function.shared returns the cached
+        (read-only) result itself for callers which do not modify it. Requests with arguments which cannot
+        be normalized are evaluated without the cache.
+
+        The cached results of the data are discarded once any of its field data is set (e.g., 
+        data.fields[step][0].temp = ...), as counted by the _version of each FieldData member.
+
+        Persisted results are additionally keyed by the size and modification time of the simulation
+        output files of the data (rather than its identity), and by the source of the pyioflash package;
+        see persist and configure. As such, the disk cache is not used for data whose field data has been set.
+
+    Todo:
+
+    """
+    def decorator(function: Callable) -> Callable:
+        parameters = signature(function)
+        qualified = _qualify(function)
+
+        def shared(data: 'SimulationData', *args: Any, **kwargs: Any) -> Any:
+            try:
+                bound = parameters.bind(data, *args, **kwargs)
+                bound.apply_defaults()
+                key = qualified + tuple((name, _normalize_times(data, value) if name in times else _normalize(value))
+                                        for name, value in list(bound.arguments.items())[1:])
+                hash(key)
+            except TypeError:
+                return function(data, *args, **kwargs)
+
+            cache = _cache_from_data(data)
+            result = cache.get(key, _MISSING)
+            if result is _MISSING:
+                stored = key + (_fingerprint(data), ) if persist and _DIRECTORY is not None \
+                    and not _version(data) else None
+                result = _load(stored)
+                if result is _MISSING:
+                    result = function(data, *args, **kwargs)
+                    _store(stored, result)
+                result = _freeze(result)
+                cache.put(key, result)
+            return result
+
+        @wraps(function)
+        def memoized(data: 'SimulationData', *args: Any, **kwargs: Any) -> Any:
+            return _thaw(shared(data, *args, **kwargs))
+
+        memoized.shared = wraps(function)(shared)
+        memoized.uncached = function
+        return memoized
+
+    return decorator if function is None else decorator(function)
+
+
+def persist(function: Optional[Callable] = None, *, ignore: Iterable[str] = ()) -> Callable:
+    """
+    Provides a decorator which caches the results of a function on disk, if a directory is configured;
+    results are keyed by the function, and the normalized arguments after defaults are applied; where
+    any SimulationData object (e.g., referenced by a source or DataPath) is represented by the names,
+    sizes, and modification times of its simulation output files.
+
+    Attributes:
+        function: function to persist; allows use with or without arguments (optional)
+        ignore: names of arguments which do not affect the result (e.g., number of workers) (optional)
+
+    Note:
+        Only results which are numpy arrays, numbers, or (nested) tuples and lists of such are persisted;
+        requests with arguments which cannot be normalized (including SimulationData objects whose
+        field data has been set) are evaluated without the disk cache.
+
+    Todo:
+
+    """
+    def decorator(function: Callable) -> Callable:
+        parameters = signature(function)
+        qualified = _qualify(function)
+
+        @wraps(function)
+        def persisted(*args: Any, **kwargs: Any) -> Any:
+            if _DIRECTORY is None:
+                return function(*args, **kwargs)
+            try:
+                bound = parameters.bind(*args, **kwargs)
+                bound.apply_defaults()
+                key = qualified + tuple((name, _normalize(value, stable=True)) 
+                                        for name, value in bound.arguments.items() if name not in ignore)
+            except TypeError:
+                return function(*args, **kwargs)
+
+            result = _load(key)
+            if result is _MISSING:
+                result = function(*args, **kwargs)
+                _store(key, result)
+            return result
+
+        persisted.uncached = function
+        return persisted
+
+    return decorator if function is None else decorator(function)
+
+
+def _cache_from_data(data: 'SimulationData') -> LRUDict:
+    """Method (internal) provided to retrieve (or create) the cache of a SimulationData object;
+    cleared if the field data of the object has been set since the cache was last used"""
+    cache = _CACHES.get(data)
+    if cache is None:
+        cache = _CACHES.setdefault(data, LRUDict(_MAX_BYTES, sizer=lambda value: _memory_entry(value)['nbytes']))
+    version = _version(data)
+    if _VERSIONS.get(data, 0) != version:
+        cache.clear()
+        _VERSIONS[data] = version
+    return cache
+
+
+def _version(data: 'SimulationData') -> int:
+    """Method (internal) provided to count the times the field data of a SimulationData object has been set"""
+    return sum(getattr(member, '_version', 0) for member in data.fields)
+
+
+def _freeze(value: Any) -> Any:
+    """Method (internal) provided to make the (nested) arrays of a cached result read-only"""
+    if isinstance(value, numpy.ndarray):
+        value.flags.writeable = False
+    elif isinstance(value, (tuple, list)):
+        for item in value:
+            _freeze(item)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """Method (internal) provided to copy the (nested) read-only arrays of a cached result, such that it is writable"""
+    if isinstance(value, numpy.ndarray):
+        return value if value.flags.writeable else value.copy()
+    elif isinstance(value, tuple) and hasattr(value, '_fields'):
+        return type(value)._make(_thaw(item) for item in value)
+    elif isinstance(value, (tuple, list)):
+        return type(value)(_thaw(item) for item in value)
+    return value
+
+
+def _fingerprint(data: SimulationData) -> Tuple[Any]:
+    """Method (internal) provided to represent a SimulationData object by the names, sizes, and
+    modification times of its simulation output (and grid) files"""
+    names = list(data.files.names) + ([data.files.geometry] if data.files.geometry else [])
+    stats = [(os.path.abspath(name), os.stat(name)) for name in names if os.path.exists(name)]
+    return ('data', ) + tuple((name, stat.st_size, stat.st_mtime_ns) for name, stat in stats)
+
+
+def _load(key: Optional[Tuple[Any]]) -> Any:
+    """Method (internal) provided to load a persisted result from the disk cache, if available"""
+    if key is None or _DIRECTORY is None:
+        return _MISSING
+    path = _path_from_key(key)
+    try:
+        with numpy.load(path, allow_pickle=False) as archive:
+            structure = loads(str(archive['__structure__']))
+            leaves = [archive[f'leaf_{number}'] for number in range(len(archive.files) - 1)]
+        os.utime(path)
+    except (OSError, KeyError, ValueError):
+        return _MISSING
+    return _unflatten(structure, leaves)
+
+
+def _store(key: Optional[Tuple[Any]], value: Any) -> None:
+    """Method (internal) provided to store a result in the disk cache, evicting least recently used results"""
+    if key is None or _DIRECTORY is None:
+        return
+    leaves = []
+    try:
+        structure = dumps(_flatten(value, leaves))
+    except TypeError:
+        return
+
+    # write to a temporary file and then move, such that partial results are never loaded
+    handle, temporary = mkstemp(suffix='.tmp', dir=_DIRECTORY)
+    try:
+        with os.fdopen(handle, 'wb') as file:
+            numpy.savez(file, __structure__=numpy.array(structure), 
+                        **{f'leaf_{number}': leaf for number, leaf in enumerate(leaves)})
+        os.replace(temporary, _path_from_key(key))
+    except OSError:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        return
+
+    # evict least recently used results to satisfy the budget
+    if _DISK_BYTES is not None:
+        entries = [os.path.join(_DIRECTORY, name) for name in os.listdir(_DIRECTORY) if name.endswith('.npz')]
+        entries = sorted((os.stat(entry).st_mtime_ns, os.stat(entry).st_size, entry) for entry in entries)
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in entries[:-1]:
+            if total <= _DISK_BYTES:
+                break
+            os.remove(entry)
+            total -= size
+
+
+def _path_from_key(key: Tuple[Any]) -> str:
+    """Method (internal) provided to determine the disk cache file of a (stable) key"""
+    return os.path.join(_DIRECTORY, f'{key[1]}-{blake2b(repr(key).encode()).hexdigest()[:32]}.npz')
+
+
+def _flatten(value: Any, leaves: List[numpy.ndarray]) -> Any:
+    """Method (internal) provided to describe a result as a (json) structure of array leaves;
+    raises TypeError if the result cannot be persisted"""
+    if isinstance(value, (numpy.ndarray, numpy.generic, bool, int, float, complex)):
+        array = numpy.asarray(value)
+        if array.dtype.hasobject:
+            raise TypeError(f'Unable to persist arrays of objects')
+        leaves.append(array)
+        return {'leaf': len(leaves) - 1, 'scalar': not isinstance(value, numpy.ndarray)}
+    elif type(value) in (tuple, list):
+        return {'sequence': type(value).__name__, 'items': [_flatten(item, leaves) for item in value]}
+    else:
+        raise TypeError(f"Unable to persist result of type '{type(value).__name__}'")
+
+
+def _unflatten(structure: Any, leaves: List[numpy.ndarray]) -> Any:
+    """Method (internal) provided to rebuild a result from a (json) structure of array leaves"""
+    if 'leaf' in structure:
+        leaf = leaves[structure['leaf']]
+        return leaf[()] if structure['scalar'] else leaf
+    sequence = {'tuple': tuple, 'list': list}[structure['sequence']]
+    return sequence(_unflatten(item, leaves) for item in structure['items'])
+
+
+def _normalize(value: Any, *, stable: bool = False) -> Any:
+    """Method (internal) provided to convert an argument to a hashable, by-value, representation;
+    if stable, the representation is also consistent between sessions (e.g., for the disk cache).
+    raises TypeError if the argument cannot be normalized"""
+    normalize = partial(_normalize, stable=stable)
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return value
+    elif isinstance(value, numpy.generic):
+        return value.item()
+    elif isinstance(value, slice):
+        return ('slice', normalize(value.start), normalize(value.stop), normalize(value.step))
+    elif isinstance(value, (tuple, list, range)):
+        return (type(value).__name__, ) + tuple(normalize(item) for item in value)
+    elif isinstance(value, dict):
+        return ('dict', ) + tuple(sorted((normalize(key), normalize(item)) for key, item in value.items()))
+    elif isinstance(value, numpy.ndarray):
+        return ('ndarray', value.shape, value.dtype.str, blake2b(numpy.ascontiguousarray(value)).hexdigest())
+    elif isinstance(value, partial):
+        return ('partial', normalize(value.func), normalize(value.args), normalize(value.keywords))
+    elif isinstance(value, SimulationData) and stable:
+        if _version(value):
+            raise TypeError(f'Unable to normalize SimulationData whose field data has been set')
+        return _fingerprint(value)
+    elif callable(value) and hasattr(value, '__wrapped__'):
+        return normalize(value.__wrapped__)
+    elif callable(value) and '<' not in getattr(value, '__qualname__', '<'):
+        return ('callable', ) + _qualify(value)
+    else:
+        raise TypeError(f"Unable to normalize argument of type '{type(value).__name__}'")
+
+
+def _qualify(function: Callable) -> Tuple[str]:
+    """Method (internal) provided to identify a function; including its bytecode, names, and constants, and the
+    source of the package, such that persisted results are not reused after the function, any function it calls
+    (e.g., sources, elements, and interpolation), or the cache version is modified"""
+    code = getattr(function, '__code__', None)
+    digest = blake2b(_code_bytes(code)).hexdigest()[:16] if code is not None else ''
+    return (function.__module__, function.__qualname__, digest, _source_digest(), _CACHE_VERSION)
+
+
+def _source_digest() -> str:
+    """Method (internal) provided to identify the source of the pyioflash package by the (relative) paths
+    and contents of its modules; computed once and reused"""
+    global _SOURCE_DIGEST
+    if _SOURCE_DIGEST is None:
+        package = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        digest = blake2b()
+        for root, directories, names in os.walk(package):
+            directories.sort()
+            for name in sorted(name for name in names if name.endswith('.py')):
+                path = os.path.join(root, name)
+                digest.update(os.path.relpath(path, package).encode())
+                with open(path, 'rb') as file:
+                    digest.update(file.read())
+        _SOURCE_DIGEST = digest.hexdigest()[:16]
+    return _SOURCE_DIGEST
+
+
+def _code_bytes(code: Any) -> bytes:
+    """Method (internal) provided to represent the bytecode, names, and constants of a code object, including
+    those of nested code objects (e.g., comprehensions), consistently between sessions"""
+    if hasattr(code, 'co_code'):
+        return b'code(' + code.co_code + repr(code.co_names).encode() + \
+            b''.join(_code_bytes(const) for const in code.co_consts) + b')'
+    elif isinstance(code, (tuple, list)):
+        return b'(' + b','.join(_code_bytes(item) for item in code) + b')'
+    elif isinstance(code, frozenset):
+        return b'{' + b','.join(sorted(_code_bytes(item) for item in code)) + b'}'
+    else:
+        return repr(code).encode()
+
+
+def _normalize_times(data: 'SimulationData', value: Any) -> Tuple[int]:
+    """Method (internal) provided to convert a time-like specification to the indices it selects"""
+    if value is None:
+        return None
+    count = len(data.utility.indices())
+    return ('indices', ) + tuple(int(index) % count if -count <= index < count else int(index)
+                                 for index in data.utility.indices(value))
@@ -9,8 +9,11 @@ sub-sub-package.
 # Used to provide most simple integration operations 
 from pyioflash.postprocess.elements import integral
 
+# Used to provide most simple reduction operations
+from pyioflash.postprocess.elements import reduction
+
 # Used to provide most simple derivative operations
-#from pyioflash.postprocess.elements import derivative
+from pyioflash.postprocess.elements import derivative
 
 # Used to provide most simple relative-based operations
 #from pyioflash.postprocess.elements import relative
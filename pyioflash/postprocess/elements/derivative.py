@@ -0,0 +1,278 @@
+"""
+
+This module defines the derivative methods of the post-processing
+subpackage of the pyioflash library; part of the Stackable set of routines.
+
+This module currently defines the following methods:
+
+    gradient    -> perform the gradient of a cell or face centered field
+    divergence  -> perform the divergence of cell or face centered components
+    laplacian   -> perform the laplacian of a cell centered field
+
+Todo:
+
+"""
+
+
+from typing import Tuple, List, Dict, Optional, TYPE_CHECKING
+
+
+import numpy
+
+
+from pyioflash.postprocess.utility import Output
+
+
+if TYPE_CHECKING:
+    from pyioflash.simulation.data import SimulationData
+    from pyioflash.simulation.geometry import GeometryData
+    from pyioflash.postprocess.utility import Type_Field, Type_Output, Type_Index
+
+
+# define the module api
+def __dir__() -> List[str]:
+    return ["gradient", "divergence", "laplacian"]
+
+
+# supported locations of fields; cell centered or face centered along each axis
+_LOCATIONS = {'center': None, 'x': 0, 'y': 1, 'z': 2}
+
+
+def gradient(data: 'SimulationData', field: 'Type_Field', *,
+             location: str = 'center',
+             wrapped: bool = False, mapping: Dict[str, str] = {},
+             scale: Optional[float] = None, index: Optional['Type_Index'] = None,
+             keepdims: bool = True) -> 'Type_Output':
+    """
+    Provides a method for calculation of the gradient of a cell or face centered field on the
+    cell centered grid by consuming a SimulationData object; for all blocks at once.
+
+    Attributes:
+        data: object containing relavent flash simulation output
+        field: guard cell padded numpy array for which to perform the gradient; [..., b, k, j, i]
+        location: where the field is defined on the grid [center, x, y, z] (optional)
+        wrapped: whether to wrap context around result of derivative (optional)
+        mapping: if wrapped, how to map context to options of the next operation (optional)
+        scale: used to convert returned quantity to dimensional units (optional)
+        index: used for custom slicing operation on result; should be (blks, k, j, i) (optional)
+        keepdims: retain unused dimensions for broadcasting, else drop them (optional)
+
+    Note:
+        The gradient is computed for each axis according to the formulas
+
+                center:         (f~i+1~ - f~i-1~) / (x~i+1~ - x~i-1~)
+                staggered:      (f~i+1/2~ - f~i-1/2~) / (x~i+1/2~ - x~i-1/2~)
+                transverse:     average of the center formula on the faces i-1/2 and i+1/2
+
+        using the cell centered grid metrics (i.e., _grd_mesh_ddx, _grd_mesh_ddy, _grd_mesh_ddz); where
+        a face centered field (e.g., _fcx2 for location 'x') is staggered along its axis.
+
+        The field must include the guard cells (e.g., data.fields['_temp']); the result is on the interior
+        cells, with the components stacked ahead of the block axis; [..., dims, b, k, j, i].
+
+        Any leading axes of the field (e.g., a 'batch' of times; [t, b, k, j, i]) are retained.
+
+        This function does not generate any dynamic context; this even if wrapping is desired and specified, the
+        mapping attribute is ignored.
+
+    Todo:
+
+    """
+
+    # need the dimensionality
+    dimension = data.geometry.grd_dim
+
+    # calculate the derivative along each axis
+    result = numpy.stack([_derivative(data.geometry, field, axis, location) for axis in range(dimension)], axis=-5)
+
+    return _finish(result, dimension, wrapped, scale, index, keepdims)
+
+
+def divergence(data: 'SimulationData', fields: 'Type_Field', *,
+               staggered: bool = True,
+               wrapped: bool = False, mapping: Dict[str, str] = {},
+               scale: Optional[float] = None, index: Optional['Type_Index'] = None,
+               keepdims: bool = True) -> 'Type_Output':
+    """
+    Provides a method for calculation of the divergence of vector components on the
+    cell centered grid by consuming a SimulationData object; for all blocks at once.
+
+    Attributes:
+        data: object containing relavent flash simulation output
+        fields: guard cell padded numpy array of the stacked components; [..., dims, b, k, j, i]
+        staggered: whether each component is face centered along its axis (e.g., _fcx2, _fcy2) (optional)
+        wrapped: whether to wrap context around result of derivative (optional)
+        mapping: if wrapped, how to map context to options of the next operation (optional)
+        scale: used to convert returned quantity to dimensional units (optional)
+        index: used for custom slicing operation on result; should be (blks, k, j, i) (optional)
+        keepdims: retain unused dimensions for broadcasting, else drop them (optional)
+
+    Note:
+        The divergence is computed according to the formula
+
+                sum( d(f~a~)/dx~a~ ) over all axes a
+
+        where each derivative is computed as for gradient.
+
+        Any leading axes of the fields (e.g., a 'batch' of times; [t, dims, b, k, j, i]) are retained.
+
+        This function does not generate any dynamic context; this even if wrapping is desired and specified, the
+        mapping attribute is ignored.
+
+    Todo:
+
+    """
+
+    # need the dimensionality
+    dimension = data.geometry.grd_dim
+
+    # strip context if was provided
+    if isinstance(fields, Output):
+        fields = fields.data
+    fields = numpy.asarray(fields)
+
+    # accumulate the derivative of each component along its axis
+    result = None
+    for axis in range(dimension):
+        location = 'xyz'[axis] if staggered else 'center'
+        term = _derivative(data.geometry, fields[..., axis, :, :, :, :], axis, location)
+        result = term if result is None else numpy.add(result, term, out=result)
+
+    return _finish(result, dimension, wrapped, scale, index, keepdims)
+
+
+def laplacian(data: 'SimulationData', field: 'Type_Field', *,
+              wrapped: bool = False, mapping: Dict[str, str] = {},
+              scale: Optional[float] = None, index: Optional['Type_Index'] = None,
+              keepdims: bool = True) -> 'Type_Output':
+    """
+    Provides a method for calculation of the laplacian of a cell centered field on the
+    cell centered grid by consuming a SimulationData object; for all blocks at once.
+
+    Attributes:
+        data: object containing relavent flash simulation output
+        field: guard cell padded numpy array for which to perform the laplacian; [..., b, k, j, i]
+        wrapped: whether to wrap context around result of derivative (optional)
+        mapping: if wrapped, how to map context to options of the next operation (optional)
+        scale: used to convert returned quantity to dimensional units (optional)
+        index: used for custom slicing operation on result; should be (blks, k, j, i) (optional)
+        keepdims: retain unused dimensions for broadcasting, else drop them (optional)
+
+    Note:
+        The laplacian is computed according to the formula
+
+                sum( ((f~i+1~ - f~i~) ddr~i~ - (f~i~ - f~i-1~) ddl~i~) ddc~i~ ) over all axes
+
+        using the left, center, and right cell centered grid metrics (e.g., _grd_mesh_ddx).
+
+        Any leading axes of the field (e.g., a 'batch' of times; [t, b, k, j, i]) are retained.
+
+        This function does not generate any dynamic context; this even if wrapping is desired and specified, the
+        mapping attribute is ignored.
+
+    Todo:
+
+    """
+
+    # need the dimensionality
+    dimension = data.geometry.grd_dim
+
+    # get guard size
+    guard = int(data.geometry.blk_guards / 2)
+
+    # strip context if was provided
+    if isinstance(field, Output):
+        field = field.data
+
+    # accumulate the second derivative along each axis
+    result = None
+    center = field[_shifted(guard)]
+    for axis in range(dimension):
+        left, middle, right = _metrics(data.geometry, axis)
+        term = (field[_shifted(guard, {axis: 1})] - center) * right
+        term -= (center - field[_shifted(guard, {axis: -1})]) * left
+        term *= middle
+        result = term if result is None else numpy.add(result, term, out=result)
+
+    return _finish(result, dimension, wrapped, scale, index, keepdims)
+
+
+def _derivative(geometry: 'GeometryData', field: 'Type_Field', axis: int, location: str) -> 'Type_Field':
+    """Method (internal) provided to calculate the derivative along an axis on the interior cells; see gradient"""
+
+    # get guard size
+    guard = int(geometry.blk_guards / 2)
+
+    # strip context if was provided
+    if isinstance(field, Output):
+        field = field.data
+
+    # determine if the field is staggered
+    if location not in _LOCATIONS:
+        raise ValueError(f"Unsupported location '{location}' of field; must specify {set(_LOCATIONS)}!")
+    stagger = _LOCATIONS[location]
+
+    # staggered along the axis; difference of the bounding faces of each cell
+    if stagger == axis:
+        return (field[_shifted(guard)] - field[_shifted(guard, {axis: -1})]) * _metrics(geometry, axis)[1]
+
+    # cell centered; central difference of the neighboring cells
+    spacing = _central(geometry, axis)
+    result = field[_shifted(guard, {axis: 1})] - field[_shifted(guard, {axis: -1})]
+    if stagger is None:
+        return numpy.multiply(result, spacing, out=result)
+
+    # staggered along another axis; average the central difference of the bounding faces of each cell
+    result += field[_shifted(guard, {axis: 1, stagger: -1})]
+    result -= field[_shifted(guard, {axis: -1, stagger: -1})]
+    result *= 0.5 * spacing
+    return result
+
+
+def _shifted(guard: int, shifts: Dict[int, int] = {}) -> Tuple[slice, ...]:
+    """Provides the slicing operator (internal) of the interior cells, shifted along desired axes"""
+    cut = [slice(guard, -guard)] * 3
+    for axis, shift in shifts.items():
+        cut[2 - axis] = slice(guard + shift, (-guard + shift) or None)
+    return (Ellipsis, ) + tuple(cut)
+
+
+def _metrics(geometry: 'GeometryData', axis: int) -> Tuple['Type_Field', ...]:
+    """Provides the (cached) left, center, and right grid metrics on the interior cells (internal)"""
+    cache = geometry._derived.setdefault('derivative_metrics', {})
+    if axis not in cache:
+        guard = int(geometry.blk_guards / 2)
+        metric = getattr(geometry, '_grd_mesh_dd' + 'xyz'[axis])
+        cache[axis] = tuple(numpy.ascontiguousarray(metric[(face, slice(None)) + _shifted(guard)[1:]])
+                            for face in range(3))
+    return cache[axis]
+
+
+def _central(geometry: 'GeometryData', axis: int) -> 'Type_Field':
+    """Provides the (cached) inverse of the central difference spacing on the interior cells (internal)"""
+    cache = geometry._derived.setdefault('derivative_central', {})
+    if axis not in cache:
+        left, middle, right = _metrics(geometry, axis)
+        cache[axis] = 1.0 / (1.0 / left + 1.0 / right)
+    return cache[axis]
+
+
+def _finish(result: 'Type_Field', dimension: int, wrapped: bool, scale: Optional[float],
+            index: Optional['Type_Index'], keepdims: bool) -> 'Type_Output':
+    """Method (internal) provided to scale, index, and wrap the result of a derivative"""
+
+    # apply a dimensional scale
+    if scale is not None:
+        result = result * scale
+
+    # need to define slicing operators based on dims
+    if index is None:
+        i_all = slice(None)
+        index = (i_all, ) * 4 if (keepdims or dimension == 3) else (i_all, 0, i_all, i_all)
+
+    # index results if desired
+    result = result[(Ellipsis, ) + tuple(index)]
+
+    # wrap result of derivative if desired (no context to provide)
+    wrap = {True: lambda result: Output(result), False: lambda result: result}
+    return wrap[wrapped](result)
@@ -6,21 +6,26 @@ subpackage of the pyioflash library; part of the Stackable set of routines.
 This module currently defines the following methods:
 
     space   -> perform simple spatial integration
+    space_series    -> perform simple spatial integration of each item of a series
+    space_single    -> perform simple spatial integration (or average) along a single axis
+    space_region    -> perform simple spatial integration (or average) over bounded regions
     time    -> perform simple temporal integration
 
 Todo:
-    work on single and double spatial integration
+    work on double spatial integration
 
 """
 
 
-from typing import Tuple, Dict, Union, Iterable, Optional, TYPE_CHECKING
+from collections import deque
+from typing import Any, Tuple, List, Dict, Union, Iterable, Optional, TYPE_CHECKING
 
 
 import numpy
 
 
-from pyioflash.postprocess.utility import Output
+from pyioflash.simulation.utility import _block_positions, _block_index, _blocks_from_boxes
+from pyioflash.postprocess.utility import Output, Accumulator, accumulates, _CHUNK_BYTES
 
 
 if TYPE_CHECKING:
@@ -30,7 +35,7 @@ if TYPE_CHECKING:
 
 # define the module api
 def __dir__() -> List[str]:
-    return ["space_full", "time"]
+    return ["space_full", "space_series", "space_single", "space_region", "time"]
 
 
 def space_full(data: 'SimulationData', field: 'Type_Field', *, 
@@ -59,6 +64,8 @@ def space_full(data: 'SimulationData', field: 'Type_Field', *,
 
                 sum( field{ijk} dV{ijk} ) over all ijk
 
+        If field has leading axes (e.g., a 'batch' of times; [t, b, ...]), the integral is performed for each.
+
         This function does not generate any dynamic context; this even if wrapping is desired and specified, the
         mapping attribute is ignored.
 
@@ -80,95 +87,499 @@ def space_full(data: 'SimulationData', field: 'Type_Field', *,
 
     # calculate volume elements
     if differential:
-        # need to define grid face to compute volume elements 
-        i_grd = {"left" : 0, "center" : 1, "right" : 2}[face]
-
-        # retrieve cell centered grid metrics
-        if withguard:
-            ddxc = data.geometry._grd_mesh_ddx[(i_grd, ) + index]
-            ddyc = data.geometry._grd_mesh_ddy[(i_grd, ) + index]
-        else: 
-            ddxc = data.geometry.grd_mesh_ddx[(i_grd, ) + index]
-            ddyc = data.geometry.grd_mesh_ddy[(i_grd, ) + index]
-    
-    
-        # initialize volume element
-        deltaV = 1/ddxc * 1/ddyc
-        if dimension == 3:
-            if withguard:
-                ddzc = data.geometry._grd_mesh_ddz[(i_grd, ) + index]
-            else:
-                ddzc = data.geometry.grd_mesh_ddz[(i_grd, ) + index]
-            deltaV = deltaV * 1/ddzc
+        deltaV = _volume_weights(data, face=face, index=index, withguard=withguard)
 
     # use constant weights
     else:
         deltaV = 1.0
 
-    # perform integration and index the result
-    integral = numpy.sum(field * deltaV)
+    # perform integration over the spatial axes; retaining any leading axes (e.g., time)
+    spatial = sum(not isinstance(i, int) for i in index) if isinstance(index, tuple) else 4
+    if differential and numpy.shape(field)[-spatial:] == numpy.shape(deltaV):
+        integral = numpy.tensordot(field, deltaV, axes=spatial)[()]
+    else:
+        integral = numpy.sum(field * deltaV, axis=tuple(range(-spatial, 0)) if numpy.ndim(field) > spatial else None)
 
     # wrap result of integration if desired (no context to provide)
     wrap = {True: lambda integral: Output(integral), False: lambda integral: integral} 
     return wrap[wrapped](integral)
 
 
+class _SpaceAccumulator(Accumulator):
+    """Accumulator (internal) of the spatial integrals of a series, by chunk; see integral.space_series"""
+
+    def __init__(self, data: 'SimulationData', chunk: int, options: Dict[str, Any]) -> None:
+        self.data, self.chunk, self.options = data, max(1, chunk), options
+        self.items, self.integrals = [], []
+
+    def push(self, item: 'Type_Field') -> None:
+        self.items.append(item)
+        if len(self.items) == self.chunk:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self.items:
+            self.integrals.append(numpy.atleast_1d(_space_chunk(self.data, numpy.stack(self.items), **self.options)))
+            self.items = []
+
+    def result(self) -> 'Type_Output':
+        self._flush()
+        integrals = numpy.concatenate(self.integrals) if self.integrals else numpy.array([])
+        return _space_finish(integrals, **self.options)
+
+
+def _space_accumulator(data: 'SimulationData', *, chunk: int = 16, **options: Any) -> _SpaceAccumulator:
+    """Provides an accumulator (internal) of the spatial integrals of a series; see integral.space_series"""
+    return _SpaceAccumulator(data, chunk, options)
+
+
+def _space_chunk(data: 'SimulationData', fields: 'Type_Field', *, face: str = 'center', differential: bool = True,
+                 wrapped: bool = False, mapping: Dict[str, str] = {}, scale: Optional[float] = None, 
+                 index: Optional['Type_Index'] = None, withguard: bool = False, 
+                 keepdims: bool = True) -> 'Type_Field':
+    """Method (internal) provided to integrate a chunk of the series; [t, ...] -> [t]"""
+    return space_full(data, fields, face=face, differential=differential, index=index,
+                      withguard=withguard, keepdims=keepdims)
+
+
+def _space_finish(integrals: 'Type_Field', *, wrapped: bool = False, scale: Optional[float] = None, 
+                  **options: Any) -> 'Type_Output':
+    """Method (internal) provided to scale and wrap the spatial integrals of a series"""
+
+    # apply a dimensional scale
+    if scale is not None:
+        integrals = integrals * scale
+
+    # wrap result of integration if desired (no context to provide)
+    wrap = {True: lambda integrals: Output(integrals), False: lambda integrals: integrals} 
+    return wrap[wrapped](integrals)
+
+
+@accumulates(_space_accumulator)
+def space_series(data: 'SimulationData', fields: 'Type_Output', *,
+                 chunk: int = 16, face: str = 'center',
+                 differential: bool = True, 
+                 wrapped: bool = False, mapping: Dict[str, str] = {},
+                 scale: Optional[float] = None, index: Optional['Type_Index'] = None, 
+                 withguard: bool = False, keepdims: bool = True) -> 'Type_Output':
+    """
+    Provides a method for calculation of the volumetric integral of each item of a series of fields
+    by consuming a SimulationData object; as a vectorized reduction of chunks of the series.
+
+    Attributes:
+        data: object containing relavent flash simulation output
+        fields: array, (lazy) list, or iterator of fields for which to perform integration; [t, b, ...]
+        chunk: number of items of the series reduced at once; bounds the memory of a stacked chunk (optional)
+        face: which grid face to perform integration over [left, center, right] (optional)
+        differential: whether to use the volume elements of integration (optional)
+        wrapped: whether to wrap context around result of integration (optional)
+        mapping: if wrapped, how to map context to options of the next operation (optional)
+        scale: used to convert returned quantity to dimensional units (optional)
+        index: used for custom slicing operation on differential; should be (blks, k, j, i) (optional)
+        withguard: input fields have retained guard cells (optional)
+        keepdims: input fields have retained unused dimensions for broadcasting, else were dropped (optional)
+
+    Note:
+        The integrals are computed according to the formula
+
+                sum( field{t, ijk} dV{ijk} ) over all ijk, for each t
+
+        where each chunk, [chunk, b, ...], is reduced against the cached volume elements by a single
+        tensordot (see integral.space_full); rather than calling space_full for each item. Chunks of 
+        an array are views, and items of a list or iterator are stacked a chunk at a time.
+
+        This function supports the accumulator protocol (i.e., series.simple(..., stream=True)); such that 
+        a streamed series is integrated a chunk at a time, without materializing the series.
+
+        This function does not generate any dynamic context; this even if wrapping is desired and specified, the
+        mapping attribute is ignored.
+
+    Todo:
+
+    """
+
+    # strip context if was provided
+    if isinstance(fields, Output):
+        fields = fields.data
+
+    # options of integration
+    options = {'face': face, 'differential': differential, 'wrapped': wrapped, 'scale': scale, 
+               'index': index, 'withguard': withguard, 'keepdims': keepdims}
+
+    # integrate chunks of an array directly
+    if isinstance(fields, numpy.ndarray):
+        chunk = max(1, chunk)
+        integrals = [numpy.atleast_1d(_space_chunk(data, fields[start:start + chunk], **options))
+                     for start in range(0, len(fields), chunk)]
+        return _space_finish(numpy.concatenate(integrals) if integrals else numpy.array([]), **options)
+
+    # otherwise accumulate the items of the series a chunk at a time
+    accumulator = _space_accumulator(data, chunk=chunk, **options)
+    for item in fields:
+        accumulator.push(item.data if isinstance(item, Output) else item)
+    return accumulator.result()
+
+
+def _volume_weights(data: 'SimulationData', *, face: str = 'center', 
+                    index: Optional['Type_Index'] = None, withguard: bool = False) -> 'Type_Field':
+    """Provides the volume elements of the grid for integration (internal); see integral.space_full"""
+
+    # need to define grid face to compute volume elements 
+    i_grd = {"left" : 0, "center" : 1, "right" : 2}[face]
+
+    # retrieve the cached cell volumes
+    volume = data.geometry._cell_volume if withguard else data.geometry.cell_volume
+    return volume[(i_grd, ) + tuple(index)]
+
+
 def space_single(data: 'SimulationData', field: 'Type_Field', *,
                  face: str = 'center', 
                  axis: Union[str, int] = 1, layout: Tuple[str] = ('b', 'z', 'y', 'x'),
-                 differential: bool = True, 
+                 differential: bool = True, average: bool = False,
                  wrapped: bool = False, mapping: Dict[str, str] = {},
-                 scale: Optional[float] = None, index: Optional['Type_Index'] = None,
-                 keepdims: bool = False) -> 'Type_Output':
+                 scale: Optional[float] = None, keepdims: bool = True) -> 'Type_Output':
     """
-    Provides a method for calculation of the volumetric integral of a field by 
-    consuming a SimulationData object; ...
+    Provides a method for calculation of the integral (or average) of a field along a single axis by 
+    consuming a SimulationData object; reduced across all blocks into globally ordered profiles.
 
     Attributes:
         data: object containing relavent flash simulation output
-        field: numpy array for which to perform integration; [blocks, ...]
+        field: numpy array for which to perform integration; [..., blocks, k, j, i]
         face: which grid face to perform integration over [left, center, right] (optional)
         axis: which axis to integrate; can supply label and assiciated layout (optional)
         layout: indexable object containing the labeled dimentions of field (optional)
+        differential: whether to use the line elements of integration (optional)
+        average: whether to provide the average along the axis, rather than the integral (optional)
+        wrapped: whether to wrap context around result of integration (optional)
+        mapping: if wrapped, how to map context to options of the next operation (optional)
+        scale: used to convert returned quantity to dimensional units (optional)
+        keepdims: input field has retained unused dimensions for broadcasting, else were dropped (optional)
+
+    Note:
+        The integral is computed according to the formula
+
+                sum( field{ijk} dx{ijk} ) over all i, for each jk
+
+        first within each block, and then across the blocks sharing a position in the remaining axes;
+        using the (cached) position of each block in the lattice of blocks (see _block_positions). 
+        The result has the remaining spatial axes of the layout, ordered globally (e.g., a vertical 
+        profile, [k, j], if integrating over x); where any leading axes of the field (e.g., a 'batch' 
+        of times) are retained. If averaging, the integral is divided by the length of each line.
+
+        The layout must label the trailing axes of field (in order) from ('b', 'z', 'y', 'x'); the
+        block axis must be retained. If keepdims is False for a 2d simulation, the z axis is removed
+        from the layout (e.g., [b, j, i] for the default layout), as for space_full. Only a lattice
+        of blocks is supported (e.g., a uniform or stretched regular grid, but not adaptively refined).
+
+        This function does not generate any dynamic context; this even if wrapping is desired and specified, the
+        mapping attribute is ignored.
+
+    Todo:
+
+    """
+
+    # strip context if was provided
+    if isinstance(field, Output):
+        field = field.data
+    field = numpy.asarray(field)
+
+    # define axis and identify index to perform integration; the unused z axis may have been dropped
+    layout = tuple(layout)
+    if not keepdims and data.geometry.grd_dim == 2:
+        layout = tuple(label for label in layout if label != 'z')
+    labels = [label for label in ('b', 'z', 'y', 'x') if label in layout]
+    if layout != tuple(labels) or 'b' not in layout:
+        raise ValueError(f'Unsupported layout {layout}; must be ordered from {("b", "z", "y", "x")} with blocks!')
+    label = layout[axis] if isinstance(axis, int) else axis
+    if label not in {'x', 'y', 'z'} or label not in layout:
+        raise ValueError(f'Chosen axis {axis} is not a spatial axis of the provided layout {layout}!')
+    position = layout.index(label) - len(layout)
+
+    # calculate line elements along the axis, retaining the dimensions of the layout
+    i_grd = {"left" : 0, "center" : 1, "right" : 2}[face]
+    shrink = tuple(slice(None) if name in layout else 0 for name in ('b', 'z', 'y', 'x'))
+    if differential:
+        deltaX = 1 / getattr(data.geometry, 'grd_mesh_dd' + label)[(i_grd, ) + shrink]
+    else:
+        deltaX = numpy.ones(data.geometry.cell_volume[(i_grd, ) + shrink].shape)
+
+    # reduce within each block
+    integral = numpy.sum(field * deltaX, axis=position)
+
+    # reduce across blocks sharing a position in the remaining axes
+    remaining = [name for name in layout if name not in {'b', label}]
+    integral = _reduce_blocks(data, integral, remaining)
+    if average:
+        integral = integral / _reduce_blocks(data, numpy.sum(deltaX, axis=position), remaining)
+
+    # apply a dimensional scale
+    if scale is not None:
+        integral = integral * scale
+
+    # wrap result of integration if desired (no context to provide)
+    wrap = {True: lambda integral: Output(integral), False: lambda integral: integral} 
+    return wrap[wrapped](integral)
+
+
+def _reduce_blocks(data: 'SimulationData', field: 'Type_Field', labels: List[str]) -> 'Type_Field':
+    """Method (internal) provided to sum block data sharing a position in the lattice of blocks, and reassemble;
+    [..., b, *labels] -> [..., *labels] (globally ordered)"""
+
+    # retrieve the position of each block along the labeled axes
+    positions = _block_positions(data.geometry)
+    positions = [positions[:, 'xyz'.index(label)] for label in labels]
+    counts = tuple(int(position.max()) + 1 for position in positions)
+
+    # sum blocks into the lattice of blocks; [*counts, ..., *cells]
+    cells = field.shape[len(field.shape) - len(labels):]
+    blocks = numpy.moveaxis(field, -(len(labels) + 1), 0)
+    lattice = numpy.zeros(counts + blocks.shape[1:], dtype=blocks.dtype)
+    numpy.add.at(lattice, tuple(positions), blocks)
+
+    # interleave the lattice and cell axes; [..., count, cell, count, cell, ...]
+    leading = len(blocks.shape) - 1 - len(labels)
+    order = list(range(len(labels), len(labels) + leading))
+    for number in range(len(labels)):
+        order += [number, len(labels) + leading + number]
+    shape = lattice.shape[len(labels):len(labels) + leading] + tuple(c * n for c, n in zip(counts, cells))
+    return lattice.transpose(order).reshape(shape)
+
+
+def space_region(data: 'SimulationData', field: 'Type_Field', regions: 'Type_Field', *,
+                 face: str = 'center',
+                 differential: bool = True, average: bool = False,
+                 wrapped: bool = False, mapping: Dict[str, str] = {},
+                 scale: Optional[float] = None, keepdims: bool = True) -> 'Type_Output':
+    """
+    Provides a method for calculation of the volumetric integral (or average) of a field over one or more
+    bounded regions by consuming a SimulationData object; only the intersecting blocks are considered.
+
+    Attributes:
+        data: object containing relavent flash simulation output
+        field: numpy array for which to perform integration; [..., b, k, j, i]
+        regions: bounding box(es) of the region(s), as blk_bndbox; [(regions), (x, y, z), (low, high)]
+        face: which grid face to perform integration over [left, center, right] (optional)
         differential: whether to use the volume elements of integration (optional)
+        average: whether to divide by the (weighted) volume of each region (optional)
         wrapped: whether to wrap context around result of integration (optional)
         mapping: if wrapped, how to map context to options of the next operation (optional)
         scale: used to convert returned quantity to dimensional units (optional)
-        index: used for custom slicing operation; should be (blks, k, j, i) (optional)
         keepdims: input field has retained unused dimensions for broadcasting, else were dropped (optional)
 
     Note:
+        The integral over each region is computed according to the formula
+
+                sum( field{ijk} w{ijk} dV{ijk} ) over all ijk of intersecting blocks
+
+        where w{ijk} is the fraction of each cell within the region (i.e., partial cells on the boundary
+        of the region are weighted by their overlap); such that the cost scales with the region volume.
+
+        All regions are evaluated in one batched pass over their (region, block) pairs; the weights of every
+        pair are held at once, so memory scales with the summed volume of the intersecting blocks of all
+        regions (blocks shared by overlapping regions are counted once per region), while the field is
+        reduced a cache sized chunk of pairs at a time.
+
+        The intersecting blocks are found using the (cached) index of block bounds and cell edges; the field
+        must not include guard cells, and for 2d simulations the z bounds of regions may be omitted.
+
+        If multiple regions are provided (i.e., [regions, 3, 2]), the result has a trailing region axis; and
+        if the field has leading axes (e.g., a 'batch' of times; [t, b, ...]), these are retained.
+
+        This function does not generate any dynamic context; this even if wrapping is desired and specified, the
+        mapping attribute is ignored.
 
     Todo:
-        need to perform a reduction operation and a renumbering of the blocks
 
     """
 
-    # define axis and identify index to perform integration 
-    mapping = {ax: layout.index(ax) for ax in layout}
-    index = mapping.get(axis, axis)
-    if index >= len(mapping) or not isinstance(index, int):
-        Exception(f'Chosen axis is outside of provided or default layout!')
-    if layout[index] not in {'x', 'y', 'z'} and differential:
-        Exception(f'Chosen axis is not available in geometry data!')
+    # need the dimensionality
+    dimension = data.geometry.grd_dim
 
-    # calculate volume elements of appropriate dimension (to broadcast)
+    # strip context if was provided
+    if isinstance(field, Output):
+        field = field.data
+    field = numpy.asarray(field)
+    if not keepdims and dimension == 2:
+        field = field[..., None, :, :]
+
+    # need consistent bounding boxes of regions; [regions, (x, y, z), (low, high)]
+    regions = numpy.asarray(regions, dtype=float)
+    single = regions.ndim == 2
+    regions = regions.reshape((-1, ) + regions.shape[-2:])
+    if regions.shape[1:] == (2, 2) and dimension == 2:
+        unbounded = numpy.tile([[[-numpy.inf, numpy.inf]]], (len(regions), 1, 1))
+        regions = numpy.concatenate([regions, unbounded], axis=1)
+    if regions.shape[1:] != (3, 2) or numpy.any(regions[:, :, 0] > regions[:, :, 1]):
+        raise ValueError(f'Unsupported regions of shape {regions.shape}; '
+                         f'must specify [(regions), 3, 2] as (low, high)!')
+
+    # need to define grid face to compute volume elements
+    i_grd = {"left" : 0, "center" : 1, "right" : 2}[face]
+
+    # the intersecting blocks of every region, as (region, block) pairs ordered by region
+    found = _blocks_from_boxes(data.geometry, regions)
+    owners = numpy.repeat(numpy.arange(len(regions)), [len(blocks) for blocks in found])
+    blocks = numpy.concatenate(found).astype(int)
+
+    # fraction of each cell of every pair within its region along each axis; [pairs, k, j, i]
+    edges = _block_index(data.geometry)['edges']
+    weights = numpy.ones((len(blocks), ) + field.shape[-3:])
+    for axis in range(dimension):
+        edge = edges[axis][blocks]
+        low, high = regions[owners, axis, 0, None], regions[owners, axis, 1, None]
+        within = numpy.minimum(edge[:, 1:], high) - numpy.maximum(edge[:, :-1], low)
+        fraction = numpy.clip(within, 0.0, None) / (edge[:, 1:] - edge[:, :-1])
+        shape = tuple(fraction.shape[1] if a == axis else 1 for a in (2, 1, 0))
+        weights *= fraction.reshape((len(blocks), ) + shape)
+
+    # use volume elements of intersecting blocks if desired
     if differential:
-        i_face = {'left': 0, 'center': 1, 'right' : 2}[face],
-        shrink = tuple(0 if ax != layout[index] else slice(None) for ax in layout) 
-        ddnf = 1 / getattr(data.geometry, "grd_mesh_dd" + layout[index])[i_face + shrink]
-        deltaV = ddnf[tuple(numpy.newaxis if ax != layout[index] else slice(None) for ax in layout)]
+        weights *= data.geometry.cell_volume[i_grd][blocks]
+
+    # integrate every pair, a chunk of pairs at a time; then sum the pairs of each region (trailing axis)
+    leading = field.shape[:-4]
+    pairs = numpy.empty((len(blocks), ) + leading, dtype=numpy.result_type(field, weights))
+    chunk = max(1, _CHUNK_BYTES // max(1, weights[:1].nbytes * int(numpy.prod(leading))))
+    for start in range(0, len(blocks), chunk):
+        taken = numpy.take(field, blocks[start:start + chunk], axis=-4)
+        pairs[start:start + chunk] = numpy.einsum('...bkji,bkji->b...', taken, weights[start:start + chunk])
+    integral = numpy.zeros((len(regions), ) + leading, dtype=pairs.dtype)
+    numpy.add.at(integral, owners, pairs)
+    integral = numpy.moveaxis(integral, 0, -1)
+    volumes = numpy.bincount(owners, weights=weights.sum(axis=(1, 2, 3)), minlength=len(regions))
+    if average:
+        with numpy.errstate(invalid='ignore', divide='ignore'):
+            integral = integral / volumes
+    if single:
+        integral = integral[..., 0][()]
+
+    # apply a dimensional scale
+    if scale is not None:
+        integral = integral * scale
 
-    # use constant weights
-    else:
-        deltaV = 1.0
+    # wrap result of integration if desired (no context to provide)
+    wrap = {True: lambda integral: Output(integral), False: lambda integral: integral} 
+    return wrap[wrapped](integral)
+
+
+class _TimeAccumulator(Accumulator):
+    """Accumulator (internal) of the temporal integral; see integral.time"""
+
+    def __init__(self, taus: Optional[List[float]], method: str, cumulative: bool, 
+                 wrapped: bool, exact: bool) -> None:
+        self.taus, self.method, self.cumulative = taus, method, cumulative
+        self.wrapped, self.exact = wrapped, exact
+        self.count, self.items, self.dts = 0, deque(maxlen=3), deque(maxlen=2)
+        self.integral, self.running = None, []
+
+    def push(self, item: 'Type_Field') -> None:
+        item = numpy.asarray(item)
+        self.items.append(item)
+
+        # calculate temporal element and integrate from the previous items
+        if self.count > 0:
+            if self.taus is None:
+                dt = 1.0
+            elif self.count < len(self.taus):
+                dt = self.taus[self.count] - self.taus[self.count - 1]
+            else:
+                raise ValueError(f'Unable to correctly determine differential elements for integral')
+            self.dts.append(dt)
+
+            if self.method != 'simpson':
+                previous = self.items[-2]
+                if self.method == 'center':
+                    self._add(0.5 * (item + previous) * dt)
+                else:
+                    self._add((item if self.method == 'right' else previous) * dt)
+
+            # simpson; by interval (quadratic through the neighboring items) if cumulative, else by pairs of intervals
+            elif self.count >= 2:
+                if self.cumulative:
+                    if self.count == 2:
+                        self._add(_simpson_interval(*reversed(self.items), *reversed(self.dts)))
+                    self._add(_simpson_interval(*self.items, *self.dts))
+                elif self.count % 2 == 0:
+                    self._add(_simpson_pair(*self.items, *self.dts))
+
+        elif self.cumulative:
+            self.running.append(numpy.zeros_like(item, dtype=float))
+
+        self.count += 1
+
+    def _add(self, term: 'Type_Field') -> None:
+        """Method (internal) provided to add the integral over the next interval(s)"""
+        if self.integral is None:
+            self.integral = term
+        elif self.cumulative:
+            self.integral = self.integral + term
+        else:
+            self.integral += term
+        if self.cumulative:
+            self.running.append(self.integral)
 
-    # perform integration and provide result
-    return numpy.sum(field * deltaV, index)
+    def result(self) -> 'Type_Output':
 
+        # catch issue with missaligned times and integrand
+        if self.exact and self.count != len(self.taus):
+            raise ValueError(f'Unable to correctly determine differential elements for integral')
 
+        # simpson requires three items; otherwise complete with a trapezoid (or the quadratic of the last interval)
+        if self.method == 'simpson' and self.count == 2:
+            self._add(0.5 * (self.items[0] + self.items[1]) * self.dts[0])
+        elif self.method == 'simpson' and not self.cumulative and self.count > 2 and self.count % 2 == 0:
+            self._add(_simpson_interval(*self.items, *self.dts))
+
+        # integral over a single item is zero
+        if self.cumulative:
+            integral = numpy.stack(self.running) if self.running else numpy.array([])
+        else:
+            integral = numpy.zeros_like(self.items[-1]) if self.integral is None else self.integral
+
+        # wrap result of integration if desired (no context to provide)
+        wrap = {True: lambda integral: Output(integral), False: lambda integral: integral} 
+        return wrap[self.wrapped](integral)
+
+
+def _simpson_pair(first: 'Type_Field', middle: 'Type_Field', last: 'Type_Field', 
+                  h0: float, h1: float) -> 'Type_Field':
+    """Method (internal) provided to integrate over a pair of (non-uniform) intervals using simpson's rule"""
+    return (h0 + h1) / 6.0 * ((2.0 - h1 / h0) * first + (h0 + h1)**2 / (h0 * h1) * middle + (2.0 - h0 / h1) * last)
+
+
+def _simpson_interval(first: 'Type_Field', middle: 'Type_Field', last: 'Type_Field', 
+                      h0: float, h1: float) -> 'Type_Field':
+    """Method (internal) provided to integrate over the last of a pair of (non-uniform) intervals, [middle, last], 
+    using the quadratic through the three items; reversing the arguments integrates over the first interval"""
+    return ((2.0 * h1**2 + 3.0 * h0 * h1) / (6.0 * (h0 + h1)) * last + (h1**2 + 3.0 * h0 * h1) / (6.0 * h0) * middle -
+            h1**3 / (6.0 * h0 * (h0 + h1)) * first)
+
+
+def _time_accumulator(data: 'SimulationData', *,
+                      method : str = 'center', cumulative: bool = False,
+                      differential : bool = True,
+                      wrapped: bool = False, mapping: Dict[str, str] = {},
+                      scale : Optional[float] = None, steps: Optional['Type_Index'] = None, 
+                      starting: Union[int, float] = 0, times: Optional['Type_Index'] = None,
+                      force_steps: bool = False) -> Optional[_TimeAccumulator]:
+    """Provides an accumulator (internal) of the temporal integral, if supported by the options; see integral.time"""
+
+    # slicing into the provided fields or unknown methods need the whole series
+    if steps is not None or method not in {'center', 'left', 'right', 'simpson'} or not isinstance(starting, int):
+        return None
+
+    # need to create list base on specifics of attributes provided
+    if not differential:
+        return _TimeAccumulator(None, method, cumulative, wrapped, False)
+    elif times is not None:
+        return _TimeAccumulator(data.utility.times(times), method, cumulative, wrapped, True)
+    else:
+        return _TimeAccumulator(data.utility.times(slice(None))[starting:], method, cumulative, wrapped, False)
+
+
+@accumulates(_time_accumulator)
 def time(data: 'SimulationData', fields: 'Type_Output', *,
-         method : str = 'center', 
+         method : str = 'center', cumulative: bool = False,
          differential : bool = True,
          wrapped: bool = False, mapping: Dict[str, str] = {},
          scale : Optional[float] = None, steps: Optional['Type_Index'] = None, 
@@ -181,7 +592,8 @@ def time(data: 'SimulationData', fields: 'Type_Output', *,
     Attributes:
         data: object containing relavent flash simulation output
         fields: (list of) numpy arrays or floats/ints over which to perform integration
-        method: choice of method of integration [left, center, right] (optional)
+        method: choice of method of integration [left, center, right, simpson] (optional)
+        cumulative: whether to provide the running integral at each time, [t, ...] (optional)
         differential: whether to use the temporal elements of integration (optional) 
         wrapped: whether to wrap context around result of integration (optional)
         mapping: if wrapped, how to map context to options of the next operation (optional)
@@ -203,17 +615,24 @@ def time(data: 'SimulationData', fields: 'Type_Output', *,
         If steps is provided (either as a slice or an Iterable), elements must be integers; specification using 
         floats is not yet supported and will result in runtime error.
 
+        The simpson method supports non-uniform temporal elements; pairs of intervals are integrated by simpson's
+        rule, and a remaining (odd) interval by the quadratic through the last three items. If cumulative, each 
+        interval is integrated by the quadratic through the neighboring items; such that the running integral
+        is available at every time (the last of which may differ slightly from the non-cumulative result).
+
+        This function supports the accumulator protocol (i.e., series.simple(..., stream=True)) provided
+        steps is not specified; a streamed integral retains only the last three items and the running sum.
+
         This function does not generate any dynamic context; this even if wrapping is desired and specified, the
         mapping attribute is ignored.
 
     Todo:
-        Need to implement simpsons rule 
         Need to implement gaussian quadrature
         
     """
 
     # specify supported methods
-    methods = {'center', 'left', 'right'}
+    methods = {'center', 'left', 'right', 'simpson'}
 
     # strip context if was provided
     if isinstance(fields, Output):
@@ -275,14 +694,21 @@ def time(data: 'SimulationData', fields: 'Type_Output', *,
         raise ValueError(f'Unable to correctly determine differential elements for integral')
 
     # perform integration based on method
-    if method in methods:
+    if method in methods and (cumulative or method == 'simpson'):
+        widths = numpy.ravel(dt) if hasattr(dt, '__len__') else numpy.full(len(integrand) - 1, dt)
+        accumulator = _TimeAccumulator([0.0] + list(numpy.cumsum(widths)), method, cumulative, False, True)
+        for item in integrand:
+            accumulator.push(item)
+        integral = accumulator.result()
+
+    elif method in methods:
 
         if method == 'center':
             integral = numpy.sum(0.5 * (integrand[1:] + integrand[:-1]) * dt, 0)
 
         else:
             index = slice(1, None) if method == 'right' else slice(0, -1)
-            integral = numpy.sum(integrands[index] * dt, 0)
+            integral = numpy.sum(integrand[index] * dt, 0)
 
     # method is not implemented
     else:
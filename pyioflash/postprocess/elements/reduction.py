@@ -0,0 +1,129 @@
+"""
+
+This module defines the reduction methods of the post-processing
+subpackage of the pyioflash library; part of the Stackable set of routines.
+
+This module currently defines the following methods:
+
+    total   -> perform a sum over the series
+    mean    -> perform an (arithmetic) average over the series
+
+Todo:
+
+"""
+
+
+from typing import List, Dict, Optional, TYPE_CHECKING
+
+
+import numpy
+
+
+from pyioflash.postprocess.utility import Output, Accumulator, accumulates
+
+
+if TYPE_CHECKING:
+    from pyioflash.postprocess.utility import Type_Field, Type_Output
+
+
+# define the module api
+def __dir__() -> List[str]:
+    return ["total", "mean"]
+
+
+class _SumAccumulator(Accumulator):
+    """Accumulator (internal) of the sum or average over a series; see reduction.total and reduction.mean"""
+
+    def __init__(self, average: bool, wrapped: bool, scale: Optional[float]) -> None:
+        self.average, self.wrapped, self.scale = average, wrapped, scale
+        self.count, self.total = 0, None
+
+    def push(self, item: 'Type_Field') -> None:
+        if self.total is None:
+            self.total = numpy.array(item, dtype=numpy.result_type(item, float))
+        else:
+            self.total += item
+        self.count += 1
+
+    def result(self) -> 'Type_Output':
+        return _finish(self.total / self.count if self.average else self.total, self.wrapped, self.scale)
+
+
+def _finish(result: 'Type_Field', wrapped: bool, scale: Optional[float]) -> 'Type_Output':
+    """Method (internal) provided to apply a dimensional scale and wrap the result of a reduction"""
+
+    # apply a dimensional scale
+    if scale is not None:
+        result = result * scale
+
+    # wrap result of reduction if desired (no context to provide)
+    wrap = {True: lambda result: Output(result), False: lambda result: result}
+    return wrap[wrapped](result)
+
+
+@accumulates(lambda *, wrapped=False, mapping={}, scale=None: _SumAccumulator(False, wrapped, scale))
+def total(fields: 'Type_Output', *,
+          wrapped: bool = False, mapping: Dict[str, str] = {},
+          scale: Optional[float] = None) -> 'Type_Output':
+    """
+    Provides a method for calculation of the sum of a series of fields or scalars.
+
+    Attributes:
+        fields: (list of) numpy arrays or floats/ints over which to perform the sum
+        wrapped: whether to wrap context around result of reduction (optional)
+        mapping: if wrapped, how to map context to options of the next operation (optional)
+        scale: used to convert returned quantity to dimensional units (optional)
+
+    Note:
+        The sum is computed according to the formula
+
+                sum( field{t} ) over all t
+
+        This function supports the accumulator protocol (i.e., series.simple(..., stream=True)).
+
+        This function does not generate any dynamic context; this even if wrapping is desired and specified, the
+        mapping attribute is ignored.
+
+    Todo:
+
+    """
+
+    # strip context if was provided
+    if isinstance(fields, Output):
+        fields = fields.data
+
+    return _finish(numpy.sum(numpy.array(fields), 0), wrapped, scale)
+
+
+@accumulates(lambda *, wrapped=False, mapping={}, scale=None: _SumAccumulator(True, wrapped, scale))
+def mean(fields: 'Type_Output', *,
+         wrapped: bool = False, mapping: Dict[str, str] = {},
+         scale: Optional[float] = None) -> 'Type_Output':
+    """
+    Provides a method for calculation of the (arithmetic) average of a series of fields or scalars.
+
+    Attributes:
+        fields: (list of) numpy arrays or floats/ints over which to perform the average
+        wrapped: whether to wrap context around result of reduction (optional)
+        mapping: if wrapped, how to map context to options of the next operation (optional)
+        scale: used to convert returned quantity to dimensional units (optional)
+
+    Note:
+        The average is computed according to the formula
+
+                sum( field{t} ) / N over all t
+
+        This function supports the accumulator protocol (i.e., series.simple(..., stream=True)).
+
+        This function does not generate any dynamic context; this even if wrapping is desired and specified, the
+        mapping attribute is ignored.
+
+    Todo:
+
+    """
+
+    # strip context if was provided
+    if isinstance(fields, Output):
+        fields = fields.data
+
+    return _finish(numpy.mean(numpy.array(fields), 0), wrapped, scale)
@@ -11,6 +11,9 @@ from pyioflash.postprocess.sources import energy
 # Used to produce useful fields SimulationData
 from pyioflash.postprocess.sources import fields
 
+# Used to produce statistical moments of fields from SimulationData
+from pyioflash.postprocess.sources import moments
+
 # Used to produce force fields from SimulationData
 #from pyioflash.postprocess.sources import force
 
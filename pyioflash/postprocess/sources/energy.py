@@ -7,8 +7,10 @@ This module currently defines the following methods:
 
     thermal --  --  --  -> thermal energy
     kinetic --  --  --  -> total instantanious kinetic energy
+    kinetic_integral    -> volume integral of the total instantanious kinetic energy
     kinetic_mean    --  -> mean (time averaged) kinetic energy
     kinetic_turbulant   -> turbulant instantanious kinetic energy
+    kinetic_turbulant_series -> turbulant kinetic energy (or its integral) over a series
 
 Todo:
 
@@ -18,10 +20,15 @@ Todo:
 from typing import List, Dict, Optional, Union, TYPE_CHECKING 
 
 
-from pyioflash.postprocess.utility import _interpolate_ftc, make_sourceable, make_stackable, Output
+import numpy
+
+
+from pyioflash.postprocess.utility import (_field_from_step, _kinetic_ftc, 
+                                          make_sourceable, make_stackable, Output)
 from pyioflash.postprocess.sources import fields
 from pyioflash.postprocess.elements import integral
 from pyioflash.postprocess.analyses import series
+from pyioflash.postprocess.cache import memoize
 
 
 if TYPE_CHECKING:
@@ -31,7 +38,8 @@ if TYPE_CHECKING:
 
 # define the module api
 def __dir__() -> List[str]:
-    return ["thermal", "kinetic", "kinetic_mean", "kinetic_turbulant"]
+    return ["thermal", "kinetic", "kinetic_integral", "kinetic_mean", "kinetic_turbulant", 
+            "kinetic_turbulant_series"]
 
 
 def thermal(data: 'SimulationData', step: 'Type_Step' = -1, *,
@@ -96,15 +104,12 @@ def thermal(data: 'SimulationData', step: 'Type_Step' = -1, *,
     if withguard:
         name = '_' + name
 
-    # thermal energy is temp in nondimensional units
-    energy = data.fields[name][step][0]
+    # thermal energy is temp in nondimensional units; index results if desired, and copy the resident field data
+    energy = _field_from_step(data, name, step)[index].copy()
 
     # apply a dimensional scale
     if scale is not None:
-        energy = energy * scale
-
-    # index results if desired
-    energy = energy[index]
+        numpy.multiply(energy, scale, out=energy)
 
     # wrap result of integration if desired (no context to provide)
     wrap = {True: lambda source: Output(source), False: lambda source: source} 
@@ -168,16 +173,13 @@ def kinetic(data: 'SimulationData', step: 'Type_Step' = -1, *,
         i_zax = 0 if not withguard else int(guards / 2) 
         index = (i_all, ) * 4 if (keepdims or dimension == 3) else (i_all, i_zax, i_all, i_all)
 
-    # calculate kinetic energy
-    energy = _interpolate_ftc(data.fields['_fcx2'][step][0], 0, guards, dimension, withguard=withguard)**2
-    energy = _interpolate_ftc(data.fields['_fcy2'][step][0], 1, guards, dimension, withguard=withguard)**2 + energy
-    if dimension == 3:
-        energy = _interpolate_ftc(data.fields['_fcz2'][step][0], 2, guards, dimension, 
-                                  withguard=withguard)**2 + energy
+    # calculate kinetic energy; fused interpolation and accumulation of each component
+    components = [_field_from_step(data, name, step) for name in ['_fcx2', '_fcy2', '_fcz2'][:dimension]]
+    energy = _kinetic_ftc(components, guards, dimension, withguard=withguard)
     
     # apply a dimensional scale
     if scale is not None:
-        energy = energy * scale
+        numpy.multiply(energy, scale, out=energy)
 
     # index results if desired
     energy = energy[index]
@@ -187,6 +189,70 @@ def kinetic(data: 'SimulationData', step: 'Type_Step' = -1, *,
     return wrap[wrapped](energy)
 
 
+def kinetic_integral(data: 'SimulationData', step: 'Type_Step' = -1, *,
+                     wrapped: bool = False, mapping: Dict[str, str] = {},
+                     scale : Optional[float] = None) -> 'Type_Output':
+    """
+    Provides a method for calculation of the volume integral of the total kinetic energy by 
+    consuming a SimulationData object; must have 'fcx2', 'fcy2' ('fcz2' if 3d) 
+    attributes in the SimulationData.fields object.
+
+    Attributes:
+        data: object containing relavent flash simulation output
+        step: time-like specification for which to process data, the key (optional) 
+        wrapped: whether to wrap context around result of sourcing (optional)
+        mapping: if wrapped, how to map context to options of the next operation (optional)
+        scale: used to convert returned quantity to dimensional units (optional)
+
+    Note:
+        The integral of the total kinetic energy is computed according to the formula
+
+                E(t) = sum( (u(t)~ijk~^2^ + v(t)~ijk~^2^ + w(t)~ijk~^2^) dV~ijk~ ) over all ijk
+                
+                *where        t = step,         step is float*
+                           *  t = times[step],  step is int*
+
+                where the all terms are interpolated to cell centers
+
+        The result is equivalent to integral.space_full(data, kinetic(data, step)); however, the energy
+        is reduced a chunk of blocks at a time and the field is never materialized.
+
+        This function does not generate any dynamic context; this even if wrapping is desired and specified, the
+        mapping attribute is ignored.
+
+    Todo:
+
+    """
+
+    # convert to integer from key if necessary
+    if isinstance(step, float):
+        try:
+            step, = data.utility.indices(step)
+        except ValueError as error:
+            print(error)
+            print('Could not find provided step in simulation keys!')
+
+    # need the dimensionality
+    dimension = data.geometry.grd_dim
+
+    # get guard size
+    guards = data.geometry.blk_guards
+
+    # calculate the integral of kinetic energy; fused interpolation, accumulation, and reduction
+    components = [_field_from_step(data, name, step) for name in ['_fcx2', '_fcy2', '_fcz2'][:dimension]]
+    weights = integral._volume_weights(data, index=(slice(None), ) * 4)
+    energy = _kinetic_ftc(components, guards, dimension, weights=weights)
+
+    # apply a dimensional scale
+    if scale is not None:
+        energy = energy * scale
+
+    # wrap result of integration if desired (no context to provide)
+    wrap = {True: lambda source: Output(source), False: lambda source: source} 
+    return wrap[wrapped](energy)
+
+
+@memoize(times=('steps', ), persist=True)
 def kinetic_mean(data: 'SimulationData', steps: Optional['Type_Index'] = slice(None), *,
                  start: Optional['Type_Step'] = None, stop: Optional['Type_Step'] = None, skip: Optional[int] = None,
                  wrapped: bool = False, mapping: Dict[str, str] = {},
@@ -217,6 +283,8 @@ def kinetic_mean(data: 'SimulationData', steps: Optional['Type_Index'] = slice(N
                 
                 *where the all terms are interpolated to cell centers*
 
+        The result is memoized, and persisted to disk if configured; see pyioflash.postprocess.cache.
+
         This function does not generate any dynamic context; this even if wrapping is desired and specified, the
         mapping attribute is ignored.
 
@@ -245,7 +313,7 @@ def kinetic_mean(data: 'SimulationData', steps: Optional['Type_Index'] = slice(N
     # use time series analysis to retreve mean kinetic energy
     source = make_sourceable(source=kinetic, args=data, method='step', options={'withguard': withguard})
     stack = make_stackable(element=integral.time, args=data, method='whole', options={'times': times})
-    energy = series.simple(source=source, sourceby=steps, stack=stack) 
+    energy = series.simple(source=source, sourceby=steps, stack=stack, stream=True) 
 
     # apply a dimensional scale
     if scale is not None:
@@ -324,7 +392,7 @@ def kinetic_turbulant(data: 'SimulationData', step: Optional['Type_Step'] = -1,
 
     # retieve mean velocity components if not provided
     if mean is None:
-        components = fields.velocity_mean(data, start=start, stop=stop, skip=skip, withguard=withguard)
+        components = fields.velocity_mean.shared(data, start=start, stop=stop, skip=skip, withguard=withguard)
         u_bar, v_bar = components[:2]
         if dimension == 3:
             w_bar = components[2]
@@ -340,20 +408,29 @@ def kinetic_turbulant(data: 'SimulationData', step: Optional['Type_Step'] = -1,
         if dimension == 3:
             w_bar = mean[2]   
 
-    # calculate instantanious velocity components on cell-centers
-    u_ins = _interpolate_ftc(data.fields['_fcx2'][step][0], 0, guards, dimension, withguard=withguard)
-    v_ins = _interpolate_ftc(data.fields['_fcy2'][step][0], 1, guards, dimension, withguard=withguard)
+    # retrieve instantanious velocity components on cell-centers
+    components = fields.velocity(data, step, withguard=withguard)
+    u_ins, v_ins = components[:2]
     if dimension == 3:
-        w_ins = _interpolate_ftc(data.fields['_fcz2'][step][0], 2, guards, dimension, withguard=withguard)
+        w_ins = components[2]
     
-    # calculate turbulant kinetic energy
-    energy = ((u_ins - u_bar)**2 + (v_ins - v_bar)**2) / 2
+    # calculate turbulant kinetic energy; accumulating each component in place using a single temporary
+    energy = numpy.subtract(u_ins, u_bar)
+    numpy.square(energy, out=energy)
+    component = numpy.empty_like(energy)
+    numpy.subtract(v_ins, v_bar, out=component)
+    numpy.square(component, out=component)
+    numpy.add(energy, component, out=energy)
+    numpy.divide(energy, 2, out=energy)
     if dimension == 3:
-        energy = energy + ((w_ins - w_bar)**2 / 2)
+        numpy.subtract(w_ins, w_bar, out=component)
+        numpy.square(component, out=component)
+        numpy.divide(component, 2, out=component)
+        numpy.add(energy, component, out=energy)
 
     # apply a dimensional scale
     if scale is not None:
-        energy = energy * scale
+        numpy.multiply(energy, scale, out=energy)
 
     # index results if desired
     energy = energy[index]
@@ -361,3 +438,79 @@ def kinetic_turbulant(data: 'SimulationData', step: Optional['Type_Step'] = -1,
     # wrap result of integration if desired (no context to provide)
     wrap = {True: lambda source: Output(source), False: lambda source: source} 
     return wrap[wrapped](energy)
+
+
+def kinetic_turbulant_series(data: 'SimulationData', steps: Optional['Type_Index'] = slice(None), *,
+                             mean: Optional['Type_Field'] = None, start: Optional['Type_Step'] = None, 
+                             stop: Optional['Type_Step'] = None, skip: Optional[int] = None,
+                             integrate: bool = False, 
+                             wrapped: bool = False, mapping: Dict[str, str] = {},
+                             scale : Optional[float] = None, index: Optional['Type_Index'] = None, 
+                             withguard: bool = False, keepdims: bool = True) -> 'Type_Output':
+    """
+    Provides a method for calculation of the series of turbulant kinetic energy by 
+    consuming a SimulationData object and a time interval specification; the mean
+    field is determined over the same interval if not provided; must have 'fcx2', 
+    'fcy2' ('fcz2' if 3d) attributes in the SimulationData.fields object.
+
+    Attributes:
+        data: object containing relavent flash simulation output
+        steps: iterable time-like specification for which to process data, the keys (optional) 
+        mean: provide mean velocity components to avoid calculating them (optional)
+        start: used to determine the starting time-like specification, start key (optional)
+        stop: used to determine the ending time-like specification, stop key (optional)
+        skip: used to determine the sampling interval for the specification (optional)
+        integrate: provide the volume integral of the energy for each step, rather than the field (optional)
+        wrapped: whether to wrap context around result of sourcing (optional)
+        mapping: if wrapped, how to map context to options of the next operation (optional)
+        scale: used to convert returned quantity to dimensional units (optional)
+        index: used for custom slicing operation; should be (blks, k, j, i) (optional)
+        withguard: retain guard cell data for ploting and other actions (optional)
+        keepdims: retain unused dimensions for broadcasting, else drop them (optional)
+
+    Note:
+        The turbulant kinetic energy is computed for each step according to the formula
+
+                E(t)~ijk~ = (u(t)~ijk~ - u_bar~ijk~)^2^ + ...
+
+                *where the all terms are interpolated to cell centers*
+
+        The series is computed in (at most) two streamed passes over the steps; the first to determine
+        the mean velocity (see fields.velocity_mean), and the second to determine the energy of each
+        step (see kinetic_turbulant) and, if desired, its volume integral (see integral.space_full).
+        Calling kinetic_turbulant for each step instead requires a pass for each step.
+
+        The returned series has a leading axis of steps; either [t, blks, k, j, i] or [t] if integrated.
+
+        This function does not generate any dynamic context; this even if wrapping is desired and specified, the
+        mapping attribute is ignored.
+
+    Todo:
+
+    """
+
+    # use provided information to source times
+    if start or stop:
+        steps = slice(start, stop, skip)
+    steps = data.utility.indices(steps)
+
+    # retieve mean velocity components over the interval if not provided; first pass
+    if mean is None:
+        mean = fields.velocity_mean.shared(data, steps, withguard=withguard)
+
+    # use time series analysis to retreve the turbulant kinetic energy (or its integral); second pass
+    options = {'mean': mean, 'index': index, 'withguard': withguard, 'keepdims': keepdims}
+    source = make_sourceable(source=kinetic_turbulant, args=data, method='step', options=options)
+    stack = None
+    if integrate:
+        stack = make_stackable(element=integral.space_full, args=data, method='part', 
+                               options={'index': index, 'withguard': withguard, 'keepdims': keepdims})
+    energy = series.simple(source=source, sourceby=steps, stack=stack, stream=True)
+
+    # apply a dimensional scale
+    if scale is not None:
+        energy = energy * scale
+
+    # wrap result of integration if desired (no context to provide)
+    wrap = {True: lambda source: Output(source), False: lambda source: source} 
+    return wrap[wrapped](energy)
@@ -5,6 +5,7 @@ subpackage of the pyioflash lbrary; part of the 'source' set of routines.
 
 This module currently defines the following methods:
 
+    velocity    --  --  -> instantanious velocity by component
     velocity_mean   --  -> mean velocity by component
 
 Todo:
@@ -16,7 +17,9 @@ from typing import List, Dict, Optional, Union, TYPE_CHECKING
 
 
 from pyioflash.simulation.series import DataPath
-from pyioflash.postprocess.utility import _interpolate_ftc, make_stackable, Output
+from pyioflash.postprocess.utility import (_field_from_step, _interpolate_ftc, 
+                                          make_stackable, Output)
+from pyioflash.postprocess.cache import memoize
 from pyioflash.postprocess.elements import integral
 from pyioflash.postprocess.analyses import series
 
@@ -28,8 +31,80 @@ if TYPE_CHECKING:
 
 # define the module api
 def __dir__() -> List[str]:
-    return ["velocity_mean"] 
+    return ["velocity", "velocity_mean"] 
 
+
+def velocity(data: 'SimulationData', step: 'Type_Step' = -1, *,
+             wrapped: bool = False, mapping: Dict[str, str] = {},
+             scale : Optional[float] = None, index: Optional['Type_Index'] = None, 
+             withguard: bool = False, keepdims: bool = True) -> 'Type_Output':
+    """
+    Provides a method for calculation of the instantanious velocity components on the 
+    cell centered grid by consuming a SimulationData object; must have 'fcx2', 
+    'fcy2' ('fcz2' if 3d) attributes in the SimulationData.fields object.
+
+    Attributes:
+        data: object containing relavent flash simulation output
+        step: time-like specification for which to process data, the key (optional) 
+        wrapped: whether to wrap context around result of sourcing (optional)
+        mapping: if wrapped, how to map context to options of the next operation (optional)
+        scale: used to convert returned quantity to dimensional units (optional)
+        index: used for custom slicing operation; should be (blks, k, j, i) (optional)
+        withguard: retain guard cell data for ploting and other actions (optional)
+        keepdims: retain unused dimensions for broadcasting, else drop them (optional)
+
+    Note:
+        Each velocity component is interpolated from the face centered grid to cell centers.
+
+        The result is not memoized, as it is typically consumed once per step (e.g., streamed by
+        series.simple); such that retaining it would grow with the number of steps.
+
+        This function does not generate any dynamic context; this even if wrapping is desired and specified, the
+        mapping attribute is ignored.
+
+    Todo:
+
+    """
+
+    # convert to integer from key if necessary
+    if isinstance(step, float):
+        try:
+            step, = data.utility.indices(step)
+        except ValueError as error:
+            print(error)
+            print('Could not find provided step in simulation keys!')
+
+    # need the dimensionality
+    dimension = data.geometry.grd_dim
+
+    # get guard size
+    guards = data.geometry.blk_guards
+
+    # need to define slicing operators based on dims
+    if index is None:
+        i_all = slice(None)
+        i_zax = 0 if not withguard else int(guards / 2)
+        index = (i_all, ) * 4 if (keepdims or dimension == 3) else (i_all, i_zax, i_all, i_all)
+
+    # interpolate to cell-centers
+    names = ('_fcx2', '_fcy2', '_fcz2')[:dimension]
+    components = tuple(_interpolate_ftc(_field_from_step(data, name, step), axis, guards, dimension, 
+                                        withguard=withguard)
+                       for axis, name in enumerate(names))
+
+    # apply a dimensional scale
+    if scale is not None:
+        components = tuple(component * scale for component in components)
+
+    # index results if desired 
+    components = tuple(component[index] for component in components)
+
+    # wrap result of integration if desired (no context to provide)
+    wrap = {True: lambda source: Output(source), False: lambda source: source} 
+    return wrap[wrapped](components)
+
+
+@memoize(times=('steps', ), persist=True)
 def velocity_mean(data: 'SimulationData', steps: Optional['Type_Index'] = slice(None), *,
                   start: Optional['Type_Step'] = None, stop: Optional['Type_Step'] = None, skip: Optional[int] = None,
                   wrapped: bool = False, mapping: Dict[str, str] = {},
@@ -62,6 +137,8 @@ def velocity_mean(data: 'SimulationData', steps: Optional['Type_Index'] = slice(
 
                 *where the all terms are interpolated to cell centers*
 
+        The result is memoized, and persisted to disk if configured; see pyioflash.postprocess.cache.
+
         This function does not generate any dynamic context; this even if wrapping is desired and specified, the
         mapping attribute is ignored.
 
@@ -89,10 +166,10 @@ def velocity_mean(data: 'SimulationData', steps: Optional['Type_Index'] = slice(
 
     # use time series analysis to retreve mean velocity components
     stack = make_stackable(element=integral.time, args=data, method='whole', options={'times': times})
-    u_bar = series.simple(source='_fcx2', sourceby=steps, stack=stack, path=DataPath(data, 'fields')) 
-    v_bar = series.simple(source='_fcy2', sourceby=steps, stack=stack, path=DataPath(data, 'fields')) 
+    u_bar = series.simple(source='_fcx2', sourceby=steps, stack=stack, path=DataPath(data, 'fields'), stream=True)
+    v_bar = series.simple(source='_fcy2', sourceby=steps, stack=stack, path=DataPath(data, 'fields'), stream=True)
     if dimension == 3:
-        w_bar = series.simple(source='_fcz2', sourceby=steps, stack=stack, path=DataPath(data, 'fields')) 
+        w_bar = series.simple(source='_fcz2', sourceby=steps, stack=stack, path=DataPath(data, 'fields'), stream=True)
 
     # interpolate to cell-centers
     u_bar = _interpolate_ftc(u_bar, 0, guards, dimension, withguard=withguard)
@@ -111,7 +188,7 @@ def velocity_mean(data: 'SimulationData', steps: Optional['Type_Index'] = slice(
     u_bar = u_bar[index]
     v_bar = v_bar[index]
     if dimension == 3:
-        w_bar = w_ba[index]
+        w_bar = w_bar[index]
 
     # collect velocity components
     if dimension !=3:
@@ -122,3 +199,4 @@ def velocity_mean(data: 'SimulationData', steps: Optional['Type_Index'] = slice(
     # wrap result of integration if desired (no context to provide)
     wrap = {True: lambda source: Output(source), False: lambda source: source} 
     return wrap[wrapped](components)
+
@@ -0,0 +1,352 @@
+"""
+
+This module defines the statistical moment calculation methods of the post-processing
+subpackage of the pyioflash lbrary; part of the 'source' set of routines.
+
+This module currently defines the following methods:
+
+    velocity    --  --  -> mean and (co)variance of velocity components and scalars
+    statistics  --  --  -> mean and (co)variance of a series of stacked fields
+    time_weights    --  -> trapezoidal temporal weights of a series
+    merge   --  --  --  -> combine the statistics of separate portions of a series
+
+This module currently defines the following classes:
+
+    Moments     --  --  -> mergeable (streaming) accumulator of the weighted moments
+    Statistics  --  --  -> the result of a Moments accumulator
+
+Todo:
+
+"""
+
+
+from typing import List, Dict, Tuple, Iterable, Optional, TYPE_CHECKING
+from collections import namedtuple
+
+
+import numpy
+
+
+from pyioflash.postprocess.utility import (Accumulator, accumulates, make_sourceable, make_stackable, Output,
+                                          _field_from_step)
+from pyioflash.postprocess.sources import fields
+from pyioflash.postprocess.analyses import series
+
+
+if TYPE_CHECKING:
+    from pyioflash.simulation.data import SimulationData
+    from pyioflash.postprocess.utility import Type_Step, Type_Field, Type_Index, Type_Output
+
+
+# define the module api
+def __dir__() -> List[str]:
+    return ["velocity", "statistics", "time_weights", "merge", "Moments", "Statistics"]
+
+
+# the (weighted) moments of a series; mean and variance are [n, ...], covariance is [n, n, ...]
+Statistics = namedtuple('Statistics', ['names', 'mean', 'variance', 'covariance', 'weight'])
+
+
+class Moments(Accumulator):
+    """
+    Moments is a mergeable accumulator of the weighted mean and covariance of a series of
+    stacked fields (e.g., [u, v, w, T]); in a single pass and without retaining the series.
+
+    Attributes:
+        weights: weight of each item of the series in turn; unity if not provided (optional)
+        names: names of the stacked fields, provided with the result (optional)
+        wrapped: whether to wrap context around the result (optional)
+
+    Note:
+        The moments are updated for each item, x, with weight, w, according to the formulas (Welford/West)
+
+                W' = W + w,     mean' = mean + (x - mean) * w / W'
+                M' = M + w * (x - mean) (x - mean')
+
+        and the moments of separate portions of a series (e.g., by separate workers or chunks of time)
+        are combined according to the formulas (Chan et al.)
+
+                W = W~a~ + W~b~,    mean = mean~a~ + (mean~b~ - mean~a~) * W~b~ / W
+                M = M~a~ + M~b~ + (mean~b~ - mean~a~) (mean~b~ - mean~a~) * W~a~ * W~b~ / W
+
+        The (population) covariance is M / W; only the upper triangle of M is retained. Weights must not
+        be negative, and the total weight must be positive in order to provide a result.
+
+    Todo:
+
+    """
+    def __init__(self, weights: Optional[Iterable[float]] = None, names: Tuple[str] = (), 
+                 wrapped: bool = False) -> None:
+        self.weights = None if weights is None else list(weights)
+        self.names, self.wrapped = tuple(names), wrapped
+        self.count, self.weight, self._pairs, self._mean, self._moment = 0, 0.0, None, None, None
+
+    def push(self, item: 'Type_Field') -> None:
+        if self.weights is None:
+            weight = 1.0
+        elif self.count < len(self.weights):
+            weight = self.weights[self.count]
+        else:
+            raise ValueError(f'Unable to correctly determine weight of item {self.count} of the series')
+        self.update(item, weight)
+
+    def update(self, item: 'Type_Field', weight: float = 1.0) -> None:
+        """Incorporates the next item of the series, stacked as [n, ...], with the provided weight"""
+        if weight < 0.0:
+            raise ValueError(f'Unable to incorporate item {self.count} of the series with negative weight {weight}!')
+        item = numpy.asarray(item, dtype=float)
+        self.count += 1
+
+        # first item initializes the moments
+        if self._mean is None:
+            self._pairs = numpy.triu_indices(item.shape[0])
+            self._mean = item.copy()
+            self._moment = numpy.zeros((len(self._pairs[0]), ) + item.shape[1:])
+            self.weight = float(weight)
+            return
+
+        # weighted welford update of the mean and the upper triangle of the co-moment
+        self.weight += weight
+        if self.weight == 0.0:
+            return
+        delta = item - self._mean
+        self._mean += delta * (weight / self.weight)
+        upper, lower = self._pairs
+        self._moment += weight * delta[upper] * (item - self._mean)[lower]
+
+    def merge(self, other: 'Moments') -> 'Moments':
+        """Combines the moments of another (separate) portion of the series into these moments"""
+        if other._mean is None or other.weight == 0.0:
+            self.count += other.count
+            return self
+        if self._mean is None or self.weight == 0.0:
+            self._pairs, self._mean, self._moment = other._pairs, other._mean.copy(), other._moment.copy()
+            self.count, self.weight = self.count + other.count, other.weight
+            return self
+
+        # chan et al. pairwise combination of the moments
+        weight = self.weight + other.weight
+        delta = other._mean - self._mean
+        upper, lower = self._pairs
+        self._moment += other._moment + delta[upper] * delta[lower] * (self.weight * other.weight / weight)
+        self._mean += delta * (other.weight / weight)
+        self.count, self.weight = self.count + other.count, weight
+        return self
+
+    def result(self) -> 'Type_Output':
+        if self._mean is None:
+            raise ValueError('Unable to determine the moments of an empty series!')
+        if self.weight == 0.0:
+            raise ValueError(f'Unable to determine the moments of a series of {self.count} items; '
+                             f'the total weight is zero!')
+
+        # expand the upper triangle of the co-moment into the full (symmetric) covariance
+        size = self._mean.shape[0]
+        upper, lower = self._pairs
+        covariance = numpy.empty((size, size) + self._mean.shape[1:])
+        covariance[upper, lower] = self._moment / self.weight
+        covariance[lower, upper] = covariance[upper, lower]
+
+        diagonal = numpy.arange(size)
+        statistics = Statistics(self.names, self._mean.copy(), covariance[diagonal, diagonal], covariance, self.weight)
+
+        # wrap result if desired (no context to provide)
+        wrap = {True: lambda statistics: Output(statistics), False: lambda statistics: statistics}
+        return wrap[self.wrapped](statistics)
+
+    @classmethod
+    def from_statistics(cls, statistics: Statistics) -> 'Moments':
+        """Provides an accumulator with the moments of the provided result; e.g., in order to merge it"""
+        moments = cls(names=statistics.names)
+        moments._pairs = upper, lower = numpy.triu_indices(statistics.mean.shape[0])
+        moments._mean = statistics.mean.copy()
+        moments._moment = statistics.covariance[upper, lower] * statistics.weight
+        moments.count, moments.weight = 1, statistics.weight
+        return moments
+
+
+def time_weights(times: List[float]) -> List[float]:
+    """
+    Provides the trapezoidal temporal weights of a series; such that the weighted mean
+    is the time average of the (piecewise linear) series over the interval.
+
+    Attributes:
+        times: simulation times of each item in the series
+
+    Note:
+        The weights are computed according to the formula
+
+                w~0~ = (t~1~ - t~0~) / 2,   w~n~ = (t~n+1~ - t~n-1~) / 2,   w~N~ = (t~N~ - t~N-1~) / 2
+
+        A series of a single item is provided unit weight. When portions of a series are accumulated
+        separately and merged, each portion must be provided its portion of the weights of the whole.
+
+    Todo:
+
+    """
+    times = numpy.asarray(times, dtype=float)
+    if len(times) < 2:
+        return [1.0] * len(times)
+    weights = numpy.zeros(len(times))
+    weights[:-1] += numpy.diff(times) / 2
+    weights[1:] += numpy.diff(times) / 2
+    return list(weights)
+
+
+def merge(*parts: Statistics) -> Statistics:
+    """
+    Provides a method to combine the statistics of separate portions of a series (e.g.,
+    by separate workers or chunks of time); see Moments.
+
+    Attributes:
+        parts: statistics of each portion of the series
+
+    Todo:
+
+    """
+    moments = Moments.from_statistics(parts[0])
+    for part in parts[1:]:
+        moments.merge(Moments.from_statistics(part))
+    return moments.result()
+
+
+def _moments_accumulator(data: 'SimulationData', *,
+                         weights: Optional[List[float]] = None, names: Tuple[str] = (),
+                         wrapped: bool = False, mapping: Dict[str, str] = {}) -> Accumulator:
+    """Provides an accumulator (internal) of the moments; see moments.statistics"""
+    return Moments(weights, names, wrapped)
+
+
+@accumulates(_moments_accumulator)
+def statistics(data: 'SimulationData', fields: 'Type_Output', *,
+               weights: Optional[List[float]] = None, names: Tuple[str] = (),
+               wrapped: bool = False, mapping: Dict[str, str] = {}) -> 'Type_Output':
+    """
+    Provides a method for calculation of the weighted mean, variance, and covariance of a
+    series of stacked fields; part of the Stackable set of routines.
+
+    Attributes:
+        data: object containing relavent flash simulation output
+        fields: (list of) numpy arrays stacked as [n, ...] for which to calculate the moments
+        weights: weight of each item of the series; unity if not provided (optional)
+        names: names of the stacked fields, provided with the result (optional)
+        wrapped: whether to wrap context around result of reduction (optional)
+        mapping: if wrapped, how to map context to options of the next operation (optional)
+
+    Note:
+        The result is a Statistics; see Moments for the formulas.
+
+        This function supports the accumulator protocol (i.e., series.simple(..., stream=True)).
+
+        This function does not generate any dynamic context; this even if wrapping is desired and specified, the
+        mapping attribute is ignored.
+
+    Todo:
+
+    """
+
+    # strip context if was provided
+    if isinstance(fields, Output):
+        fields = fields.data
+
+    # accumulate the series
+    accumulator = _moments_accumulator(data, weights=weights, names=names, wrapped=wrapped)
+    for item in fields:
+        accumulator.push(item)
+    return accumulator.result()
+
+
+def _stacked(data: 'SimulationData', step: 'Type_Step' = -1, *, scalars: Tuple[str] = (),
+             index: Optional['Type_Index'] = None, withguard: bool = False,
+             keepdims: bool = True) -> 'Type_Field':
+    """Provides (internal) the stacked cell centered velocity components and scalars; see moments.velocity"""
+    components = list(fields.velocity(data, step, index=index, withguard=withguard, keepdims=keepdims))
+
+    # need to define slicing operators based on dims; as for the velocity components
+    if index is None:
+        i_all = slice(None)
+        i_zax = 0 if not withguard else int(data.geometry.blk_guards / 2)
+        index = (i_all, ) * 4 if (keepdims or data.geometry.grd_dim == 3) else (i_all, i_zax, i_all, i_all)
+
+    # only the field data of the step is accessed; stacking copies
+    prefix = '_' if withguard else ''
+    components.extend(_field_from_step(data, prefix + name, step)[index] for name in scalars)
+    return numpy.stack(components)
+
+
+def velocity(data: 'SimulationData', steps: Optional['Type_Index'] = slice(None), *,
+             scalars: Tuple[str] = (), start: Optional['Type_Step'] = None,
+             stop: Optional['Type_Step'] = None, skip: Optional[int] = None,
+             weights: Optional[List[float]] = None, differential: bool = True, workers: Optional[int] = None,
+             wrapped: bool = False, mapping: Dict[str, str] = {},
+             index: Optional['Type_Index'] = None, withguard: bool = False, keepdims: bool = True) -> 'Type_Output':
+    """
+    Provides a method for calculation of the time-weighted mean, variance, and covariance
+    (e.g., Reynolds stresses and turbulent fluxes) of the cell centered velocity components and
+    any desired scalars in a single streaming pass by consuming a SimulationData object and
+    a time interval specification; must have 'fcx2', 'fcy2' ('fcz2' if 3d) attributes in the
+    SimulationData.fields object.
+
+    Attributes:
+        data: object containing relavent flash simulation output
+        steps: iterable time-like specification for which to process data, the keys (optional)
+        scalars: names of cell centered fields to include (e.g., ('temp', )) (optional)
+        start: used to determine the starting time-like specification, start key (optional)
+        stop: used to determine the ending time-like specification, stop key (optional)
+        skip: used to determine the sampling interval for the specification (optional)
+        weights: weight of each step; trapezoidal temporal weights if not provided (optional)
+        differential: whether to use temporal weights, else unity weights (optional)
+        workers: number of workers to concurrently source the steps; see series.simple (optional)
+        wrapped: whether to wrap context around result of sourcing (optional)
+        mapping: if wrapped, how to map context to options of the next operation (optional)
+        index: used for custom slicing operation; should be (blks, k, j, i) (optional)
+        withguard: retain guard cell data for ploting and other actions (optional)
+        keepdims: retain unused dimensions for broadcasting, else drop them (optional)
+
+    Note:
+        The result is a Statistics of the stacked fields [u, v, (w, ), *scalars]; for example,
+
+                mean[0] = u_bar~ijk~,   variance[0] = <u'u'>~ijk~,   covariance[0, 1] = <u'v'>~ijk~
+
+                *where <> is the time average over the interval, weighted by time_weights*
+
+        Portions of a series (e.g., chunks of time) may be computed separately and combined using merge;
+        each portion should be provided its portion of the weights of the whole (i.e., weights=).
+
+        This function does not generate any dynamic context; this even if wrapping is desired and specified, the
+        mapping attribute is ignored.
+
+    Todo:
+
+    """
+
+    # need the dimensionality
+    dimension = data.geometry.grd_dim
+
+    # get guard size
+    guards = data.geometry.blk_guards
+
+    # need to define slicing operators based on dims
+    if index is None:
+        i_all = slice(None)
+        i_zax = 0 if not withguard else int(guards / 2)
+        index = (i_all, ) * 4 if (keepdims or dimension == 3) else (i_all, i_zax, i_all, i_all)
+
+    # use provided information to source times
+    if start or stop:
+        steps = slice(start, stop, skip)
+    times = data.utility.times(steps)
+    steps = data.utility.indices(steps)
+
+    # determine the temporal weights
+    if weights is None and differential:
+        weights = time_weights(times)
+
+    # use time series analysis to accumulate the moments in a single streamed pass
+    names = ('u', 'v', 'w')[:dimension] + tuple(scalars)
+    source = make_sourceable(source=_stacked, args=data, method='step',
+                             options={'scalars': tuple(scalars), 'index': index,
+                                      'withguard': withguard, 'keepdims': keepdims})
+    stack = make_stackable(element=statistics, args=data, method='whole',
+                           options={'weights': weights, 'names': names, 'wrapped': wrapped})
+    return series.simple(source=source, sourceby=steps, stack=stack, stream=True, workers=workers)
@@ -8,10 +8,16 @@ Todo:
 """
 
 
-from typing import Any, Tuple, List, Dict, Iterable, Union, Callable, TYPE_CHECKING
-from collections import namedtuple
+from typing import Any, Tuple, List, Dict, Iterable, Iterator, Union, Callable, Optional, TYPE_CHECKING
+from collections import namedtuple, deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from functools import partial
+from multiprocessing import get_context
+from queue import Queue, Empty, Full
 from sys import stdout
+from threading import Thread, Event, Lock, local
+from time import perf_counter
+import tracemalloc
 
 
 import numpy
@@ -58,7 +64,11 @@ SourceByMethods = {'step', 'slice', 'iterable'}
 
 
 # define available methods for how elements may operate on stack data       
-StackableMethods = {'part', 'whole'}
+StackableMethods = {'part', 'whole', 'batch'}
+
+
+# define available executors for concurrently evaluating a source by step
+ExecutorMethods = {'thread', 'process'}
 
 
 # define named objects which wrap context around source and element ouputs
@@ -67,7 +77,8 @@ Output = namedtuple('Output', ['data', 'context', 'mapping'], defaults=[{}, {}])
 
 # define helper method to construct a sources with context attached for later ingestion 
 def make_sourceable(source: Callable[..., Type_Output], args: Tuple[Any], *,
-                    method: str = 'step', options: Dict[str, Any] = {}) -> Sourceable:         
+                    method: str = 'step', options: Dict[str, Any] = {}, 
+                    profile: Optional['Profiler'] = None) -> Sourceable:         
     """
     Provides a helper method to construct sources with attached 
     context for use in ingestion in the analysis modules.
@@ -77,6 +88,7 @@ def make_sourceable(source: Callable[..., Type_Output], args: Tuple[Any], *,
         args: positional arguments to attach to sourcing function 
         method: how will the source consume the sourceby passed to it (optional)
         options: keyword arguments to attach to sourcing function (optional)
+        profile: record the calls of the source with the provided profiler (optional)
 
     Notes:
 
@@ -94,12 +106,16 @@ def make_sourceable(source: Callable[..., Type_Output], args: Tuple[Any], *,
         args = (args, )
 
     # return context wrapped sourcing function
-    return Sourceable(partial(source, *args, **options), method)
+    source = partial(source, *args, **options)
+    if profile is not None:
+        source = profile.wrap(source)
+    return Sourceable(source, method)
 
 
 # define helper methods to construct elements with context attached for later stacking
 def make_stackable(element: Callable[..., Type_Output], args: Tuple[Any], *,
-                   method: str = 'part', options: Dict[str, Any] = {}) -> Stackable:
+                   method: str = 'part', options: Dict[str, Any] = {},
+                   profile: Optional['Profiler'] = None) -> Stackable:
     """
     Provides a helper method to construct elements with attached 
     context for use in constructing a stack for the analysis modules.
@@ -109,6 +125,7 @@ def make_stackable(element: Callable[..., Type_Output], args: Tuple[Any], *,
         args: positional arguments to attach to stackable element
         method: how will the element operate on the data in the stack (optional)
         options: keyword arguments to attach to stackable element (optional)
+        profile: record the calls of the element with the provided profiler (optional)
 
     Notes:
 
@@ -126,7 +143,10 @@ def make_stackable(element: Callable[..., Type_Output], args: Tuple[Any], *,
         args = (args, )
     
     # return context wrapped stackable element
-    return Stackable(partial(element, *args, **options), method)
+    element = partial(element, *args, **options)
+    if profile is not None:
+        element = profile.wrap(element)
+    return Stackable(element, method)
 
 
 # define an unwrapping factory for processing output
@@ -180,7 +200,9 @@ def _make_output(message: str, display: bool) -> Callable[[int], None]:
 
 
 def _ingest_source(source: Type_Source, sourceby: Type_SourceBy, *, 
-                   path: 'DataPath' = None) -> Type_Series:
+                   path: 'DataPath' = None, 
+                   workers: Optional[int] = None, executor: str = 'thread',
+                   profile: Optional['Profiler'] = None) -> Type_Series:
     """
     Method (internal) provided to handle ingesting a source and returning
     an output suitable for use in a series method.
@@ -189,22 +211,56 @@ def _ingest_source(source: Type_Source, sourceby: Type_SourceBy, *,
         source: a source object, name, or function for producing a source
         sourceby: an object which provides specification of items in the source
         path: object specifing where to source the data; necessary if named source
+        workers: number of workers to concurrently evaluate a 'step' method source (optional)
+        executor: kind of workers to use; must be one of {'thread', 'process'} (optional)
+        profile: record the calls of the source with the provided profiler (optional)
 
 
     Todo:
         Verify flexability of method
         Throw more usefull exceptions
 
+    """
+    return numpy.array(list(_iter_source(source, sourceby, path=path, workers=workers, 
+                                         executor=executor, profile=profile)))
+
+
+def _iter_source(source: Type_Source, sourceby: Type_SourceBy, *, 
+                 path: 'DataPath' = None,
+                 workers: Optional[int] = None, executor: str = 'thread',
+                 profile: Optional['Profiler'] = None) -> Iterator[Type_Output]:
+    """
+    Method (internal) provided to handle ingesting a source as a generator; 
+    producing the output of the source one item (e.g., step) at a time.
+
+    Attributes:
+        source: a source object, name, or function for producing a source
+        sourceby: an object which provides specification of items in the source
+        path: object specifing where to source the data; necessary if named source
+        workers: number of workers to concurrently evaluate a 'step' method source (optional)
+        executor: kind of workers to use; must be one of {'thread', 'process'} (optional)
+        profile: record the calls of the source with the provided profiler (optional)
+
+    Note:
+        Only named sources and Sourceable objects using the 'step' method are produced
+        lazily; other sources are evaluated as a whole and then produced by item.
+
+        If workers are provided, the steps of a 'step' method source are evaluated concurrently
+        and produced in order; see _map_ordered.
+
+    Todo:
+
     """
 
     # injest a source using a path and name
     if isinstance(source, str):
         if not isinstance(path, DataPath):
-            Exception(f'Must provide a DataPath for named sources')
+            raise Exception(f'Must provide a DataPath for named sources')
         if sourceby is None:
             sourceby = path.data.utility.indices()
         path = path._replace(name=source)
-        output = [data_from_path(path, times=time)[0] for time in sourceby]
+        lookup = data_from_path if profile is None else profile.wrap(data_from_path)
+        yield from (lookup(path, times=time)[0] for time in sourceby)
 
     # injest a Sourceable using sourceby
     elif type(source) == Sourceable:
@@ -218,10 +274,14 @@ def _ingest_source(source: Type_Source, sourceby: Type_SourceBy, *,
                 # try to fill in steps from path
                 if sourceby is None:
                     if not isinstance(path, DataPath):
-                        Exception(f'Must provide a DataPath for step method sources when sourceby is None!')
+                        raise Exception(f'Must provide a DataPath for step method sources when sourceby is None!')
                     sourceby = path.data.utility.indices()
             
-                output = [source.source(step) for step in sourceby]
+                function = source.source if profile is None else profile.wrap(source.source)
+                if workers is None:
+                    yield from (function(step) for step in sourceby)
+                else:
+                    yield from _map_ordered(function, sourceby, workers=workers, executor=executor)
 
             # source by other available methods
             else:
@@ -231,29 +291,485 @@ def _ingest_source(source: Type_Source, sourceby: Type_SourceBy, *,
                     if source.method == 'slice':
                         sourceby = slice(None)
                     else:
-                        Exception(f'Cannot automatically generate sourceby for choosen source.method!')
+                        raise Exception(f'Cannot automatically generate sourceby for choosen source.method!')
 
-                output = source.source(sourceby)
+                function = source.source if profile is None else profile.wrap(source.source)
+                yield from function(sourceby)
 
         # Unable to injest source with provided method
         else:
-            Exception(f'Provided source.method not supported!')
+            raise Exception(f'Provided source.method not supported!')
 
     # provided source is directly usable as output
     elif type(source) == numpy.ndarray or type(source) == list:
         if type(source[0]) not in (str, int, float, numpy.ndarray):
             Exception(f'Provided source appears to be a collection, but cannot be used!')
-        output = source
+        yield from source
 
     # not able to injest source with provided information
     else:
-        Exception(f'Cannot work with provided source!')
+        raise Exception(f'Cannot work with provided source!')
+
+
+# define the source evaluated by each worker process; inherited when the process is forked
+_WORKER_SOURCE: Optional[Callable[..., Type_Output]] = None
+
+
+def _worker_initialize(source: Callable[..., Type_Output]) -> None:
+    """Method (internal) provided to attach the source to a worker process"""
+    global _WORKER_SOURCE
+    _WORKER_SOURCE = source
+
+
+def _worker_evaluate(step: Type_Step) -> Tuple[bool, Any]:
+    """Method (internal) provided to evaluate the source of a worker process by step; returning 
+    arrays through a shared memory block (unlinked by the receiver) rather than by pickling"""
+    from multiprocessing.shared_memory import SharedMemory # pylint: disable=import-outside-toplevel
+    result = _WORKER_SOURCE(step)
+    if not isinstance(result, numpy.ndarray) or result.nbytes == 0 or result.dtype.hasobject:
+        return False, result
+    shared = SharedMemory(create=True, size=result.nbytes)
+    numpy.ndarray(result.shape, dtype=result.dtype, buffer=shared.buf)[...] = result
+    shared.close()
+    return True, (shared.name, result.shape, result.dtype.str)
+
+
+def _worker_receive(message: Tuple[bool, Any]) -> Type_Output:
+    """Method (internal) provided to copy an array out of (and release) a worker shared memory block"""
+    shared, payload = message
+    if not shared:
+        return payload
+    from multiprocessing.shared_memory import SharedMemory # pylint: disable=import-outside-toplevel
+    name, shape, dtype = payload
+    block = SharedMemory(name=name)
+    try:
+        return numpy.ndarray(shape, dtype=dtype, buffer=block.buf).copy()
+    finally:
+        block.close()
+        block.unlink()
+
+
+def _map_ordered(source: Callable[..., Type_Output], sourceby: Iterable, *, 
+                 workers: int, executor: str = 'thread') -> Iterator[Type_Output]:
+    """
+    Method (internal) provided to concurrently evaluate a source by each step of sourceby;
+    producing the results in the order of sourceby.
+
+    Attributes:
+        source: function which produces data for a step 
+        sourceby: iterable of steps on which to evaluate the source
+        workers: number of concurrent workers
+        executor: kind of workers to use; must be one of {'thread', 'process'} (optional)
+
+    Note:
+        At most twice the number of workers steps are in flight at any time, such that a streamed 
+        series retains a bounded number of results.
+
+        Process workers are forked (hence, only available on platforms which support fork) so that
+        the source, and the SimulationData it references, are inherited rather than pickled; the 
+        resulting arrays are passed back through shared memory (hence, requiring python 3.8+).
+
+    Todo:
+
+    """
+
+    # determine the pool of workers and how each step is evaluated
+    if executor == 'thread':
+        pool = ThreadPoolExecutor(max_workers=workers)
+        submit = lambda step: pool.submit(source, step)
+        receive = lambda result: result
+    elif executor == 'process':
+        from multiprocessing import resource_tracker # pylint: disable=import-outside-toplevel
+        resource_tracker.ensure_running() # shared by forked workers to track shared memory blocks
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=get_context('fork'),
+                                   initializer=_worker_initialize, initargs=(source, ))
+        submit = lambda step: pool.submit(_worker_evaluate, step)
+        receive = _worker_receive
+    else:
+        raise ValueError(f"Unsupported executor '{executor}'; must specify {ExecutorMethods}!")
+
+    # evaluate steps within a bounded window, producing results in order
+    pending = deque()
+    try:
+        for step in sourceby:
+            pending.append(submit(step))
+            if len(pending) >= 2 * workers:
+                yield receive(pending.popleft().result())
+        while pending:
+            yield receive(pending.popleft().result())
+
+    # release any shared memory of results which were not consumed
+    finally:
+        for future in pending:
+            if not future.cancel() and executor == 'process':
+                try:
+                    _worker_receive(future.result())
+                except Exception:
+                    pass
+        pool.shutdown()
+
+
+def _prefetch(parts: Iterator[Type_Output], depth: int, *, 
+              report: Optional[Dict[str, Any]] = None) -> Iterator[Type_Output]:
+    """
+    Method (internal) provided to read-ahead a stream of sourced items on a background thread;
+    such that the items n+1 .. n+depth are sourced (e.g., read from hdf5 and guard filled) while 
+    the consumer processes item n.
+
+    Attributes:
+        parts: generator of sourced items (e.g., the output of each step)
+        depth: maximum number of items read-ahead of the consumer
+        report: dictionary updated in place with statistics of the pipeline (optional)
+
+    Note:
+        The following statistics are reported:
+
+            items   -> number of items consumed
+            stall   -> total time (s) the consumer waited on the read-ahead
+            source  -> total time (s) the background thread spent sourcing items
+            depth   -> average number of items ready when the consumer requested an item
+            maximum -> maximum number of items ready when the consumer requested an item
+
+        Exceptions raised while sourcing are raised to the consumer.
+
+    Todo:
+
+    """
+    queue, stop, done = Queue(maxsize=depth), Event(), object()
+    timing = {'source': 0.0}
+
+    # source items in the background until exhausted or the consumer stops
+    def produce() -> None:
+        try:
+            iterator = iter(parts)
+            while not stop.is_set():
+                start = perf_counter()
+                try:
+                    item = (False, next(iterator))
+                except StopIteration:
+                    item = (False, done)
+                timing['source'] += perf_counter() - start
+                while not stop.is_set():
+                    try:
+                        queue.put(item, timeout=0.1)
+                        break
+                    except Full:
+                        continue
+                if item[1] is done:
+                    return
+        except BaseException as error: # pylint: disable=broad-except
+            queue.put((True, error))
+
+    thread = Thread(target=produce, name='pyioflash-prefetch', daemon=True)
+    thread.start()
+
+    # consume items in order, recording stalls and depth of the read-ahead
+    stats = {'items': 0, 'stall': 0.0, 'source': 0.0, 'depth': 0.0, 'maximum': 0}
+    ready = 0
+    try:
+        while True:
+            size = queue.qsize()
+            start = perf_counter()
+            failed, item = queue.get()
+            stats['stall'] += perf_counter() - start
+            if failed:
+                raise item
+            if item is done:
+                break
+            ready += size
+            stats['items'] += 1
+            stats['maximum'] = max(stats['maximum'], size)
+            yield item
+
+    # release the background thread and report statistics
+    finally:
+        stop.set()
+        while True:
+            try:
+                queue.get_nowait()
+            except Empty:
+                break
+        thread.join()
+        stats['source'] = timing['source']
+        stats['depth'] = ready / stats['items'] if stats['items'] else 0.0
+        if report is not None:
+            report.update(stats)
+
+
+class Profiler:
+    """
+    Profiler is a type providing per-element instrumentation of post-processing pipelines; 
+    such that the time spent sourcing (e.g., data_from_path) or in each stack element 
+    (e.g., _interpolate_ftc or integral.time) may be determined.
+
+    +------------------------------------------------------------------------------------------+
+    |Usage                                                                                     |
+    +===============================+==========================================================+
+    |Profiler()                     |Records wall time, calls, and bytes in and out            |
+    +-------------------------------+----------------------------------------------------------+
+    |Profiler(memory=True)          |Additionally records the peak allocation (tracemalloc)    |
+    +-------------------------------+----------------------------------------------------------+
+    |Profiler(callback=function)    |Calls function(name, sample) after each recorded call     |
+    +-------------------------------+----------------------------------------------------------+
+    |profiler.wrap(function)        |Returns the function instrumented by the profiler         |
+    +-------------------------------+----------------------------------------------------------+
+    |profiler.report()              |Returns the accumulated records of each element by name   |
+    +-------------------------------+----------------------------------------------------------+
+
+    A profiler is provided to series.simple(..., profile=profiler), or to make_sourceable and 
+    make_stackable, in order to instrument the source and elements; if not provided, nothing
+    is instrumented and no cost is incurred.
+
+    Note:
+        Bytes in and out count the numpy arrays of the arguments and results of each call;
+        the peak allocation of nested instrumented calls is attributed to the innermost call.
+
+        If recording memory, tracemalloc is started by the first instrumented call in flight (unless
+        already tracing) and stopped once no instrumented calls remain in flight; tracing started by
+        the user is left running. Before python 3.9 (i.e., without tracemalloc.reset_peak), the peak 
+        allocation of a call nested within another, or made while the user is tracing, includes the 
+        peak of any earlier allocations since tracing started.
+
+        Calls evaluated by process workers are not recorded; see series.simple.
+
+    Attributes:
+        memory: whether to record the peak allocation of each call
+        callback: function called with the name and sample of each recorded call
+        records: accumulated calls, time, bytes in and out, and peak allocation of each element
+        _lock: Internal lock used to allow recording from multiple threads
+        _active: Internal count of instrumented calls in flight, if recording memory
+        _started: Internal flag of whether tracemalloc was started by the profiler
+    """
+    memory: bool
+    callback: Optional[Callable[[str, Dict[str, Any]], None]]
+    records: Dict[str, Dict[str, Any]]
+    _lock: Lock
+    _active: int
+    _started: bool
+
+    def __init__(self, *, memory: bool = False, 
+                 callback: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> None:
+        self.memory = memory
+        self.callback = callback
+        self.records = {}
+        self._lock = Lock()
+        self._active = 0
+        self._started = False
+
+    def __repr__(self) -> str:
+        return f'Profiler(elements={list(self.records)}, memory={self.memory})'
+
+    def record(self, name: str, sample: Dict[str, Any]) -> None:
+        """
+        Accumulates a sample (i.e., time, bytes_in, bytes_out, and peak) of a call to a named element.
+
+        Args:
+            name: name of the element called
+            sample: measurements of the call
+
+        Returns:
+            None
+
+        """
+        with self._lock:
+            record = self.records.setdefault(name, {'calls': 0, 'time': 0.0, 'bytes_in': 0, 
+                                                    'bytes_out': 0, 'peak': 0})
+            record['calls'] += 1
+            record['time'] += sample['time']
+            record['bytes_in'] += sample['bytes_in']
+            record['bytes_out'] += sample['bytes_out']
+            record['peak'] = max(record['peak'], sample['peak'])
+        if self.callback is not None:
+            self.callback(name, sample)
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns the accumulated records of each element; including the mean time per call.
+
+        Args:
+            None
+
+        Returns:
+            Dictionary of records by element name.
+
+        """
+        with self._lock:
+            return {name: {**record, 'mean': record['time'] / record['calls']} 
+                    for name, record in self.records.items()}
+
+    def wrap(self, function: Callable, *, name: Optional[str] = None) -> Callable:
+        """
+        Returns the function instrumented by the profiler; previously instrumented functions are returned as is.
+
+        Args:
+            function: function (or functools.partial of such) to instrument
+            name (optional): name to record calls under; defaults to module.function
+
+        Returns:
+            The instrumented function.
+
+        """
+        if getattr(function, 'profiler', None) is self:
+            return function
+        name = _element_name(function) if name is None else name
+
+        def profiled(*args: Any, **kwargs: Any) -> Any:
+            if self.memory:
+                self._trace()
+                before = tracemalloc.get_traced_memory()[0]
+                if hasattr(tracemalloc, 'reset_peak'):
+                    tracemalloc.reset_peak()
+            try:
+                start = perf_counter()
+                result = function(*args, **kwargs)
+                elapsed = perf_counter() - start
+                peak = max(tracemalloc.get_traced_memory()[1] - before, 0) if self.memory else 0
+            finally:
+                if self.memory:
+                    self._untrace()
+            self.record(name, {'time': elapsed, 'bytes_in': _nbytes(args) + _nbytes(kwargs), 
+                               'bytes_out': _nbytes(result), 'peak': peak})
+            return result
+
+        profiled.__wrapped__ = function
+        profiled.profiler = self
+        return profiled
+
+    def _trace(self) -> None:
+        """Method (internal) provided to start tracing allocations, if not already, as a call begins"""
+        with self._lock:
+            if self._active == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started = True
+            self._active += 1
+
+    def _untrace(self) -> None:
+        """Method (internal) provided to stop tracing allocations, if started by the profiler, once no calls remain"""
+        with self._lock:
+            self._active -= 1
+            if self._active == 0 and self._started:
+                tracemalloc.stop()
+                self._started = False
+
+
+def _element_name(element: Callable) -> str:
+    """Method (internal) provided to name a (partially applied or profiled) element as module.function"""
+    element = getattr(element, '__wrapped__', element)
+    element = element.func if isinstance(element, partial) else element
+    module = getattr(element, '__module__', None) or ''
+    return module.rsplit('.', 1)[-1] + '.' + getattr(element, '__qualname__', type(element).__name__)
+
+
+def _nbytes(value: Any) -> int:
+    """Method (internal) provided to count the bytes of the numpy arrays of a (nested) value"""
+    if isinstance(value, numpy.ndarray):
+        return value.nbytes
+    elif isinstance(value, (tuple, list)):
+        return sum(_nbytes(item) for item in value)
+    elif isinstance(value, dict):
+        return sum(_nbytes(item) for item in value.values())
+    return 0
+
+
+class Accumulator:
+    """
+    Accumulator is the (internal) base type of the accumulator protocol; which allows 
+    stackable elements operating on the 'whole' of a series (e.g., time integration, sums,
+    and means) to instead be fed the series one item at a time, as it is sourced.
+
+    +------------------------------------------------------------------------------------------+
+    |Protocol                                                                                  |
+    +===============================+==========================================================+
+    |acc.push(item)                 |Incorporates the next item of the series                  |
+    +-------------------------------+----------------------------------------------------------+
+    |acc.result()                   |Returns the same result as the element on the whole series|
+    +-------------------------------+----------------------------------------------------------+
+
+    Note:
+        An element participates in the protocol by being decorated with accumulates(factory); 
+        the factory is called with the same arguments as the element (less the series) and 
+        may return None to decline (e.g., for unsupported options), in which case the 
+        series is materialized and the element is called as usual.
+
+    """
+    def push(self, item: Type_Data) -> None:
+        raise NotImplementedError
+
+    def result(self) -> Type_Output:
+        raise NotImplementedError
+
+
+def accumulates(factory: Callable[..., Optional[Accumulator]]) -> Callable[[Callable], Callable]:
+    """
+    Provides a decorator which attaches an accumulator factory to a stackable element; 
+    see Accumulator for a description of the protocol.
+
+    Attributes:
+        factory: called with the arguments of the element (less the series) to create an accumulator
+
+    Todo:
+
+    """
+    def attach(element: Callable) -> Callable:
+        element.accumulator = factory
+        return element
+    return attach
+
+
+def _make_accumulator(element: Callable[..., Type_Output], **options: Any) -> Optional[Accumulator]:
+    """
+    Method (internal) provided to create an accumulator for a (partially applied) stackable element;
+    returns None if the element does not support or declines the accumulator protocol.
+
+    Attributes:
+        element: stackable element, or a functools.partial of such, to accumulate
+        options: additional keyword arguments (e.g., mapped context) to provide to the factory
+
+    Todo:
+
+    """
+    profile = getattr(element, 'profiler', None)
+    function, args, keywords = getattr(element, '__wrapped__', element), (), {}
+    if isinstance(function, partial):
+        function, args, keywords = function.func, function.args, function.keywords
+
+    factory = getattr(function, 'accumulator', None)
+    if factory is None:
+        return None
+    accumulator = factory(*args, **{**keywords, **options})
+
+    # record the accumulation under the name of the element if profiled
+    if accumulator is not None and profile is not None:
+        accumulator.push = profile.wrap(accumulator.push, name=_element_name(element))
+        accumulator.result = profile.wrap(accumulator.result, name=_element_name(element))
+    return accumulator
+
+
+def _field_from_step(data: 'SimulationData', name: str, step: Type_Step) -> Type_Field:
+    """
+    Provides a method to retrieve a named field of a single step of the simulation data.
+
+    Attributes:
+        data: object containing relavent flash simulation output
+        name: named field data (e.g., _fcx2, temp, or a registered derived field)
+        step: time-like specification of the step, the key or index
+
+    Note:
+        Only the field data of the desired step is accessed (i.e., reloaded if evicted); unlike
+        data.fields[name][step][0], which stacks (and copies) the named field of every step first.
+
+        The resident field data is returned rather than a copy; which should not be modified in place.
 
-    return numpy.array(output)
+    Todo:
+
+    """
+    member, = data.fields[step]
+    return getattr(member, name)
 
 
 def _interpolate_ftc(field: Type_Field, axis: int, guards: int, dimension: int, *, 
-                     withguard: bool = False, keepdims: bool = True) -> Type_Field:
+                     withguard: bool = False, keepdims: bool = True, 
+                     out: Optional[Type_Field] = None) -> Type_Field:
     """
     Provides a method for interpolation from the face centered grids to the cell centered grid.
 
@@ -262,14 +778,16 @@ def _interpolate_ftc(field: Type_Field, axis: int, guards: int, dimension: int,
         axis: which face centered grid {0 : i, 1 : j, 2 : k}
         guards: how many guard cells in each spacial dimension in field array
         dimension: what is the spacial dimensionality of field
+        withguard: retain guard cell data for ploting and other actions (optional)
         keepdims: retain unused dimensions for broadcasting, else drop them (optional)
+        out: array in which to place the result; must have the shape of the result (optional)
 
     Note:
         Performs simple linear two-point grid interpolation along relavent axis.
 
         Input array is assumed to have guard cells included according to guards.
         Input array is assumed to be broadcastable to same as SimualationData.fields
-        face-centered data (e.g., _fcx2)
+        face-centered data (e.g., _fcx2); any leading axes (e.g., time) are retained.
 
         If returned array has guard cells included, the lower guard cells are initialized
         to a zero value as the library does not currently store an extra cell along the 
@@ -277,42 +795,202 @@ def _interpolate_ftc(field: Type_Field, axis: int, guards: int, dimension: int,
         order the operation such that the valid neughboring block layer the default guard
         cell data.
 
+        The interpolation is performed in place in the result; such that no temporaries are
+        allocated, and if out is provided (e.g., a buffer from _workspace) no allocation occurs.
+        The shape of the result may be determined using _interpolate_ftc_shape.
+
     Todo:
         Implement more advanced interpolation schemes
         Add support for arbritrary dimensionality
         Reimplement select case construct as dictionary
 
     """
+    high, low, ires = _interpolate_ftc_slices(axis, guards, dimension, withguard=withguard, keepdims=keepdims)
+
+    # need to initialize the result; only guard cells need to be zeroed
+    if out is None:
+        out = numpy.zeros_like(field) if withguard else numpy.empty_like(field[high])
+    elif withguard:
+        out.fill(0.0)
+    result = out[high] if withguard else out
+
+    #interpolate the face-centered field to cell-centers
+    numpy.add(field[high], field[low], out=result)
+    numpy.divide(result, 2.0, out=result)
+    
+    return out
+
+
+def _interpolate_ftc_shape(shape: Tuple[int], axis: int, guards: int, dimension: int, *, 
+                           withguard: bool = False, keepdims: bool = True) -> Tuple[int]:
+    """Provides the shape (internal) of the result of _interpolate_ftc for a field of shape"""
+    high, low, ires = _interpolate_ftc_slices(axis, guards, dimension, withguard=withguard, keepdims=keepdims)
+    return numpy.broadcast_to(numpy.empty((), dtype=numpy.int8), shape)[ires].shape
+
+
+def _interpolate_ftc_slices(axis: int, guards: int, dimension: int, *, withguard: bool = False, 
+                            keepdims: bool = True) -> Tuple[Tuple[Union[slice, int]], ...]:
+    """Provides the slicing operators (internal) of the upper, lower, and result of _interpolate_ftc"""
+
     # use one-sided guards
     guard = int(guards / 2)
 
     # define necessary slice operations
-    iall = slice(None)
     icom = slice(guard, -guard) if not withguard else slice(guard, None)
     izcm = icom if (keepdims or dimension == 3) else guard
     idif = slice(guard - 1, -(guard + 1)) if not withguard else slice(guard - 1, -guard)
 
     # define the upper axis; velocity on staggered grid where upper bound is on
     #   the domain boundary & the outer most interior cell on the high side of axis
-    high : Tuple[Union[slice, int]] = (iall, izcm, icom, icom)
+    high : Tuple[Union[slice, int]] = (Ellipsis, izcm, icom, icom)
 
     # define the lower axis; velocity on staggered grid where lower bound is on
     #   the domain boundary & the inner most guard cell on the low side of axis
     low : Tuple[Union[slice, int]]
     if axis == 0:
-        low = (iall, izcm, icom, idif) 
+        low = (Ellipsis, izcm, icom, idif) 
     elif axis == 1:
-        low = (iall, izcm, idif, icom)
+        low = (Ellipsis, izcm, idif, icom)
     elif axis == 2:
-        low = (iall, idif, icom, icom)
+        low = (Ellipsis, idif, icom, icom)
     else:
-        pass
+        raise ValueError(f'Unsupported axis {axis} of interpolation; must specify {{0, 1, 2}}!')
 
-    # need to initialize the result and index
-    result = numpy.zeros_like(field)
-    ires = (iall, ) * 4 if withguard else high
+    # define the result; either with or without guard cells
+    ires = (Ellipsis, ) if withguard else high
 
-    #interpolate the face-centered field to cell-centers
-    result[high] = (field[high] + field[low]) / 2.0
-    
-    return result[ires]
+    return high, low, ires
+
+
+# target working set (bytes) of a chunk of blocks in the fused kernels; see _kinetic_ftc
+_CHUNK_BYTES = 1 << 18
+
+
+def _kinetic_ftc(components: List[Type_Field], guards: int, dimension: int, *,
+                 withguard: bool = False, keepdims: bool = True,
+                 weights: Optional[Type_Field] = None, out: Optional[Type_Field] = None,
+                 chunk: Optional[int] = None) -> Union[Type_Field, float]:
+    """
+    Provides a fused method for calculation of the kinetic energy on the cell centered grid
+    from the face centered velocity components; optionally reduced to a weighted sum.
+
+    Attributes:
+        components: face centered velocity fields (e.g., _fcx2, _fcy2, _fcz2); [blks, k, j, i]
+        guards: how many guard cells in each spacial dimension in component arrays
+        dimension: what is the spacial dimensionality of the components
+        withguard: retain guard cell data for ploting and other actions (optional)
+        keepdims: retain unused dimensions for broadcasting, else drop them (optional)
+        weights: cell centered weights (e.g., volume elements) with which to reduce the energy (optional)
+        out: array in which to place the result, if not reduced; see _interpolate_ftc (optional)
+        chunk: number of blocks processed per pass; sized for the cache if not provided (optional)
+
+    Note:
+        The kinetic energy is computed according to the formula
+
+                E~ijk~ = 0.25 * ( (u~l~ + u~r~)^2^ + (v~l~ + v~r~)^2^ + (w~l~ + w~r~)^2^ )
+
+        which is identical to squaring and summing the components interpolated by _interpolate_ftc.
+
+        The components are read once, a chunk of blocks at a time, and each term is accumulated
+        in place; such that only a chunk sized temporary (from _workspace) is needed. If weights
+        are provided, sum( E~ijk~ * weights~ijk~ ) is returned without materializing the field.
+
+    Todo:
+
+    """
+    slices = [_interpolate_ftc_slices(axis, guards, dimension, withguard=withguard, keepdims=keepdims)
+              for axis in range(dimension)]
+    blocks = components[0].shape[0]
+
+    # need the shape of the interpolated (interior) region of a single block
+    shape = components[0][:1][slices[0][0]].shape[1:]
+    dtype = numpy.result_type(*components)
+
+    # determine the number of blocks in each pass
+    if chunk is None:
+        chunk = max(1, _CHUNK_BYTES // max(1, int(numpy.prod(shape)) * dtype.itemsize))
+    chunk = min(chunk, blocks)
+    term = _workspace((chunk, ) + shape, dtype, 'utility.kinetic_ftc')
+
+    # need to initialize the result; only guard cells need to be zeroed
+    if weights is not None:
+        total = 0.0
+        energy = _workspace((chunk, ) + shape, dtype, 'utility.kinetic_ftc.energy')
+    elif out is None:
+        out = numpy.zeros_like(components[0], dtype=dtype) if withguard else numpy.empty((blocks, ) + shape, dtype)
+    elif withguard:
+        out.fill(0.0)
+
+    # accumulate the energy of each chunk of blocks in turn; in place within the interior of the result
+    interior = slices[0][0] if withguard else (Ellipsis, )
+    for start in range(0, blocks, chunk):
+        stop = min(start + chunk, blocks)
+        result = energy[:stop - start] if weights is not None else out[start:stop][interior]
+        temporary = term[:stop - start]
+
+        # sum the squares of each pair of faces; (u~l~ + u~r~)^2^
+        for axis, (field, (high, low, _)) in enumerate(zip(components, slices)):
+            target = result if axis == 0 else temporary
+            numpy.add(field[start:stop][high], field[start:stop][low], out=target)
+            numpy.square(target, out=target)
+            if axis != 0:
+                numpy.add(result, temporary, out=result)
+        numpy.multiply(result, 0.25, out=result)
+
+        # reduce the chunk if desired
+        if weights is not None:
+            numpy.multiply(result, weights[start:stop], out=result)
+            total += float(numpy.sum(result))
+
+    return total if weights is not None else out
+
+
+# thread-local reusable buffers; see _workspace
+_WORKSPACE = local()
+
+
+def _workspace(shape: Tuple[int], dtype: Any = float, tag: str = '') -> Type_Field:
+    """
+    Provides a reusable (uninitialized) buffer of shape and dtype for the calling thread;
+    such that repeated calls (e.g., for each step) by the same caller do not allocate.
+
+    Attributes:
+        shape: shape of the buffer
+        dtype: data type of the buffer (optional)
+        tag: name distinguishing buffers of the same shape needed concurrently (optional)
+
+    Note:
+        The buffer is shared by every call with the same tag, shape, and dtype on the
+        thread; therefore, it must not be returned to the caller of the using function
+        or held while another function may use the same tag.
+
+        Only the most recent buffer of each tag is retained by each thread; as such, buffers
+        should be (and are) only used for bounded temporaries (e.g., a chunk of blocks), and
+        may be released by the thread using release_workspace.
+
+    Todo:
+
+    """
+    buffers = _WORKSPACE.__dict__.setdefault('buffers', {})
+    buffer = buffers.get(tag)
+    if buffer is None or buffer.shape != tuple(shape) or buffer.dtype != numpy.dtype(dtype):
+        buffers[tag] = None # release the previous buffer before allocating its replacement
+        buffer = buffers[tag] = numpy.empty(shape, dtype=dtype)
+    return buffer
+
+
+def release_workspace() -> int:
+    """
+    Provides a method to release the reusable buffers retained by the calling thread; see _workspace.
+
+    Attributes:
+        None
+
+    Returns:
+        The number of bytes released.
+
+    Todo:
+
+    """
+    buffers = _WORKSPACE.__dict__.pop('buffers', {})
+    return sum(buffer.nbytes for buffer in buffers.values() if buffer is not None)
@@ -10,6 +10,13 @@ This module also defines a Base, and derived, class(es) which provide filtered,
 transpose-like viewing of multiple named members of a derived class when used in
 combination with a SortedDict.
 
+This module also defines a class which provides searching of the named field data of
+the members of a collection, pruned using the block summaries of each member, when used
+in combination with a SortedDict.
+
+The custom collection, LRUDict, provides a mapping with a bounded memory footprint
+which evicts the least recently used items once a byte budget has been exceeded.
+
 Example:
     An example use of a SortedDict is as follows, assuming each element loaded
     into the SortedDict instance provides an attribute, key, of type float::
@@ -21,6 +28,10 @@ Example:
 
         series = type('MyObject', (TransposeAsArray, ...), {})(...)
 
+    An example use of a LRUDict holding at most 1 GB of arrays is as follows::
+
+        cache = LRUDict(max_bytes=1e9)
+
 Todo:
     * Extend SortedDict to allow type(key) other than float
     * Improve code by refactoring out if/elif/else constructs
@@ -28,11 +39,14 @@ Todo:
 """
 from abc import ABC as AbstractBase, abstractmethod
 from collections import OrderedDict
-from typing import Any, Tuple, List, Dict, Iterable, Union
+import operator
+from threading import RLock
+from typing import Any, Tuple, List, Dict, Iterable, Union, Optional, Callable, Hashable
 
 import numpy
 
-from pyioflash.simulation.utility import _filter_transpose, _first_true, _set_is_unique
+from pyioflash.simulation.utility import (_filter_transpose, _first_true, _set_is_unique, _get_indices,
+                                          _memory_entry, _memory_total)
 
 class SortedDict:
     """
@@ -467,6 +481,35 @@ class SortedDict:
         self.__make_valid__()
         yield from {item[0] : self._data[item[1]] for item in self._keys.items()}.items()
 
+    def memory_report(self) -> Dict[str, Any]:
+        """
+        Returns the memory footprint (in bytes) of the collection, by element key.
+
+        Elements which provide a memory_report method are reported in detail,
+        otherwise the size of the element itself is reported.
+
+        Args:
+            None
+
+        Returns:
+            A dict containing the total owned bytes and a report for each element.
+
+        """
+        self.__make_valid__()
+        items = {item.key: item.memory_report() if hasattr(item, 'memory_report') else _memory_entry(item)
+                 for item in self._data}
+        return {'total': _memory_total(items), 'items': items}
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Method to provide the property nbytes.
+
+        Returns:
+            Total bytes owned by the elements of the collection
+        """
+        return self.memory_report()['total']
+
     def keys(self):
         """
         Returns the keys in the collection.
@@ -695,3 +738,397 @@ class TransposableAsSingle(BaseTransposable):
     """
     def _return_map(self, source):
         return source[0]
+
+
+class Searchable:
+    """
+    Wrapper class used to provide searching of the named field data of the members of a derived
+    collection-like class; super().self must be a SortedDict of members implementing a summary method.
+
+    An instance is created with the following syntax::
+
+        sa = type('MyObject', (Searchable, ...), {})(...)
+
+    The composited object may be used as before with the following extended behavior
+
+    +-------------------------------------------------------------------------------------------------+
+    |Extended behavior as follows                                                                     |
+    +=================================+===============================================================+
+    |sa.summary(str, stat)            || Returns a compact (times, blocks) array of the summary        |
+    |                                 || statistic (min, max, sum, mean) of the named field            |
+    +---------------------------------+---------------------------------------------------------------+
+    |sa.where(str, op, value)         || Returns the (times, blocks, k, j, i) indices of the cells of  |
+    |                                 || the named field satisfying the comparison, skipping blocks    |
+    |                                 || which cannot match according to the block summaries           |
+    +---------------------------------+---------------------------------------------------------------+
+
+    """
+    _operators = {'>': operator.gt, '>=': operator.ge, '<': operator.lt,
+                  '<=': operator.le, '==': operator.eq, '!=': operator.ne}
+
+    def summary(self, name: str, stat: str) -> numpy.ndarray:
+        """
+        Returns the summary statistic of the named field for each block of each member;
+        the compact array is built once and cached until the collection, or the field data
+        of any member (as counted by its _version), is modified.
+
+        Args:
+            name: named field data of the members (e.g., temp)
+            stat: summary statistic to return [min, max, sum, mean]
+
+        Returns:
+            An array of the summary statistic, [times, blocks]
+        """
+        self.__make_valid__() # pylint: disable=no-member
+        versions = tuple(getattr(item, '_version', 0) for item in self) # pylint: disable=not-an-iterable
+        token = (tuple(self._keys), versions) # pylint: disable=no-member
+        cache = self.__dict__.setdefault('_summaries', {})
+        if cache.get('token') != token:
+            cache.clear()
+            cache['token'] = token
+        if (name, stat) not in cache:
+            summaries = [item.summary(name, stat) for item in self] # pylint: disable=not-an-iterable
+            cache[(name, stat)] = numpy.array(summaries)
+        return cache[(name, stat)]
+
+    def where(self, name: str, op: str, value: float, *,
+              times: Union[int, float, slice, Iterable] = slice(None)) -> Tuple[numpy.ndarray, ...]:
+        """
+        Returns the indices of the cells of the named field which satisfy the comparison to value,
+        using the block summaries to skip blocks (and members) which cannot match.
+
+        Args:
+            name: named field data of the members (e.g., temp)
+            op: comparison to perform [>, >=, <, <=, ==, !=]
+            value: value with which to compare the field data
+            times (optional): time-like specification of the members to search
+
+        Returns:
+            A tuple of index arrays (times, blocks, k, j, i), as if numpy.nonzero was applied to
+            the comparison of the stacked field data (i.e., collection[name][:][0]); the time indices
+            are with respect to the whole collection even if times are specified.
+
+        Note:
+            The field data of only those members with candidate blocks are accessed; thus, if field data is
+            held with a memory budget, only the members which could match will be (re)loaded. However, the
+            block summaries of a member are computed as its field data is first read; thus, the first search
+            (or summary) of a field reads that field of every member not yet read, once.
+        """
+        if op not in self._operators:
+            raise ValueError(f"Unsupported comparison '{op}'; must specify {set(self._operators)}!")
+        compare = self._operators[op]
+
+        # determine candidate blocks from summaries
+        low = self.summary(name, 'min')
+        high = self.summary(name, 'max')
+        if op in {'>', '>='}:
+            candidates = compare(high, value)
+        elif op in {'<', '<='}:
+            candidates = compare(low, value)
+        elif op == '==':
+            candidates = (low <= value) & (value <= high)
+        else:
+            candidates = ~((low == value) & (high == value))
+
+        # restrict search to the desired times
+        steps = numpy.zeros(len(candidates), dtype=bool)
+        steps[_get_indices(self, times)] = True
+        candidates &= steps[:, numpy.newaxis]
+
+        # search only the candidate blocks of each member with candidates
+        found = []
+        for step in numpy.flatnonzero(candidates.any(1)):
+            blocks = numpy.flatnonzero(candidates[step])
+            field = getattr(self._data[step], name) # pylint: disable=no-member
+            block, *cells = numpy.nonzero(compare(field[blocks], value))
+            found.append((numpy.full(len(block), step), blocks[block], *cells))
+
+        if not found:
+            return tuple(numpy.array([], dtype=int) for _ in range(5))
+        return tuple(numpy.concatenate(index) for index in zip(*found))
+
+
+class LRUDict:
+    """
+    LRUDict is a custom collection implementing a mapping with a bounded memory footprint.
+
+    LRUDict is a mutable mapping of hashable keys to (typically numpy array) values,
+    providing the following functionality:
+    (1) Dictionary-like fast mappable access,
+    (2) Collection remains ordered from least to most recently used item,
+    (3) Least recently used items are evicted once the byte budget is exceeded,
+    (4) Items may be pinned (and unpinned), such that they are never evicted,
+    (5) Hit, miss, and eviction counters are tracked for every lookup.
+
+    +------------------------------------------------------------------------+
+    |Map-like behavior                                                       |
+    +======================+=================================================+
+    |get(key[, default])   |Return the value for key and mark it as recently |
+    |                      |used, if key is in the collection, else default  |
+    +----------------------+-------------------------------------------------+
+    |put(key, value)       |Insert or overwrite the value for key, evicting  |
+    |                      |least recently used items as necessary           |
+    +----------------------+-------------------------------------------------+
+    |peek(key[, default])  |Return the value for key, else default; without  |
+    |                      |updating the counters or the order of use        |
+    +----------------------+-------------------------------------------------+
+    |pop(key[, default])   |Remove and return the value for key, else default|
+    +----------------------+-------------------------------------------------+
+    |pin(key), unpin(key)  |Mark (or unmark) the item as never to be evicted |
+    +----------------------+-------------------------------------------------+
+    |pinned(key)           |Return whether the item is pinned                |
+    +----------------------+-------------------------------------------------+
+    |clear()               |Removes all the items from the collection        |
+    +----------------------+-------------------------------------------------+
+    |stats()               |Returns the counters and byte usage (including   |
+    |                      |the pinned items) as a dict                      |
+    +----------------------+-------------------------------------------------+
+
+    .. Note::
+       The most recently inserted item is never evicted, even if it alone exceeds the budget;
+       therefore a budget smaller than a single item results in a collection of one item.
+
+       Pinned items are held outside of the budget until unpinned; an unpinned item may then be
+       evicted upon the next insertion, in order of use.
+
+    Attributes:
+        max_bytes: byte budget of the collection; None results in no eviction
+        nbytes: bytes currently held by the collection
+        hits: number of lookups which found the key in the collection
+        misses: number of lookups which did not find the key in the collection
+        evictions: number of items removed from the collection to satisfy the budget
+        _data: Internal ordered dictionary storing the items of the LRUDict
+        _sizes: Internal dictionary storing the size in bytes of each item
+        _pinned: Internal set of keys which are not allowed to be evicted
+        _sizer: Internal function used to determine the size in bytes of an item
+        _lock: Internal reentrant lock used to allow access from multiple threads
+    """
+    max_bytes: Optional[float]
+    nbytes: int
+    hits: int
+    misses: int
+    evictions: int
+    _data: 'OrderedDict[Hashable, Any]'
+    _sizes: Dict[Hashable, int]
+    _pinned: set
+    _sizer: Callable[[Any], int]
+    _lock: RLock
+
+    def __init__(self, max_bytes: Optional[float] = None, *,
+                 sizer: Optional[Callable[[Any], int]] = None) -> None:
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._data = OrderedDict()
+        self._sizes = {}
+        self._pinned = set()
+        self._sizer = sizer if sizer is not None else lambda value: getattr(value, 'nbytes', 0)
+        self._lock = RLock()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __iter__(self):
+        yield from list(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return (f'LRUDict(items={len(self._data)}, nbytes={self.nbytes}, max_bytes={self.max_bytes}, '
+                f'hits={self.hits}, misses={self.misses}, evictions={self.evictions})')
+
+    def _evict(self, keep: Hashable) -> None:
+        if self.max_bytes is None:
+            return
+        for key in list(self._data):
+            if self.nbytes <= self.max_bytes:
+                break
+            if key == keep or key in self._pinned:
+                continue
+            self.nbytes -= self._sizes.pop(key)
+            del self._data[key]
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """
+        Clears all items from the collection; counters are retained.
+
+        Same as dict.clear().
+
+        Args:
+            None
+
+        Returns:
+            None
+
+        """
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self._pinned.clear()
+            self.nbytes = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the value for key if key is in the collection, else default;
+        a found item is marked as the most recently used item.
+
+        Same as dict.get(key[, default]); except for the counters being updated.
+
+        Args:
+            key: Unique key of the item to be returned
+            default (optional): Return value if key is not in the collection
+
+        Returns:
+            The value at key if found, else, the default value.
+
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def keys(self):
+        """
+        Returns the keys in the collection; ordered from least to most recently used.
+
+        Same as dict.keys().
+
+        Args:
+            None
+
+        Returns:
+            List of keys (as iterator) in the collection.
+
+        """
+        yield from list(self._data)
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the value for key if key is in the collection, else default;
+        neither the counters nor the order of use are updated.
+
+        Args:
+            key: Unique key of the item to be returned
+            default (optional): Return value if key is not in the collection
+
+        Returns:
+            The value at key if found, else, the default value.
+
+        """
+        return self._data.get(key, default)
+
+    def pin(self, key: Hashable) -> None:
+        """
+        Mark an item in the collection as never to be evicted.
+
+        Args:
+            key: Unique key of the item to be pinned
+
+        Returns:
+            None
+
+        """
+        with self._lock:
+            if key not in self._data:
+                raise KeyError(f'Key is not in collection; cannot pin {key}')
+            self._pinned.add(key)
+
+    def pinned(self, key: Hashable) -> bool:
+        """
+        Return whether an item in the collection is marked as never to be evicted.
+
+        Args:
+            key: Unique key of the item
+
+        Returns:
+            True if the item is pinned, else, False.
+
+        """
+        return key in self._pinned
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """
+        If key is in the collection, remove it and return its value, else return default.
+
+        Same as dict.pop(key[, default]); except a KeyError is never raised.
+
+        Args:
+            key: Unique key of the item to be removed
+            default (optional): Return value if key is not in the collection
+
+        Returns:
+            Value of the item removed from the collection, if found, else, default.
+
+        """
+        with self._lock:
+            if key not in self._data:
+                return default
+            self.nbytes -= self._sizes.pop(key)
+            self._pinned.discard(key)
+            return self._data.pop(key)
+
+    def put(self, key: Hashable, value: Any, *, pinned: bool = False) -> None:
+        """
+        Insert or overwrite the value for key as the most recently used item, and
+        subsequently evict the least recently used items until the budget is satisfied.
+
+        Args:
+            key: Unique key of the item to be added to the collection
+            value: Value of the item to be added to the collection
+            pinned (optional): Whether the item is never to be evicted
+
+        Returns:
+            None
+
+        """
+        with self._lock:
+            self.pop(key)
+            self._data[key] = value
+            self._sizes[key] = int(self._sizer(value))
+            self.nbytes += self._sizes[key]
+            if pinned:
+                self._pinned.add(key)
+            self._evict(key)
+
+    def stats(self) -> Dict[str, Union[int, float, None]]:
+        """
+        Returns the counters and the memory footprint of the collection.
+
+        Args:
+            None
+
+        Returns:
+            A dict containing the items, nbytes, max_bytes, pinned (items), pinned_nbytes, hits, misses,
+            and evictions.
+
+        """
+        with self._lock:
+            return {'items': len(self._data), 'nbytes': self.nbytes, 'max_bytes': self.max_bytes,
+                    'pinned': len(self._pinned), 'pinned_nbytes': sum(self._sizes[key] for key in self._pinned),
+                    'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions}
+
+    def unpin(self, key: Hashable) -> None:
+        """
+        Unmark an item in the collection as never to be evicted; the item is retained,
+        but may be evicted (in order of use) once the budget is exceeded.
+
+        Args:
+            key: Unique key of the item to be unpinned
+
+        Returns:
+            None
+
+        """
+        with self._lock:
+            if key not in self._data:
+                raise KeyError(f'Key is not in collection; cannot unpin {key}')
+            self._pinned.discard(key)
@@ -0,0 +1,187 @@
+"""
+
+This module defines the columnar custom type necessary for the pyio package.
+
+The ColumnData type stores the scalar and dynamic data of a time series as a
+single numpy array per named quantity spanning all of the processed hdf5 output
+files; providing vectorized selection by time or index, rather than requiring
+iteration over the per-file ScalarData and StaticData objects.
+
+This module currently defines the following type:
+
+    ColumnData
+
+Example:
+    An example use of a ColumnData built from the scalars and dynamics of a
+    SimulationData instance is as follows::
+
+        columns = ColumnData.from_collections(data.scalars, data.dynamics)
+
+        t, dt = columns['t', 'dt']
+        time = columns.select('real_scalars', times=slice(20.0, 60.0))['time']
+
+Todo:
+
+"""
+from typing import Any, Tuple, List, Dict, Iterable, Union
+
+import numpy
+
+
+Type_Column = Union[numpy.ndarray, Dict[str, numpy.ndarray]]
+
+
+class ColumnData:
+    """
+    ColumnData is a custom type implementing a columnar store of time series data.
+
+    Each named quantity is stored as a numpy array along the time axis; quantities which
+    are collections of named values for each time (e.g., the real_scalars dynamics) are
+    stored as a dictionary of numpy arrays, one for each named value.
+
+    +------------------------------------------------------------------------------------------+
+    |Usage                                                                                     |
+    +===============================+==========================================================+
+    |cd['name']                     |Returns the column (or group of columns) of name          |
+    +-------------------------------+----------------------------------------------------------+
+    |cd['name', ...]                |Returns a list of the columns of each name                |
+    +-------------------------------+----------------------------------------------------------+
+    |cd.indices(times)              |Returns the indices matching a time-like specification    |
+    +-------------------------------+----------------------------------------------------------+
+    |cd.select('name', times)       |Returns the column of name restricted to times            |
+    +-------------------------------+----------------------------------------------------------+
+
+    The time-like specification follows the same conventions as indexing a SortedDict; integers
+    and slices of integers are positional, while floats and slices of floats are keys (times) where
+    a single float selects the first time not less than the float and a slice selects the closed interval.
+
+    Note:
+        A single float beyond the last time raises a KeyError; where the sorted collections (e.g., data.scalars)
+        raise a StopIteration, rather than return an empty result, as no entry is selected.
+
+    Attributes:
+        keys: sorted time (key) of each entry of the columns
+        _columns: named columns, or groups of named columns, of the store
+    """
+    keys: numpy.ndarray
+    _columns: Dict[str, Type_Column]
+
+    def __init__(self, keys: Iterable[float], columns: Dict[str, Type_Column]) -> None:
+        self.keys = numpy.asarray(keys, dtype=float)
+        self._columns = columns
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._columns
+
+    def __getitem__(self, name: Union[str, Tuple[str]]) -> Union[Type_Column, List[Type_Column]]:
+        if isinstance(name, str):
+            return self._columns[name]
+        elif hasattr(name, '__iter__'):
+            return [self._columns[key] for key in name]
+        else:
+            raise TypeError(f'{self.__class__.__name__} indices must be strings or an iterable of such')
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __repr__(self) -> str:
+        return f'{self.__class__.__name__}(length={len(self)}, columns={self.names()})'
+
+    @classmethod
+    def from_collections(cls, *collections: Iterable[Any]) -> 'ColumnData':
+        """
+        Class method used to build a columnar store from one or more collections (e.g., SortedDict)
+        of data objects; each named data field of the members becomes a column.
+
+        Args:
+            collections: sorted collections of data objects with matching keys
+
+        Returns:
+            An instance of ColumnData from args.
+        """
+        keys: List[float] = []
+        columns: Dict[str, Type_Column] = {}
+        for collection in collections:
+            items = list(collection)
+            if not items:
+                continue
+            if keys and [item.key for item in items] != keys:
+                raise ValueError(f'Collections provided must have identical keys')
+            keys = [item.key for item in items]
+            for name in sorted(items[0].keys()):
+                if name in columns:
+                    raise ValueError(f'Nonunique column name provided; {name} in multiple collections')
+                values = [item[name] for item in items]
+                if isinstance(values[0], dict):
+                    columns[name] = {key: numpy.array([value[key] for value in values]) for key in values[0]}
+                else:
+                    columns[name] = numpy.array(values)
+        return cls(keys, columns)
+
+    def indices(self, times: Union[int, float, slice, Iterable] = slice(None)) -> numpy.ndarray:
+        """
+        Provides the (vectorized) indices of the entries matching a time-like specification.
+
+        Args:
+            times: time-like specification; integers, floats, slices, or an iterable of such (optional)
+
+        Returns:
+            An array of the indices of the matching entries
+
+        Raises:
+            KeyError: if a single float is beyond the last time
+        """
+        positions = numpy.arange(len(self.keys))
+
+        # dictionary-like behavior
+        if isinstance(times, float):
+            start = numpy.searchsorted(self.keys, times, 'left')
+            if start == len(self.keys):
+                raise KeyError(f'Provided time {times} is beyond the last key {self.keys[-1]}')
+            return positions[start:start + 1]
+
+        # list-like behavior
+        elif isinstance(times, (int, numpy.integer)):
+            return positions[[times]]
+
+        # slicing behavior; both list and dict** like
+        elif isinstance(times, slice):
+            if isinstance(times.start, float) or isinstance(times.stop, float):
+                start = 0 if times.start is None else numpy.searchsorted(self.keys, times.start, 'left')
+                stop = len(self.keys) if times.stop is None else numpy.searchsorted(self.keys, times.stop, 'right')
+                return positions[start:stop:times.step]
+            return positions[times]
+
+        # consume the specification as an iterable
+        elif hasattr(times, '__iter__'):
+            return numpy.concatenate([self.indices(item) for item in times] + [positions[:0]])
+
+        # cannot work with provided specification
+        else:
+            raise TypeError(f'Provided times must be integers, floats, slices, or interable of such')
+
+    def names(self) -> List[str]:
+        """
+        Returns the names of the columns in the store.
+
+        Returns:
+            List of the column names.
+        """
+        return list(self._columns)
+
+    def select(self, name: str, times: Union[int, float, slice, Iterable] = slice(None)) -> Type_Column:
+        """
+        Provides the named column (or group of columns) restricted to a time-like specification.
+
+        Args:
+            name: named column of the store
+            times: time-like specification; integers, floats, slices, or an iterable of such (optional)
+
+        Returns:
+            The column restricted to times; a dictionary of such if the named column is a group
+        """
+        index = self.indices(times)
+        column = self._columns[name]
+        if isinstance(column, dict):
+            return {key: value[index] for key, value in column.items()}
+        return column[index]
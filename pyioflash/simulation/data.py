@@ -15,11 +15,15 @@ from sys import stdout
 
 from pyioflash.simulation.series import NameData, DataPath, data_from_path
 from pyioflash.simulation.utility import (_blocks_from_plane, _blocks_from_line, 
+                                          _blocks_from_planes, _blocks_from_lines,
+                                          _assemble_from_blocks, _scatter_to_blocks,
                                           _get_indices, _get_times, _reduce_str, open_hdf5)
-from pyioflash.simulation.collections import SortedDict, TransposableAsArray, TransposableAsSingle
+from pyioflash.simulation.collections import (SortedDict, TransposableAsArray, TransposableAsSingle,
+                                              Searchable, LRUDict)
 from pyioflash.simulation.geometry import GeometryData
 from pyioflash.simulation.fields import FieldData
 from pyioflash.simulation.scalars import ScalarData
+from pyioflash.simulation.columns import ColumnData
 from pyioflash.simulation.statics import StaticData
 
 
@@ -37,6 +41,10 @@ class Utility:
         times: assists in the lookup of simulation times
         blocks_from_plane: provides blocks from intersecting plane
         blocks_from_line: provides blocks from intersecting line
+        blocks_from_planes: provides blocks from each of many intersecting planes
+        blocks_from_lines: provides blocks from each of many intersecting lines
+        assemble: provides a global array assembled from block data
+        scatter: provides block data scattered from a global array
 
     """
     
@@ -142,13 +150,92 @@ class Utility:
         return _blocks_from_line(self._geometry, axes, values)
 
 
+    def blocks_from_planes(self, axis: str = 'z', 
+                           values: Iterable[float] = (0.0, )) -> Tuple['ndarray', 'ndarray']:
+        """
+        Provides the blocks which are intersected by each of the provided planes, axis = values.
+
+        Attributes:
+            axis: named normal axis of the desired planes (optional)
+            values: points which define each plane (optional)
+
+        Note:
+            Intersections are treated as the open interval, low <= value < high.
+
+            The blocks are provided as (offsets, indices), such that indices[offsets[q]:offsets[q + 1]]
+            are the blocks of the q^th^ plane; and are cached with the geometry data for repeated queries.
+
+        Todo:
+
+        """
+        return _blocks_from_planes(self._geometry, axis, values)
+
+
+    def blocks_from_lines(self, axes: Tuple[str] = ('y', 'z'), 
+                          values: Iterable[Tuple[float]] = ((0.0, 0.0), )) -> Tuple['ndarray', 'ndarray']:
+        """
+        Provides the blocks which are intersected by each of the provided lines, axes = values.
+
+        Attributes:
+            axes: named normal axes of the desired lines (optional)
+            values: points which define the normal planes of each line; [lines, 2] (optional)
+
+        Note:
+            Intersections are treated as the open interval, lows <= values < highs.
+
+            The blocks are provided as (offsets, indices), such that indices[offsets[q]:offsets[q + 1]]
+            are the blocks of the q^th^ line; and are cached with the geometry data for repeated queries.
+
+        Todo:
+
+        """
+        return _blocks_from_lines(self._geometry, axes, values)
+
+
+    def assemble(self, field: 'ndarray') -> 'ndarray':
+        """
+        Provides a global (structured) array assembled from the block data of a field.
+
+        Attributes:
+            field: interior cell block data of a field (e.g., data.fields['temp']); [..., b, k, j, i]
+
+        Note:
+            Any leading axes (e.g., a stack of times; [t, b, k, j, i]) are retained; [..., z, y, x].
+
+            The block permutation is determined once and cached with the geometry data; only
+            uniform and regular (including stretched) grids are supported, which must have a fully 
+            populated lattice of blocks (i.e., blk_num_x by blk_num_y by blk_num_z).
+
+        Todo:
+            Add support for guard cell padded and face centered block data
+
+        """
+        return _assemble_from_blocks(self._geometry, field)
+
+
+    def scatter(self, field: 'ndarray') -> 'ndarray':
+        """
+        Provides the block data of a field scattered from a global (structured) array.
+
+        Attributes:
+            field: global array of the interior cells of a field; [..., z, y, x]
+
+        Note:
+            The reverse of assemble; any leading axes are retained, [..., b, k, j, i].
+
+        Todo:
+
+        """
+        return _scatter_to_blocks(self._geometry, field)
+
+
 class SimulationData:
     """A class providing a data structure to store and an api to process hdf5 output files.
 
-    When a SimulationData instance is created, the provided hdf5 files are opened, read into
-    memory, and subsequently closed. The init method provides this functionality by instanciating
-    the relavent empty collections (as composite objects) and subsequently calling the appropriate
-    import method (e.g., __read_flash4__).::
+    When a SimulationData instance is created, the provided hdf5 files are opened, their metadata read into
+    memory, and subsequently closed; the field data of each file is only read upon first access. The init method
+    provides this functionality by instanciating the relavent empty collections (as composite objects) and
+    subsequently calling the appropriate import method (e.g., __read_flash4__).::
 
         from pyio import SimulationData
 
@@ -166,6 +253,10 @@ class SimulationData:
 
         instance.member[times or indicies]['name', ...][indicies, blocks, z(s), y(s), x(s)]
 
+    The general format for searching the field data, using the block summaries to skip blocks, is::
+
+        instance.fields.where('name', '>', value)  ->  (indicies, blocks, z(s), y(s), x(s))
+
     The general format for accessing the dynamic data is::
 
         instance.dynamic[times or indicies]['name', ...][indicies]
@@ -174,6 +265,11 @@ class SimulationData:
 
         instance.static['name']
 
+    The general format for accessing the scalar or dynamic data as columns (i.e., arrays over all times) is::
+
+        instance.columns['name', ...]
+        instance.columns.select('name', times or indicies)
+
     Wherein the above times / indicies / blocks / x(s) are slices in the python or numpy format and the
     ['name', 'name', ...] may be either a single string or a list of srings associated with member names.
 
@@ -189,7 +285,9 @@ class SimulationData:
         scalars (SortedDict): scalar (e.g., time, dt) data from the processed hdf5 files
         dynamics (SortedDict): time varying information from the processed hdf5 files
         statics (StaticData):  non-time varying information from the processed hdf5 files
+        columns (ColumnData): columnar (one array per quantity) view of the scalars and dynamics
         utility (Utility): collection of helper methods for extending SimulationData functionality
+        residency (LRUDict): collection holding the field data, with hit, miss, and eviction counters
 
     Note:
 
@@ -200,6 +298,16 @@ class SimulationData:
         :class:`~pyioflash.pyio_collections.TransposableAsSingle`. This is done to provide a convienent
         and intuitive indexing syntax for each object.
 
+        If a memory budget is provided (i.e., max_bytes), the least recently used field data are evicted
+        from memory once the budget is exceeded; evicted field data are transparently reloaded, padded, 
+        and guard filled from the hdf5 files on the next access. This allows interactive exploration of
+        a series larger than the available memory, as only the 'hot' timesteps are retained.::
+
+            data = SimulationData.from_list(range(500), path='../out/', max_bytes=32e9,
+                                            header='INS_LidDr_Cavity_hdf5_plt_cnt_')
+
+            data.residency.stats()
+
     """
     files: NameData
     code: str
@@ -209,12 +317,18 @@ class SimulationData:
     scalars: SortedDict
     dynamics: SortedDict
     statics: StaticData
+    columns: ColumnData
     utility: Utility
+    residency: LRUDict
 
-    def __init__(self, files: NameData, *, form: str = None, code: str = None):
+    def __init__(self, files: NameData, *, form: str = None, code: str = None,
+                 max_bytes: Optional[float] = None):
         # initialize filenames
         self.files = files
 
+        # initialize memory budget for field data
+        self.residency = LRUDict(max_bytes)
+
         # initialize code and file type
         self.form = form
         if self.form is None:
@@ -224,7 +338,8 @@ class SimulationData:
             self.code = 'flash'
 
         # initialize empty containers
-        self.fields = type('TransposableAsArray_SortedDict', (TransposableAsArray, SortedDict), {})([])
+        self.fields = type('Searchable_TransposableAsArray_SortedDict', 
+                           (Searchable, TransposableAsArray, SortedDict), {})([])
         self.scalars = type('TransposableAsArray_SortedDict', (TransposableAsArray, SortedDict), {})([])
         self.dynamics = type('TransposableAsSingle_SortedDict', (TransposableAsSingle, SortedDict), {})([])
 
@@ -247,10 +362,36 @@ class SimulationData:
         # intialize utility functions
         self.utility = Utility(self)
 
+    def memory_report(self) -> Dict[str, Any]:
+        """Provides the memory footprint (in bytes) of the SimulationData object by component.
+
+        The geometry and fields components are broken down by named mesh, metric, and field
+        arrays, reporting the guard cell overhead and any cached derived data of each; views into
+        the buffers of other arrays are reported, but not counted in the totals.
+
+        Returns:
+            A dict containing the total owned bytes, a report for each component, and residency statistics
+
+        """
+        report = {'geometry': self.geometry.memory_report(),
+                  'fields': self.fields.memory_report(),
+                  'scalars': self.scalars.memory_report(),
+                  'dynamics': self.dynamics.memory_report(),
+                  'statics': self.statics.memory_report()}
+        report['total'] = sum(component['total'] for component in report.values())
+        report['residency'] = self.residency.stats()
+        return report
+
+    @property
+    def nbytes(self) -> int:
+        """Provides the total bytes owned by the SimulationData object."""
+        return self.memory_report()['total']
+
     @classmethod
     def from_list(cls, numbers: List[int], *, numform: str = None, path: str = None,
                   basename: str = None, header: str = None, footer: str = None, gnumber: int = None,
-                  ext: str = None, form: str = None, code: str = None) -> 'SimulationData':
+                  ext: str = None, form: str = None, code: str = None,
+                  max_bytes: Optional[float] = None) -> 'SimulationData':
         """Creates a SimulationData instance from a list of file numbers.
 
         This class method provides the capability to supply a list of integers associated with
@@ -270,6 +411,7 @@ class SimulationData:
             header: leading file name text
             footer: following file name text
             ext: file name extention (must include '.')
+            max_bytes: memory budget for field data, beyond which arrays are evicted
 
         Returns:
             A data object containing the processed simulation output
@@ -292,7 +434,7 @@ class SimulationData:
         if gnumber is not None:
             options['geonumber'] = gnumber
 
-        return cls(NameData(**options), code=code, form=form)
+        return cls(NameData(**options), code=code, form=form, max_bytes=max_bytes)
 
     def __read_flash4__(self):
         """Method for importing and processing a time series of FLASH4 HDF5 plot or checkpoint files.
@@ -342,8 +484,11 @@ class SimulationData:
             with open_hdf5(name, 'r') as file:
                 stdout.write("Processing file: " + name + "\r")
                 stdout.flush()
-                self.fields.append(FieldData(file, self.code, self.form, self.geometry))
+                self.fields.append(FieldData(file, self.code, self.form, self.geometry, self.residency))
                 self.scalars.append(ScalarData(file, self.code, self.form, def_scalars))
                 self.dynamics.append(StaticData(file, self.code, self.form, def_dynamics))
 
+        # build columnar store of time varying scalar data
+        self.columns = ColumnData.from_collections(self.scalars, self.dynamics)
+
         print("\n\n#############################################################\n\n")
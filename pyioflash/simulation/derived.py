@@ -0,0 +1,231 @@
+"""
+
+This module defines the registry of derived fields necessary for the pyio package.
+
+A derived field is a named quantity computed from the stored field data of a single
+snapshot (e.g., fcx2, temp) and/or other derived fields; once registered, a derived
+field is addressable as if it were stored (e.g., data.fields[t]['vort_z']), and is
+lazily evaluated and cached for each snapshot by the FieldData instance.
+
+This module currently defines the following methods:
+
+    register    -> register a derived field, and its dependencies
+    unregister  -> remove a derived field from the registry
+    registered  -> names of the registered derived fields
+    lookup  --  -> the registered derived field for a name and dimensionality
+    requires    -> stored fields transitively required by a derived field
+    dependents  -> derived fields transitively depending on a stored field
+    evaluate    -> evaluate a derived field for a FieldData instance
+
+This module also registers the following (built-in) derived fields:
+
+    velx, vely, velz    -> velocity components on the cell centered grid
+    kinetic --  --  --  -> total kinetic energy on the cell centered grid
+    vel_mag --  --  --  -> velocity magnitude on the cell centered grid
+    vort_x, vort_y, vort_z  -> vorticity components on the cell centered grid
+
+Todo:
+
+"""
+from dataclasses import dataclass
+from typing import Tuple, List, Dict, Set, Callable, Optional, TYPE_CHECKING
+
+import numpy
+
+if TYPE_CHECKING:
+    from pyioflash.simulation.fields import FieldData
+    from pyioflash.simulation.geometry import GeometryData
+
+
+@dataclass(frozen=True)
+class DerivedField:
+    """
+    DerivedField is a class describing a registered derived field.
+
+    Attributes:
+        name: name by which the derived field is addressed
+        function: called as function(geometry, *inputs) to evaluate the derived field
+        depends: names of the stored (or derived) fields provided, in order, as inputs
+        dimension: dimensionality of simulations for which the definition applies; all if None
+
+    Note:
+        A stored field dependency named with a leading underscore (e.g., _fcx2) is provided
+        including the guard cells; otherwise the interior (e.g., fcx2) is provided.
+    """
+    name: str
+    function: Callable[..., numpy.ndarray]
+    depends: Tuple[str, ...]
+    dimension: Optional[int] = None
+
+
+# registered derived fields; by name and dimensionality
+_REGISTRY: Dict[str, Dict[Optional[int], DerivedField]] = {}
+
+
+def register(name: str, function: Optional[Callable[..., numpy.ndarray]] = None, *,
+             depends: Tuple[str, ...], dimension: Optional[int] = None,
+             replace: bool = False) -> Callable:
+    """
+    Provides a method to register a derived field; usable as a decorator.
+
+    Attributes:
+        name: name by which the derived field is addressed
+        function: called as function(geometry, *inputs) to evaluate the derived field (optional)
+        depends: names of the stored (or derived) fields provided, in order, as inputs
+        dimension: dimensionality of simulations for which the definition applies (optional)
+        replace: whether to replace an existing definition (optional)
+
+    Note:
+        A name may be registered once for each dimensionality (e.g., for 2 and 3 velocity components);
+        the definition for the dimensionality of the simulation is preferred over one for all (None).
+
+        The result should be a numpy array on the interior cells of each block; [blks, k, j, i].
+    """
+    def decorator(function: Callable[..., numpy.ndarray]) -> Callable[..., numpy.ndarray]:
+        definitions = _REGISTRY.setdefault(name, {})
+        if dimension in definitions and not replace:
+            raise ValueError(f'Derived field {name} is already registered; must specify replace=True!')
+        definitions[dimension] = DerivedField(name, function, tuple(depends), dimension)
+        return function
+
+    return decorator if function is None else decorator(function)
+
+
+def unregister(name: str, dimension: Optional[int] = None) -> None:
+    """Provides a method to remove a derived field (for a dimensionality) from the registry."""
+    definitions = _REGISTRY.get(name, {})
+    definitions.pop(dimension, None)
+    if not definitions:
+        _REGISTRY.pop(name, None)
+
+
+def registered() -> List[str]:
+    """Provides the names of the registered derived fields."""
+    return sorted(_REGISTRY)
+
+
+def lookup(name: str, dimension: int) -> Optional[DerivedField]:
+    """Provides the registered derived field for a name and dimensionality, if any."""
+    definitions = _REGISTRY.get(name, {})
+    return definitions.get(dimension, definitions.get(None))
+
+
+def requires(name: str, dimension: int, groups: Set[str]) -> Set[str]:
+    """
+    Provides the names of the stored fields transitively required to evaluate a derived field.
+
+    Attributes:
+        name: name of the derived field
+        dimension: dimensionality of the simulation
+        groups: names of the stored fields available
+
+    Note:
+        A ValueError is raised if a (transitive) dependency is neither stored nor registered,
+        or if the dependencies are circular.
+    """
+    return _requires(name, dimension, groups, ())
+
+
+def _requires(name: str, dimension: int, groups: Set[str], chain: Tuple[str, ...]) -> Set[str]:
+    """Method (internal) provided to traverse the dependencies of a derived field; see requires."""
+    if name in chain:
+        raise ValueError(f'Circular dependency of derived field {name}; {" -> ".join(chain + (name, ))}')
+    definition = lookup(name, dimension)
+    if definition is None:
+        raise ValueError(f'Derived field {name} is not registered for {dimension}d simulations!')
+
+    stored = set()
+    for depend in definition.depends:
+        if depend.lstrip('_') in groups:
+            stored.add(depend.lstrip('_'))
+        else:
+            stored.update(_requires(depend, dimension, groups, chain + (name, )))
+    return stored
+
+
+def dependents(group: str, dimension: int, groups: Set[str]) -> Set[str]:
+    """Provides the names of the derived fields transitively depending on a stored field."""
+    names = set()
+    for name in _REGISTRY:
+        try:
+            if group in requires(name, dimension, groups):
+                names.add(name)
+        except ValueError:
+            pass
+    return names
+
+
+def evaluate(instance: 'FieldData', name: str) -> numpy.ndarray:
+    """
+    Provides a method to evaluate a derived field for a FieldData instance.
+
+    Attributes:
+        instance: FieldData of a snapshot for which to evaluate the derived field
+        name: name of the derived field
+
+    Note:
+        The inputs are retrieved from the instance; such that stored fields are (re)loaded only
+        if required, and derived inputs are themselves lazily evaluated and cached.
+    """
+    geometry = instance._geometry
+    requires(name, geometry.grd_dim, instance._groups)
+    definition = lookup(name, geometry.grd_dim)
+    return definition.function(geometry, *(getattr(instance, depend) for depend in definition.depends))
+
+
+# register the built-in derived fields; addressable as if stored (e.g., data.fields[t]['vort_z']), the kernels
+# are imported upon evaluation as the post-processing subpackage itself depends on the simulation subpackage
+@register('velx', depends=('_fcx2', ))
+def _derived_velx(geometry: 'GeometryData', fcx: numpy.ndarray) -> numpy.ndarray:
+    """Provides the (derived) x velocity component on the cell centered grid"""
+    from pyioflash.postprocess.utility import _interpolate_ftc # pylint: disable=import-outside-toplevel
+    return _interpolate_ftc(fcx, 0, geometry.blk_guards, geometry.grd_dim)
+
+
+@register('vely', depends=('_fcy2', ))
+def _derived_vely(geometry: 'GeometryData', fcy: numpy.ndarray) -> numpy.ndarray:
+    """Provides the (derived) y velocity component on the cell centered grid"""
+    from pyioflash.postprocess.utility import _interpolate_ftc # pylint: disable=import-outside-toplevel
+    return _interpolate_ftc(fcy, 1, geometry.blk_guards, geometry.grd_dim)
+
+
+@register('velz', depends=('_fcz2', ), dimension=3)
+def _derived_velz(geometry: 'GeometryData', fcz: numpy.ndarray) -> numpy.ndarray:
+    """Provides the (derived) z velocity component on the cell centered grid"""
+    from pyioflash.postprocess.utility import _interpolate_ftc # pylint: disable=import-outside-toplevel
+    return _interpolate_ftc(fcz, 2, geometry.blk_guards, geometry.grd_dim)
+
+
+@register('kinetic', depends=('_fcx2', '_fcy2'), dimension=2)
+@register('kinetic', depends=('_fcx2', '_fcy2', '_fcz2'), dimension=3)
+def _derived_kinetic(geometry: 'GeometryData', *components: numpy.ndarray) -> numpy.ndarray:
+    """Provides the (derived) total kinetic energy on the cell centered grid; see energy.kinetic"""
+    from pyioflash.postprocess.utility import _kinetic_ftc # pylint: disable=import-outside-toplevel
+    return _kinetic_ftc(list(components), geometry.blk_guards, geometry.grd_dim)
+
+
+@register('vel_mag', depends=('kinetic', ))
+def _derived_vel_mag(geometry: 'GeometryData', kinetic: numpy.ndarray) -> numpy.ndarray:
+    """Provides the (derived) velocity magnitude on the cell centered grid"""
+    return numpy.sqrt(kinetic)
+
+
+@register('vort_x', depends=('_fcy2', '_fcz2'), dimension=3)
+def _derived_vort_x(geometry: 'GeometryData', fcy: numpy.ndarray, fcz: numpy.ndarray) -> numpy.ndarray:
+    """Provides the (derived) x vorticity component on the cell centered grid; dw/dy - dv/dz"""
+    from pyioflash.postprocess.elements.derivative import _derivative # pylint: disable=import-outside-toplevel
+    return _derivative(geometry, fcz, 1, 'z') - _derivative(geometry, fcy, 2, 'y')
+
+
+@register('vort_y', depends=('_fcx2', '_fcz2'), dimension=3)
+def _derived_vort_y(geometry: 'GeometryData', fcx: numpy.ndarray, fcz: numpy.ndarray) -> numpy.ndarray:
+    """Provides the (derived) y vorticity component on the cell centered grid; du/dz - dw/dx"""
+    from pyioflash.postprocess.elements.derivative import _derivative # pylint: disable=import-outside-toplevel
+    return _derivative(geometry, fcx, 2, 'x') - _derivative(geometry, fcz, 0, 'z')
+
+
+@register('vort_z', depends=('_fcx2', '_fcy2'))
+def _derived_vort_z(geometry: 'GeometryData', fcx: numpy.ndarray, fcy: numpy.ndarray) -> numpy.ndarray:
+    """Provides the (derived) z vorticity component on the cell centered grid; dv/dx - du/dy"""
+    from pyioflash.postprocess.elements.derivative import _derivative # pylint: disable=import-outside-toplevel
+    return _derivative(geometry, fcy, 0, 'y') - _derivative(geometry, fcx, 1, 'x')
@@ -12,19 +12,21 @@ the hdf5 output files catagorically:
 
 Todo:
     * Check if velocity date is in file -- and provide better names for them
-    * Provide differed or Just-In-Time block data loading for large simulations
+    * Provide Just-In-Time block data loading for large simulations
 
 """
 from dataclasses import dataclass, field, InitVar
-from typing import Tuple, List, Set
+from typing import Any, Tuple, List, Dict, Set, Optional
 from functools import partial
 
 import numpy
 import h5py
 
+from pyioflash.simulation import derived
 from pyioflash.simulation.types import _BaseData
 from pyioflash.simulation.geometry import GeometryData
-from pyioflash.simulation.utility import _first_true, _reduce_str
+from pyioflash.simulation.collections import LRUDict
+from pyioflash.simulation.utility import _parameters_from_file, _memory_entry, _memory_total, open_hdf5
 from pyioflash.simulation.support import _guard_cells_from_data, _bound_cells_from_data
 
 @dataclass
@@ -36,20 +38,51 @@ class FieldData(_BaseData):
 
     Attributes:
         geometry: (InitVar) corrisponding GeometryData instance required for initialization
+        residency: (InitVar) collection in which to hold the field data; possibly shared (optional)
         _groups: set of named field data in the hdf4 output file
+        _guards: number of guard cells for each block per direction
+        _filename: name of the hdf5 output file used to reload evicted field data
+        _geometry: corrisponding GeometryData instance used to reload evicted field data
+        _residency: collection holding the (guard filled) field data of the instance
+        _derived: cached data derived from the field data of the instance
+        _version: number of times the field data of the instance has been set
 
     Notes:
         The FieldData instance also contains attributes corrisponding to each named
         field in the output file (i.e., _groups) that is created dynamically as the
-        hdf5 output file is read.
+        hdf5 output file is opened; the named field data is only read from the file
+        (and guard filled) upon first access.
 
         The field data attributes return the named field data for each block
         without filling in relavent guard cell neighbor data; if this data is
         desired, the attribute name should be prepended with an underscore.
+
+        The field data is held in the residency collection rather than on the instance;
+        if the collection has a memory budget, least recently used field data may be evicted
+        and is transparently reloaded (and guard filled) from the hdf5 file on the next access.
+        Field data modified using the attribute setters is pinned, and will not be evicted until unpinned;
+        once unpinned (see unpin) and evicted, the modifications are lost and the field data is reloaded
+        from the hdf5 file (with its summaries, and dependent derived fields, recomputed).
+
+        Summary statistics (i.e., min, max, sum, and mean) of the field data, excluding guard cells,
+        are computed for each block as the named field data is first read, and recomputed whenever
+        the field data is set; see the summary method. Likewise, the extrema attributes of each named
+        field (e.g., temp_max, or _temp_max including guard cells) are provided once the field is read.
+
+        Registered derived fields (e.g., vort_z) are addressable as attributes (or items) as if stored;
+        each is evaluated on first access from the fields it depends on, and is held in the residency
+        collection (evictable) until one of the stored fields it transitively depends on is set; see
+        pyioflash.simulation.derived.
     """
     geometry: InitVar[GeometryData]
+    residency: InitVar[Optional[LRUDict]] = None
     _groups: Set[str] = field(repr=True, init=False, compare=False)
     _guards: int = field(repr=False, init=False, compare=False)
+    _filename: str = field(repr=False, init=False, compare=False)
+    _geometry: GeometryData = field(repr=False, init=False, compare=False)
+    _residency: LRUDict = field(repr=False, init=False, compare=False)
+    _derived: Dict[str, Any] = field(repr=False, init=False, compare=False, default_factory=dict)
+    _version: int = field(repr=False, init=False, compare=False, default=0)
 
     @staticmethod
     def _fill_guard(data, geometry, field):
@@ -57,17 +90,23 @@ class FieldData(_BaseData):
         #_bound_cells_from_data(data, geometry, field)      
 
     # pylint: disable=arguments-differ
-    def _init_process(self, file: h5py.File, code: str, form: str, geometry: GeometryData) -> None:
+    def _init_process(self, file: h5py.File, code: str, form: str, geometry: GeometryData,
+                      residency: Optional[LRUDict] = None) -> None:
 
         # pull relavent data from hdf5 file object
-        real_scalars: List[Tuple[bytes, float]] = list(file['real scalars'])
+        real_scalars: Dict[str, float] = _parameters_from_file(file, 'real scalars')
         unknown_names: List[bytes] = list(file['unknown names'][:, 0])
 
         # initialize number of guard cells for each block per direction
         self._guards = geometry.blk_guards
 
+        # initialize source of field data and where to hold it
+        self._filename = file.filename
+        self._geometry = geometry
+        self._residency = residency if residency is not None else LRUDict()
+
         # initialize mappable keys
-        self.key = float(_first_true(real_scalars, lambda l: 'time' in str(l[0]))[1])
+        self.key = float(real_scalars['time'])
 
         # initialize named fields
         self._groups = {k.decode('utf-8') for k in unknown_names}
@@ -81,6 +120,19 @@ class FieldData(_BaseData):
             else:
                 pass
 
+        # initialize field data members; datasets are read from file upon first access
+        for group in self._groups:
+            setattr(FieldData, '_' + group, property(partial(FieldData._get_data, group=group),
+                                                     partial(FieldData._set_data, group=group)))
+            setattr(FieldData, group, property(partial(FieldData._get_attr, attr='_' + group),
+                                               partial(FieldData._set_attr, attr='_' + group)))
+
+        # initialize list of class member names holding the data
+        setattr(self, '_attributes', {group for group in self._groups})
+
+    def _read_group(self, file: h5py.File, group: str) -> numpy.ndarray:
+        """Reads a named field from the hdf5 file, padded with guard data and filled."""
+
         # initialize field names and shapes (for face centered data)
         g = int(self._guards / 2)
         vel_grp = {'fcx2', 'fcy2', 'fcz2'}
@@ -88,50 +140,168 @@ class FieldData(_BaseData):
                    'fcy2' : [2*g, 1*g, 2*g],
                    'fcz2' : [1*g, 2*g, 2*g]}
 
-        # initialize field data members (for cell centered data)
-        for group in self._groups:
+        # allow for guard data at axis upper extent
+        shape = file[group].shape
+        if group not in vel_grp:
+            shape = tuple([shape[0]]) + tuple([length + 2 for length in shape[1:]])
+        else:
+            shape = tuple([shape[0]]) + tuple([length +
+                                               vel_map[group][i] for i, length in enumerate(shape[1:])])
 
-            # allow for guard data at axis upper extent
-            shape = file[group].shape
-            if group not in {'fcx2', 'fcy2', 'fcz2'}:
-                shape = tuple([shape[0]]) + tuple([length + 2 for length in shape[1:]])
-            else:
-                shape = tuple([shape[0]]) + tuple([length +
-                                                   vel_map[group][i] for i, length in enumerate(shape[1:])])
-
-            # read dataset from file
-            data = numpy.zeros(shape, dtype=numpy.dtype(float))
-            if group not in vel_grp:
-                data[:, g:-g, g:-g, g:-g] = file[group][()]
-            elif group == 'fcx2':
-                data[:, g:-g, g:-g, g-1:-g] = file[group][()]
-            elif group == 'fcy2':
-                data[:, g:-g, g-1:-g, g:-g] = file[group][()]
-            elif group == 'fcz2':
-                data[:, g-1:-g, g:-g, g:-g] = file[group][()]
-            else:
-                raise Exception(f'requested field not found!')
+        # read dataset from file
+        data = numpy.zeros(shape, dtype=numpy.dtype(float))
+        if group not in vel_grp:
+            data[:, g:-g, g:-g, g:-g] = file[group][()]
+        elif group == 'fcx2':
+            data[:, g:-g, g:-g, g-1:-g] = file[group][()]
+        elif group == 'fcy2':
+            data[:, g:-g, g-1:-g, g:-g] = file[group][()]
+        elif group == 'fcz2':
+            data[:, g-1:-g, g:-g, g:-g] = file[group][()]
+        else:
+            raise Exception(f'requested field not found!')
 
-            # fill guard and bound cell data
-            FieldData._fill_guard(data, geometry, group)
+        # fill guard and bound cell data
+        FieldData._fill_guard(data, self._geometry, group)
 
-            # attach dataset to FieldData instance
-            setattr(self, '_' + group, data)
-            setattr(FieldData, group, property(partial(FieldData._get_attr, attr='_' + group),
-                                               partial(FieldData._set_attr, attr='_' + group)))
+        return data
+
+    def _summarize(self, group: str, data: numpy.ndarray) -> None:
+        """Computes the block summaries and extrema of the named field data, excluding guard cells."""
+        g = int(self._guards / 2)
+        interior = data[:, g:-g, g:-g, g:-g]
+        summary = {'min': interior.min((1, 2, 3)), 'max': interior.max((1, 2, 3)),
+                   'sum': interior.sum((1, 2, 3))}
+        summary['mean'] = summary['sum'] / interior[0].size
+        self._derived.setdefault('summaries', {})[group] = summary
 
-            # attach extrema of dataset to FieldData instance
-            setattr(self, '_' + group + '_max', data.max())
-            setattr(self, group + '_max', data[:, g:-g, g:-g, g:-g].max())
-            setattr(self, '_' + group + '_min', data.min())
-            setattr(self, group + '_min', data[:, g:-g, g:-g, g:-g].min())
+        setattr(self, '_' + group + '_max', data.max())
+        setattr(self, group + '_max', summary['max'].max())
+        setattr(self, '_' + group + '_min', data.min())
+        setattr(self, group + '_min', summary['min'].min())
 
-        # initialize list of class member names holding the data
-        setattr(self, '_attributes', {group for group in self._groups})
+    def _get_data(self, group):
+        if group not in self._groups:
+            raise AttributeError(f'{type(self).__name__} object has no field {group}')
+        data = self._residency.get((self._filename, group))
+        if data is None:
+            with open_hdf5(self._filename, 'r') as file:
+                data = self._read_group(file, group)
+            self._residency.put((self._filename, group), data)
+
+            # modifications of unpinned (and since evicted) field data are lost upon reload
+            if group in self._derived.get('modified', set()):
+                self._derived['modified'].discard(group)
+                self._forget_derived(group)
+                self._summarize(group, data)
+                self._version += 1
+        if group not in self._derived.get('summaries', {}):
+            self._summarize(group, data)
+        return data
+
+    def _set_data(self, value, group):
+        if group not in self._groups:
+            raise AttributeError(f'{type(self).__name__} object has no field {group}')
+        self._residency.put((self._filename, group), value, pinned=True)
+        self._derived.setdefault('modified', set()).add(group)
+        self._forget_derived(group)
+        self._summarize(group, value)
+        self._version += 1
+
+    def __getattr__(self, name):
+        # only called if not a member; extrema of field data are provided once the field is first read
+        if '_groups' in self.__dict__ and name.endswith(('_max', '_min')) and name.lstrip('_')[:-4] in self._groups:
+            self._get_data(name.lstrip('_')[:-4])
+            return self.__dict__[name]
+
+        # registered derived fields are addressable as if stored
+        if name.startswith('_') or '_geometry' not in self.__dict__ or \
+                derived.lookup(name, self._geometry.grd_dim) is None:
+            raise AttributeError(f'{type(self).__name__} object has no attribute {name}')
+        try:
+            return self._get_derived(name)
+        except ValueError as error:
+            raise AttributeError(f'{type(self).__name__} object cannot derive {name}; {error}') from error
+
+    def _get_derived(self, name):
+        data = self._residency.get((self._filename, 'derived', name))
+        if data is None:
+            data = derived.evaluate(self, name)
+            self._residency.put((self._filename, 'derived', name), data)
+        return data
+
+    def _forget_derived(self, group):
+        for name in derived.dependents(group, self._geometry.grd_dim, self._groups):
+            self._residency.pop((self._filename, 'derived', name))
+
+    def summary(self, name: str, stat: str) -> numpy.ndarray:
+        """
+        Method to return a summary statistic of the named field data for each block;
+        as computed when the field was first read (or last set), excluding guard cells.
+
+        Args:
+            name: named field data (i.e., member of _groups)
+            stat: summary statistic to return [min, max, sum, mean]
+
+        Returns:
+            An array of the summary statistic for each block, [blocks]
+        """
+        if name in self._groups and name not in self._derived.get('summaries', {}):
+            self._get_data(name)
+        try:
+            return self._derived['summaries'][name][stat]
+        except KeyError:
+            raise KeyError(f'No {stat} summary available for field {name}; '
+                           f'must specify a member of {self._groups} and {{min, max, sum, mean}}')
+
+    def memory_report(self) -> Dict[str, Any]:
+        """
+        Method to return the memory footprint (in bytes) of the field data, by named field;
+        including the guard cell overhead and whether or not each field is currently resident (or pinned).
+
+        Returns:
+            A dict containing the total owned bytes, the pinned bytes, an entry for each field, and cached
+            derived data.
+        """
+        fields = {}
+        for group in self._groups:
+            data = self._residency.peek((self._filename, group))
+            if data is None:
+                fields[group] = {'nbytes': 0, 'owned': True, 'guard': 0, 'resident': False, 'pinned': False}
+            else:
+                pinned = self._residency.pinned((self._filename, group))
+                fields[group] = dict(_memory_entry(data, self._guards), resident=True, pinned=pinned)
+        cached = {name: _memory_entry(value) for name, value in self._derived.items()}
+        for name in derived.registered():
+            data = self._residency.peek((self._filename, 'derived', name))
+            if data is not None:
+                cached[name] = dict(_memory_entry(data), resident=True)
+        pinned = sum(entry['nbytes'] for entry in fields.values() if entry['pinned'])
+        return {'total': _memory_total(fields) + _memory_total(cached), 'pinned': pinned,
+                'fields': fields, 'derived': cached}
+
+    def unpin(self, *names: str) -> None:
+        """
+        Method to allow modified (i.e., set) field data to be evicted from the residency collection;
+        once evicted, the modifications are lost and the field data is reloaded from the hdf5 file.
+
+        Args:
+            names: named field data to unpin; all of the modified field data if none are provided
+        """
+        for group in names or sorted(self._derived.get('modified', set())):
+            if group not in self._groups:
+                raise AttributeError(f'{type(self).__name__} object has no field {group}')
+            if (self._filename, group) in self._residency:
+                self._residency.unpin((self._filename, group))
 
     def _set_attr(self, value, attr):
         g = int(self._guards / 2)
         getattr(self, attr)[:, g:-g, g:-g, g:-g] = value
+        self._residency.pin((self._filename, attr[1:]))
+        self._derived.setdefault('modified', set()).add(attr[1:])
+        self._forget_derived(attr[1:])
+        self._summarize(attr[1:], getattr(self, attr))
+        self._version += 1
 
     def _get_attr(self, attr):
         g = int(self._guards / 2)
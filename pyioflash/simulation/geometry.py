@@ -15,13 +15,13 @@ Todo:
 
 """
 from dataclasses import dataclass, field, InitVar
-from typing import Tuple, List, Dict
+from typing import Any, Tuple, List, Dict
 
 import numpy
 import h5py
 
 from pyioflash.simulation.types import _BaseData
-from pyioflash.simulation.utility import _first_true, open_hdf5
+from pyioflash.simulation.utility import _parameters_from_file, _memory_entry, _memory_total, open_hdf5
 from pyioflash.simulation.support import _guard_cells_from_data, _bound_cells_from_data
 
 @dataclass
@@ -64,11 +64,17 @@ class GeometryData(_BaseData):
         grd_mesh_ddz: mesh metric data for block data, in z direction
         grd_mesh_ddz_max: max of mesh metric data, in z direction
         grd_mesh_ddz_min: min of mesh metric data, in z direction
+        _derived: cached data derived from the geometry data
 
     Note:
         The grid mesh data attributes return mesh coordinate data for each block
         without filling in relavent guard cell neighbor data; if this data is
         desired, the attribute name should be prepended with an underscore.
+
+        The cell_volume (by grid face, i.e., left, center, right) and face_area (by normal axis)
+        attributes are computed from the grid metrics on first access and cached (read-only) in
+        _derived; the interior arrays are contiguous copies such that reductions need not copy.
+        Setting a grid metric clears the cache.
     """
     gridfilename: InitVar[str]
     blk_num: int = field(repr=False, init=False, compare=False)
@@ -94,6 +100,7 @@ class GeometryData(_BaseData):
     _grd_mesh_ddx: numpy.ndarray = field(repr=False, init=False, compare=False)
     _grd_mesh_ddy: numpy.ndarray = field(repr=False, init=False, compare=False)
     _grd_mesh_ddz: numpy.ndarray = field(repr=False, init=False, compare=False)
+    _derived: Dict[str, Any] = field(repr=False, init=False, compare=False, default_factory=dict)
 
     @staticmethod
     def _get_neighbors(tree, dim):
@@ -111,21 +118,21 @@ class GeometryData(_BaseData):
     def _init_process(self, file: h5py.File, code: str, form: str, gridfilename: str) -> None:
 
         # pull relavent data from hdf5 file object  
-        sim_info: List[Tuple[int, bytes]] = list(file['sim info'])
+        sim_info: Dict[int, bytes] = _parameters_from_file(file, 'sim info')
         coordinates: numpy.ndarray = file['coordinates']
         boundingbox: numpy.ndarray = file['bounding box']
         tree_struct: List[List[int]] = file['gid'][()].tolist()
-        int_runtime: List[Tuple[bytes, int]] = list(file['integer runtime parameters'])
-        real_runtime: List[Tuple[bytes, float]] = list(file['real runtime parameters'])
-        str_runtime: List[Tuple[bytes, bytes]] = list(file['string runtime parameters'])
-        int_scalars: List[Tuple[bytes, int]] = list(file['integer scalars'])
-        real_scalars: List[Tuple[bytes, float]] = list(file['real scalars'])
+        int_runtime: Dict[str, int] = _parameters_from_file(file, 'integer runtime parameters')
+        real_runtime: Dict[str, float] = _parameters_from_file(file, 'real runtime parameters')
+        str_runtime: Dict[str, bytes] = _parameters_from_file(file, 'string runtime parameters')
+        int_scalars: Dict[str, int] = _parameters_from_file(file, 'integer scalars')
+        real_scalars: Dict[str, float] = _parameters_from_file(file, 'real scalars')
 
         # initialize mappable keys
-        self.key = float(_first_true(real_scalars, lambda l: 'time' in str(l[0]))[1])
+        self.key = float(real_scalars['time'])
 
         # initialize grid type
-        setup_call: str = _first_true(sim_info, lambda l: l[0] == 9)[1].decode('utf-8')
+        setup_call: str = sim_info[9].decode('utf-8')
         if setup_call.find('+ug') != -1:
             self.grd_type = 'uniform'
         elif setup_call.find('+rg') != -1:
@@ -136,15 +143,12 @@ class GeometryData(_BaseData):
             raise Exception(f'Unable to determine grid type from sim info field')
 
         # initialize grid dimensionality
-        self.grd_dim = _first_true(int_scalars, lambda l: 'dimensionality' in str(l[0]))[1]
+        self.grd_dim = int_scalars['dimensionality']
 
         # initialize grid bounding box
-        self.grd_bndbox = [(_first_true(real_runtime, lambda l: 'xmin' in str(l[0]))[1],
-                            _first_true(real_runtime, lambda l: 'xmax' in str(l[0]))[1]),
-                           (_first_true(real_runtime, lambda l: 'ymin' in str(l[0]))[1],
-                            _first_true(real_runtime, lambda l: 'ymax' in str(l[0]))[1]),
-                           (_first_true(real_runtime, lambda l: 'zmin' in str(l[0]))[1],
-                            _first_true(real_runtime, lambda l: 'zmax' in str(l[0]))[1])]
+        self.grd_bndbox = [(real_runtime['xmin'], real_runtime['xmax']),
+                           (real_runtime['ymin'], real_runtime['ymax']),
+                           (real_runtime['zmin'], real_runtime['zmax'])]
 
         # initialize grid boundary conditions
         bndcnds = {"velc" : {"left"  : "xl_boundary_type", "right" : "xr_boundary_type",
@@ -156,23 +160,20 @@ class GeometryData(_BaseData):
         bndvals = {"temp" : {"left"  : "txl_boundary_value", "right" : "txr_boundary_value",
                              "front" : "tyr_boundary_value", "back"  : "tyl_boundary_value",
                              "up"    : "tzr_boundary_value", "down"  : "tzl_boundary_value"}}
-        self.grd_bndcnds = {field : {
-            face : _first_true(str_runtime, lambda l: name == l[0].decode('utf-8').replace(' ','')
-                               )[1].decode('utf-8').replace(' ','') 
-            for face, name in faces.items()} for field, faces in bndcnds.items()}
-        self.grd_bndvals = {field : {
-            face : _first_true(real_runtime, lambda l: name == l[0].decode('utf-8').replace(' ',''))[1] 
-            for face, name in faces.items()} for field, faces in bndvals.items()}
+        self.grd_bndcnds = {field : {face : str_runtime[name].decode('utf-8').replace(' ','') 
+                                     for face, name in faces.items()} for field, faces in bndcnds.items()}
+        self.grd_bndvals = {field : {face : real_runtime[name] 
+                                     for face, name in faces.items()} for field, faces in bndvals.items()}
 
         # initialize block data
         if self.grd_type in {'uniform', 'regular'}:
-            self.blk_num = _first_true(int_scalars, lambda l: 'globalnumblocks' in str(l[0]))[1]
-            self.blk_num_x = _first_true(int_runtime, lambda l: 'iprocs' in str(l[0]))[1]
-            self.blk_num_y = _first_true(int_runtime, lambda l: 'jprocs' in str(l[0]))[1]
-            self.blk_num_z = _first_true(int_runtime, lambda l: 'kprocs' in str(l[0]))[1] 
-            self.blk_size_x = _first_true(int_scalars, lambda l: 'nxb' in str(l[0]))[1]
-            self.blk_size_y = _first_true(int_scalars, lambda l: 'nyb' in str(l[0]))[1]
-            self.blk_size_z = _first_true(int_scalars, lambda l: 'nzb' in str(l[0]))[1]
+            self.blk_num = int_scalars['globalnumblocks']
+            self.blk_num_x = int_runtime['iprocs']
+            self.blk_num_y = int_runtime['jprocs']
+            self.blk_num_z = int_runtime['kprocs']
+            self.blk_size_x = int_scalars['nxb']
+            self.blk_size_y = int_scalars['nyb']
+            self.blk_size_z = int_scalars['nzb']
 
         elif self.grd_type == 'paramesh':
             pass # paramesh grid handling operations
@@ -189,7 +190,7 @@ class GeometryData(_BaseData):
         self.blk_bndbox[:, :, :] = boundingbox
 
         # initialize number of guard cells for each block per direction
-        self.blk_guards = _first_true(int_runtime, lambda l: 'iguard' in str(l[0]))[1]
+        self.blk_guards = int_runtime['iguard']
         self.blk_guards = int(self.blk_guards / self.blk_num_x)
         self.blk_guards = 2 # do not need to use more than 1 currently
         g = int(self.blk_guards / 2)
@@ -342,6 +343,26 @@ class GeometryData(_BaseData):
             'grd_type', 'grd_dim', 'grd_mesh_x', 'grd_mesh_y', 'grd_mesh_z',
             'grd_mesh_ddx', 'grd_mesh_ddy', 'grd_mesh_ddz'})
 
+    def memory_report(self) -> Dict[str, Any]:
+        """
+        Method to return the memory footprint (in bytes) of the geometry data; broken down by
+        block data, mesh arrays, metric arrays, and cached derived data, including guard cell overhead.
+
+        Returns:
+            A dict containing the total owned bytes and an entry for each category of data.
+        """
+        g = self.blk_guards
+        report = {
+            'blocks': {name: _memory_entry(getattr(self, name)) for name in (
+                'blk_coords', 'blk_bndbox', 'blk_tree_str', 'blk_neighbors')},
+            'mesh': {name: _memory_entry(getattr(self, name), g) for name in (
+                '_grd_mesh_x', '_grd_mesh_y', '_grd_mesh_z')},
+            'metrics': {name: _memory_entry(getattr(self, name), g) for name in (
+                '_grd_mesh_ddx', '_grd_mesh_ddy', '_grd_mesh_ddz')},
+            'derived': {name: _memory_entry(value) for name, value in self._derived.items()}}
+        report['total'] = _memory_total(report)
+        return report
+
     def __str__(self) -> str:
         fields = ['grd_type', 'blk_num', 'blk_num_x', 'blk_num_y', 'blk_num_z',
                   'blk_size_x', 'blk_size_y', 'blk_size_z']
@@ -410,6 +431,7 @@ class GeometryData(_BaseData):
     def grd_mesh_ddx(self, value):
         g = int(self.blk_guards / 2)
         self._grd_mesh_ddx[:, :, g:-g, g:-g, g:-g] = value
+        self._derived.clear()
 
     @property
     def grd_mesh_ddy(self):
@@ -426,6 +448,7 @@ class GeometryData(_BaseData):
     def grd_mesh_ddy(self, value):
         g = int(self.blk_guards / 2)
         self._grd_mesh_ddy[:, :, g:-g, g:-g, g:-g] = value
+        self._derived.clear()
 
     @property
     def grd_mesh_ddz(self):
@@ -442,4 +465,68 @@ class GeometryData(_BaseData):
     def grd_mesh_ddz(self, value):
         g = int(self.blk_guards / 2)
         self._grd_mesh_ddz[:, :, g:-g, g:-g, g:-g] = value
+        self._derived.clear()
+
+    @property
+    def _cell_volume(self):
+        """
+        Method to provide the (cached) property _cell_volume.
+
+        Returns:
+            Volume of each cell for block data (with guard cells), by grid face; [face, blks, k, j, i]
+        """
+        if '_cell_volume' not in self._derived:
+            volume = 1/self._grd_mesh_ddx * 1/self._grd_mesh_ddy
+            if self.grd_dim == 3:
+                volume = volume * 1/self._grd_mesh_ddz
+            volume.flags.writeable = False
+            self._derived['_cell_volume'] = volume
+        return self._derived['_cell_volume']
+
+    @property
+    def cell_volume(self):
+        """
+        Method to provide the (cached) property cell_volume.
+
+        Returns:
+            Volume of each cell for block data, by grid face; [face, blks, k, j, i]
+        """
+        if 'cell_volume' not in self._derived:
+            g = int(self.blk_guards / 2)
+            volume = numpy.ascontiguousarray(self._cell_volume[:, :, g:-g, g:-g, g:-g])
+            volume.flags.writeable = False
+            self._derived['cell_volume'] = volume
+        return self._derived['cell_volume']
+
+    @property
+    def _face_area(self):
+        """
+        Method to provide the (cached) property _face_area.
+
+        Returns:
+            Area of the faces of each cell for block data (with guard cells), by normal axis; [axis, blks, k, j, i]
+        """
+        if '_face_area' not in self._derived:
+            lengths = [1/self._grd_mesh_ddx[1], 1/self._grd_mesh_ddy[1], 1/self._grd_mesh_ddz[1]]
+            if self.grd_dim != 3:
+                lengths[2] = numpy.ones_like(lengths[2])
+            area = numpy.stack([lengths[1] * lengths[2], lengths[0] * lengths[2], lengths[0] * lengths[1]])
+            area.flags.writeable = False
+            self._derived['_face_area'] = area
+        return self._derived['_face_area']
+
+    @property
+    def face_area(self):
+        """
+        Method to provide the (cached) property face_area.
+
+        Returns:
+            Area of the faces of each cell for block data, by normal axis; [axis, blks, k, j, i]
+        """
+        if 'face_area' not in self._derived:
+            g = int(self.blk_guards / 2)
+            area = numpy.ascontiguousarray(self._face_area[:, :, g:-g, g:-g, g:-g])
+            area.flags.writeable = False
+            self._derived['face_area'] = area
+        return self._derived['face_area']
 
@@ -14,12 +14,12 @@ Todo:
 
 """
 from dataclasses import dataclass, field
-from typing import Tuple, List
+from typing import Tuple, List, Dict
 
 import h5py
 
 from pyioflash.simulation.types import _BaseData
-from pyioflash.simulation.utility import _first_true
+from pyioflash.simulation.utility import _parameters_from_file
 
 @dataclass
 class ScalarData(_BaseData):
@@ -45,16 +45,16 @@ class ScalarData(_BaseData):
     # pylint: disable=arguments-differ
     def _init_process(self, file: h5py.File, code: str, form: str) -> None:
         # pull relavent data from hdf5 file object
-        real_scalars: List[Tuple[bytes, float]] = list(file['real scalars'])
+        real_scalars: Dict[str, float] = _parameters_from_file(file, 'real scalars')
 
         # initialize mappable keys
-        self.key = float(_first_true(real_scalars, lambda l: 'time' in str(l[0]))[1])
+        self.key = float(real_scalars['time'])
 
          # initialize field data members
         for group, dataset, *name in self._groups: # pylint: disable=not-an-iterable
             if name == []:
                 name = [dataset]
-            setattr(self, *name, _first_true(list(file[group]), lambda l, data=dataset: data in str(l[0]))[1])
+            setattr(self, *name, _parameters_from_file(file, group)[dataset])
 
         # initialize list of class member names holding the data
         setattr(self, '_attributes', {group[-1] for group in self._groups}) # pylint: disable=not-an-iterable
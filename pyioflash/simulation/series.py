@@ -34,6 +34,12 @@ def data_from_path(path: DataPath, *,
                    times: Union[slice, float, int] = None
                    ) -> Union[str, int, float, 'ndarray']:
     """
+    Provides the data located by path, from the times and indexed by index if provided.
+
+    Note:
+        Scalar and dynamic data are retrieved as slices of the columnar store of
+        path.data (i.e., path.data.columns), if available, rather than by iterating
+        over the individual data objects of each time.
     """
     
     # attach index if going to slice into data from path
@@ -52,8 +58,21 @@ def data_from_path(path: DataPath, *,
     if path.name is None:
         raise Exception(f'DataPath.name default of None provided in argument path; must provide path.name!')
 
+    # use columnar store if available for scalar and dynamic data
+    columns = getattr(path.data, 'columns', None)
+    if times is None:
+        select = lambda column : column
+    else:
+        select = lambda column : column[columns.indices(times)]
+
     # apply correct lookup semantics based on provided path, times, and index 
-    if path.module in {'fields', 'scalars'}:
+    if path.module in {'scalars'} and columns is not None and path.name in columns:
+        return lookup(select(columns[path.name]), index)
+
+    elif path.module in {'dynamics'} and columns is not None and path.type in columns:
+        return lookup(select(columns[path.type][path.name]), index)
+
+    elif path.module in {'fields', 'scalars'}:
         return lookup(source(getattr(path.data, path.module), times)[path.name], index)[:][0]
 
     elif path.module in {'dynamics'}:
@@ -15,12 +15,12 @@ Todo:
 
 """
 from dataclasses import dataclass, field
-from typing import Tuple, List, Callable, Union
+from typing import Tuple, List, Dict, Callable, Union
 
 import h5py
 
 from pyioflash.simulation.types import _BaseData
-from pyioflash.simulation.utility import _first_true, _reduce_str
+from pyioflash.simulation.utility import _parameters_from_file, _reduce_str
 
 @dataclass
 class StaticData(_BaseData):
@@ -68,15 +68,15 @@ class StaticData(_BaseData):
     # pylint: disable=arguments-differ
     def _init_process(self, file: h5py.File, code: str, form: str) -> None:
         # pull relavent data from hdf5 file object
-        real_scalars: List[Tuple[bytes, float]] = list(file['real scalars'])
+        real_scalars: Dict[str, float] = _parameters_from_file(file, 'real scalars')
 
         # initialize mappable keys
-        self.key = float(_first_true(real_scalars, lambda l: 'time' in str(l[0]))[1])
+        self.key = float(real_scalars['time'])
 
          # initialize class members by hdf5 file groups
         for group, wrap in self._groups: # pylint: disable=not-an-iterable
-            setattr(self, _reduce_str(group), {_reduce_str(self.decode_label(dataset[0])):
-                                               wrap(dataset[1]) for dataset in file[group]})
+            setattr(self, _reduce_str(group), {_reduce_str(self.decode_label(label)): wrap(value)
+                                               for label, value in _parameters_from_file(file, group).items()})
 
         # initialize list of class member names holding the data
         # pylint: disable=not-an-iterable
@@ -30,7 +30,7 @@ from typing import Any, List, Dict, Callable
 
 import h5py
 
-from pyioflash.simulation.utility import open_hdf5
+from pyioflash.simulation.utility import open_hdf5, _memory_entry, _memory_total
 
 @dataclass(order=True)
 class _BaseData(AbstractBase):
@@ -105,6 +105,27 @@ class _BaseData(AbstractBase):
         """
         return self._attributes
 
+    def memory_report(self) -> Dict[str, Any]:
+        """
+        Method to return the memory footprint (in bytes) of the data object,
+        broken down by the named data fields.
+
+        Returns:
+            A dict containing the total owned bytes and an entry for each data field.
+        """
+        items = {key : _memory_entry(getattr(self, key)) for key in self._attributes}
+        return {'total': _memory_total(items), 'items': items}
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Method to provide the property nbytes.
+
+        Returns:
+            Total bytes owned by the data object
+        """
+        return self.memory_report()['total']
+
     def todict(self) -> dict:
         """
         Method to return the the data object as a key, value dictionary.
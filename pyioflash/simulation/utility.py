@@ -8,10 +8,13 @@ Todo:
 
 
 from contextlib import contextmanager
-from typing import Any, Tuple, List, Iterable, Union, Callable, TYPE_CHECKING
+from sys import getsizeof
+from weakref import WeakKeyDictionary
+from typing import Any, Tuple, List, Dict, Iterable, Union, Callable, Optional, TYPE_CHECKING
 
 
 import h5py
+import numpy
 
 
 if TYPE_CHECKING:
@@ -19,47 +22,233 @@ if TYPE_CHECKING:
     from pyioflash.simulation.geometry import GeometryData
 
 
+# index of decoded parameter and scalar groups for each open hdf5 file
+_PARAMETERS: 'WeakKeyDictionary[h5py.File, Dict[str, Dict[Any, Any]]]' = WeakKeyDictionary()
+
+
+# number of (plane or line) block intersection queries cached with the geometry data
+_BLOCK_QUERIES = 4096
+
+
 def _blocks_from_plane(data: 'GeometryData', axis: str, value: float) -> List[int]:
     """Returns a list of block indices (using geometry data) which intersect a provided plane"""
+    return _blocks_from_planes(data, axis, [value])[1].tolist()
 
-    # define intersection truth function
-    within = lambda low, high, check: low <= check and check < high
-    
-    # define axis of provided plane and retrieve bounding boxes
+
+def _blocks_from_line(data: 'GeometryData', axes: Tuple[str], values: Tuple[float]) -> List[int]:
+    """Returns a list of block indices (using geometry data) which intersect a provided line"""
+    return _blocks_from_lines(data, axes, [values])[1].tolist()
+
+
+def _blocks_from_planes(data: 'GeometryData', axis: str,
+                        values: Iterable[float]) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """Returns the block indices (using geometry data) which intersect each provided plane, axis = value; as (offsets,
+    indices) such that indices[offsets[q]:offsets[q + 1]] are the (ordered) blocks of query q (i.e., CSR-style)"""
+
+    # define axis of provided planes
     index = {axis: index for index, axis in enumerate(['x', 'y', 'z'])}[axis]
-    boxes = data.blk_bndbox[:, index, :]
- 
-    # return blocks which are intersected by plane; open interval value in [low, high)
+    values = numpy.atleast_1d(numpy.asarray(values, dtype=float))
+
+    # all blocks intersect; open interval results in empty set for z-axis in 2d
     if data.grd_dim == 2 and axis == 'z':
-        return list(range(len(boxes))) # open interval results in empty set for z-axis in 2d
-    else:
-        return [block for block, box in enumerate(boxes) if within(*(tuple(box) + (value, )))]
+        return _block_queries(data, [('plane', axis, float(value)) for value in values], 
+                              lambda queries: numpy.ones((len(queries), data.blk_num), dtype=bool))
 
+    # return blocks which are intersected by planes; open interval value in [low, high)
+    boxes = data.blk_bndbox[:, index, :]
+    def within(queries):
+        points = numpy.array([query[2] for query in queries])[:, None]
+        return (boxes[None, :, 0] <= points) & (points < boxes[None, :, 1])
+    return _block_queries(data, [('plane', axis, float(value)) for value in values], within)
 
-def _blocks_from_line(data: 'GeometryData', axes: Tuple[str], values: Tuple[float]) -> List[int]:
-    """Returns a list of block indices (using geometry data) which intersect a provided line"""
 
-    # define intersection truth function
-    within = lambda low, high, check: low <= check and check < high
+def _blocks_from_lines(data: 'GeometryData', axes: Tuple[str], 
+                       values: Iterable[Tuple[float]]) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """Returns the block indices (using geometry data) which intersect each provided line, axes = values; as (offsets, 
+    indices) such that indices[offsets[q]:offsets[q + 1]] are the (ordered) blocks of query q (i.e., CSR-style)"""
 
-    # define axes of provided line and retrive bounding boxes
+    # define axes of provided lines
     mapping = {axis: index for index, axis in enumerate(['x', 'y', 'z'])}
-    boxes0 = data.blk_bndbox[:, mapping[axes[0]], :]
-    boxes1 = data.blk_bndbox[:, mapping[axes[1]], :]
+    values = numpy.asarray(values, dtype=float).reshape(-1, 2)
+
+    # open interval results in empty set for z-axis in 2d
+    if data.grd_dim == 2 and 'z' in axes:
+        keep = [number for number, axis in enumerate(axes) if axis != 'z'][0]
+        return _blocks_from_planes(data, axes[keep], values[:, keep])
+
+    # return blocks which are intersected by lines; open interval values in [lows, highs)
+    boxes = data.blk_bndbox[:, [mapping[axes[0]], mapping[axes[1]]], :]
+    def within(queries):
+        points = numpy.array([query[2] for query in queries])[:, None, :]
+        return ((boxes[None, :, :, 0] <= points) & (points < boxes[None, :, :, 1])).all(axis=2)
+    return _block_queries(data, [('line', tuple(axes), tuple(map(float, value))) for value in values], within)
+
+
+def _block_queries(data: 'GeometryData', queries: List[Tuple[Any, ...]], 
+                   within: Callable[[List[Tuple[Any, ...]]], numpy.ndarray]) -> Tuple[numpy.ndarray, numpy.ndarray]:
+    """Returns the block indices of queries (using geometry data) as (offsets, indices); intersections of queries
+    not previously cached are determined at once, by within -> [queries, blocks] (bool), and cached with the geometry
+    data"""
+    cache = data._derived.setdefault('block_queries', {})
+
+    # determine (once) the blocks of the queries not yet cached
+    found = {query: cache[query] for query in queries if query in cache}
+    missing = [query for query in dict.fromkeys(queries) if query not in found]
+    if missing:
+        for query, row in zip(missing, within(missing)):
+            blocks = numpy.flatnonzero(row)
+            blocks.flags.writeable = False
+            found[query] = cache[query] = blocks
+        while len(cache) > _BLOCK_QUERIES:
+            cache.pop(next(iter(cache)))
+
+    # provide the blocks of each query; CSR-style
+    blocks = [found[query] for query in queries]
+    offsets = numpy.zeros(len(queries) + 1, dtype=int)
+    numpy.cumsum([len(block) for block in blocks], out=offsets[1:])
+    indices = numpy.concatenate(blocks) if blocks else numpy.array([], dtype=int)
+    return offsets, indices.astype(int, copy=False)
+
+
+def _block_positions(data: 'GeometryData') -> numpy.ndarray:
+    """Returns the (cached) position of each block (using geometry data) in the lattice of blocks, [blocks, (x, y, z)];
+    positions are the ranks of the distinct lower bounds of the bounding boxes along each axis (blocks may be
+    stretched), and must number the blocks along each axis (i.e., blk_num_x, blk_num_y, blk_num_z)"""
+    if 'block_positions' not in data._derived:
+        lows = data.blk_bndbox[:, :, 0]
+        sizes = data.blk_bndbox[:, :, 1] - lows
+        counts = (data.blk_num_x, data.blk_num_y, data.blk_num_z)
+
+        positions = numpy.empty(lows.shape, dtype=int)
+        for axis, name in enumerate('xyz'):
+
+            # rank the lower bounds; tolerant to round off of the bounding boxes relative to the smallest block
+            positive = sizes[:, axis][sizes[:, axis] > 0]
+            tolerance = 1e-6 * positive.min() if positive.size else 0.0
+            order = numpy.argsort(lows[:, axis], kind='stable')
+            distinct = numpy.diff(lows[order, axis]) > tolerance
+            positions[order, axis] = numpy.concatenate([[0], numpy.cumsum(distinct)])
+
+            # only a lattice of blocks is supported (e.g., not adaptively refined)
+            if positions[:, axis].max() + 1 != counts[axis]:
+                raise ValueError(f'Unable to determine block positions; found {positions[:, axis].max() + 1} '
+                                 f'distinct block bounds along {name}, expected blk_num_{name} = {counts[axis]}!')
+
+        positions.flags.writeable = False
+        data._derived['block_positions'] = positions
+    return data._derived['block_positions']
+
+
+def _block_index(data: 'GeometryData') -> Dict[str, Any]:
+    """Returns the (cached) index of the blocks (using geometry data) for spatial lookups; the lower and upper bounds
+    of each block, [blocks, (x, y, z)], and the cell edges of each block along each axis, (x, y, z) [blocks,
+    cells + 1]"""
+    if 'block_index' not in data._derived:
+        lows = numpy.ascontiguousarray(data.blk_bndbox[:, :, 0])
+        highs = numpy.ascontiguousarray(data.blk_bndbox[:, :, 1])
+
+        # cell edges from the lower bounds and the cell widths along each axis (e.g., 1 / ddx); [blocks, cells + 1]
+        edges = []
+        for axis, name in enumerate('xyz'):
+            metric = getattr(data, 'grd_mesh_dd' + name)[1]
+            widths = 1.0 / metric[(slice(None), ) + tuple(slice(None) if a == axis else 0 for a in (2, 1, 0))]
+            edges.append(numpy.concatenate([lows[:, axis, None], lows[:, axis, None] + 
+                                            numpy.cumsum(widths, axis=1)], axis=1))
+        data._derived['block_index'] = {'lows': lows, 'highs': highs, 'edges': tuple(edges)}
+    return data._derived['block_index']
+
+
+def _blocks_from_boxes(data: 'GeometryData', boxes: numpy.ndarray) -> List[numpy.ndarray]:
+    """Returns the block indices (using geometry data) which intersect each provided bounding box, [boxes, (x, y, z), 
+    (low, high)]; intersections are treated as the open interval, having a nonzero overlap along each axis"""
+    index = _block_index(data)
+    boxes = numpy.asarray(boxes, dtype=float)
+    dims = data.grd_dim
+    overlap = ((index['lows'][None, :, :dims] < boxes[:, None, :dims, 1]) & 
+               (boxes[:, None, :dims, 0] < index['highs'][None, :, :dims])).all(axis=2)
+    return [numpy.flatnonzero(row) for row in overlap]
+
+
+def _assembly_plan(data: 'GeometryData') -> Dict[str, Any]:
+    """Returns the (cached) plan (using geometry data) to permute blocks into the lattice of blocks; the block
+    order (lattice ordered, z-major), and the counts of blocks and cells along each axis, (z, y, x)"""
+    if 'assembly_plan' not in data._derived:
+        positions = _block_positions(data)
+        counts = (data.blk_num_z, data.blk_num_y, data.blk_num_x)
+        cells = (data.blk_size_z, data.blk_size_y, data.blk_size_x)
+
+        # only a fully populated lattice of blocks is supported (e.g., a uniform or regular grid)
+        linear = numpy.ravel_multi_index(tuple(positions[:, ::-1].T), counts)
+        if len(linear) != numpy.prod(counts) or len(numpy.unique(linear)) != len(linear):
+            raise ValueError(f'Unable to assemble blocks; blocks do not fill the lattice {counts} (z, y, x)!')
+
+        order = numpy.argsort(linear)
+        inverse = numpy.argsort(order)
+        order.flags.writeable = False
+        inverse.flags.writeable = False
+        data._derived['assembly_plan'] = {'order': order, 'inverse': inverse, 'counts': counts, 'cells': cells}
+    return data._derived['assembly_plan']
+
+
+def _assemble_from_blocks(data: 'GeometryData', field: numpy.ndarray) -> numpy.ndarray:
+    """Returns a field (using geometry data) assembled from the blocks into a global array,
+    [..., b, k, j, i] -> [..., z, y, x]; any leading axes (e.g., times) are retained"""
+    plan = _assembly_plan(data)
+    counts, cells = plan['counts'], plan['cells']
+    field = numpy.asarray(field)
+    if field.ndim < 4 or field.shape[-4:] != (len(plan['order']), ) + cells:
+        raise ValueError(f'Unable to assemble field of shape {field.shape}; '
+                         f'must be [..., {len(plan["order"])}, {cells[0]}, {cells[1]}, {cells[2]}]!')
+
+    # permute blocks into lattice order and interleave lattice and cell axes; [..., nz, k, ny, j, nx, i]
+    leading = field.shape[:-4]
+    lattice = numpy.take(field, plan['order'], axis=-4).reshape(leading + counts + cells)
+    axes = tuple(range(len(leading)))
+    lattice = lattice.transpose(axes + tuple(len(leading) + axis for axis in (0, 3, 1, 4, 2, 5)))
+    return lattice.reshape(leading + tuple(count * cell for count, cell in zip(counts, cells)))
+
+
+def _scatter_to_blocks(data: 'GeometryData', field: numpy.ndarray) -> numpy.ndarray:
+    """Returns a global array (using geometry data) scattered to the blocks; the reverse of _assemble_from_blocks,
+    [..., z, y, x] -> [..., b, k, j, i]; any leading axes (e.g., times) are retained"""
+    plan = _assembly_plan(data)
+    counts, cells = plan['counts'], plan['cells']
+    shape = tuple(count * cell for count, cell in zip(counts, cells))
+    field = numpy.asarray(field)
+    if field.ndim < 3 or field.shape[-3:] != shape:
+        raise ValueError(f'Unable to scatter field of shape {field.shape}; '
+                         f'must be [..., {shape[0]}, {shape[1]}, {shape[2]}]!')
+
+    # separate lattice and cell axes, and permute lattice ordered blocks into block order; [..., b, k, j, i]
+    leading = field.shape[:-3]
+    lattice = field.reshape(leading + sum(zip(counts, cells), ()))
+    axes = tuple(range(len(leading)))
+    lattice = lattice.transpose(axes + tuple(len(leading) + axis for axis in (0, 2, 4, 1, 3, 5)))
+    return numpy.take(lattice.reshape(leading + (len(plan['order']), ) + cells), plan['inverse'], axis=-4)
 
-    # return blocks which are intersected by a line; open interval values in [lows, highs)
-    if data.grd_dim == 2 and 'z' in axes:  # open interval results in empty set for z-axis in 2d
-        axis, value = [(axis, value) for axis, value in zip(axes, values) if axis != 'z'][0]
-        return _blocks_from_plane(data, axis, value)
-    else:
-        return [block for block, (box0, box1) in enumerate(zip(boxes0, boxes1)) 
-                if within(*(tuple(box0) + (values[0], ))) and within(*(tuple(box1) + (values[1], )))]
 
 def _first_true(iterable: Iterable, predictor: Callable[..., bool]) -> Any:
     """Returns the first true value in the iterable according to predictor."""
     return next(filter(predictor, iterable))
 
 
+def _decode_name(name: Any) -> Any:
+    """Returns a decoded, trailing whitespace removed, dataset name if stored as bytes"""
+    try:
+        return name.decode('utf-8').rstrip()
+    except AttributeError:
+        return name
+
+
+def _parameters_from_file(file: h5py.File, group: str) -> Dict[Any, Any]:
+    """Returns the named values of a parameter or scalar group (e.g., 'real scalars') of an hdf5 file;
+    each group is read and decoded in a single pass once per open file, and shared by subsequent calls"""
+    index = _PARAMETERS.setdefault(file, {})
+    if group not in index:
+        index[group] = {_decode_name(record[0]): record[1] for record in file[group][()]}
+    return index[group]
+
+
 def _filter_transpose(source: List[Any], names: Iterable[str]) -> List[List[Any]]:
     """Returns a list of named members extracted from a
     collection object (source) based on a list (names)"""
@@ -144,6 +333,38 @@ def _get_times(data: 'SortedDict', key: Union[int, float, slice, Iterable]) -> L
     return [keys[k] for k in _get_indices(data, key)]
 
 
+def _memory_entry(value: Any, guards: Optional[int] = None) -> Dict[str, Any]:
+    """Returns the memory footprint of a value (in bytes), distinguishing views from owned buffers;
+    if guards are provided, the overhead of the guard cells of a [..., k, j, i] array is included"""
+
+    # numpy arrays may be views into the buffer of another array
+    if isinstance(value, numpy.ndarray):
+        entry = {'nbytes': value.nbytes, 'owned': value.base is None}
+        if guards is not None and value.ndim >= 3:
+            g = int(guards / 2)
+            entry['guard'] = value.nbytes - value[..., g:-g, g:-g, g:-g].nbytes
+        return entry
+
+    # containers are reported as the sum of their members
+    elif isinstance(value, dict):
+        return {'nbytes': getsizeof(value) + sum(_memory_entry(item)['nbytes'] for item in value.values()),
+                'owned': True}
+    elif isinstance(value, (list, tuple)):
+        return {'nbytes': getsizeof(value) + sum(_memory_entry(item)['nbytes'] for item in value),
+                'owned': True}
+
+    # everything else is owned by definition
+    else:
+        return {'nbytes': getsizeof(value), 'owned': True}
+
+
+def _memory_total(report: Dict[str, Any]) -> int:
+    """Returns the total bytes owned from a (nested) memory report; views are not counted"""
+    if 'nbytes' in report and 'owned' in report:
+        return report['nbytes'] if report['owned'] else 0
+    return sum(_memory_total(item) for key, item in report.items() if isinstance(item, dict))
+
+
 def _reduce_str(value: str, sentinal: str = '_'):
     """ Provides reduced string with intervineing spaces replaced, and trailing removed"""
     return value.rstrip().replace(' ', sentinal)
@@ -171,4 +392,5 @@ def open_hdf5(*args, **kwargs):
     try:
         yield file
     finally:
+        _PARAMETERS.pop(file, None)
         file.close()
@@ -0,0 +1,111 @@
+"""Fixtures providing small synthetic FLASH4 (regular grid) hdf5 plot files for the test suite."""
+import h5py
+import numpy
+import pytest
+
+from pyioflash.simulation.data import SimulationData
+
+
+def _records(values, kind):
+    """Returns a FLASH4 style (name, value) record array of a parameter or scalar group."""
+    dtype = [('name', 'S80'), ('value', kind)]
+    return numpy.array([(name.ljust(80).encode(), value) for name, value in values.items()], dtype=dtype)
+
+
+def _edges(count, low, high, stretch):
+    """Returns the block edges along an axis; uniformly spaced if stretch is one."""
+    return low + (high - low) * numpy.linspace(0.0, 1.0, count + 1)**stretch
+
+
+def _write_series(directory, *, steps, blocks, cells, stretch, times):
+    """Writes the plot files, and the grid file, of a two dimensional simulation on a lattice of blocks."""
+    (nbx, nby), (nx, ny) = blocks, cells
+    number = nbx * nby
+    xedges, yedges = _edges(nbx, 0.0, 2.0, stretch), _edges(nby, 0.0, 1.0, 1.0)
+
+    # bounding boxes and neighbors of blocks; x varying fastest, neighbors as [left, right, front, back]
+    bndbox = numpy.zeros((number, 3, 2))
+    gid = numpy.full((number, 9), -21, dtype=numpy.int32)
+    for block in range(number):
+        i, j = block % nbx, block // nbx
+        bndbox[block, 0] = xedges[i:i + 2]
+        bndbox[block, 1] = yedges[j:j + 2]
+        gid[block, :4] = [block - 1 if i > 0 else -21, block + 1 if i < nbx - 1 else -21,
+                          block + nbx if j < nby - 1 else -21, block - nbx if j > 0 else -21]
+
+    # coordinates of cells (and faces) of each block; [blocks, k, j, i]
+    def coordinates(axis, shift, size):
+        low, high = bndbox[:, axis, 0], bndbox[:, axis, 1]
+        points = low[:, None] + (high - low)[:, None] * (numpy.arange(size) + shift)[None, :] / (size - 1 + 2 * shift)
+        shape = (number, 1, 1, size) if axis == 0 else (number, 1, size, 1)
+        return numpy.broadcast_to(points.reshape(shape), (number, 1, ny, nx)).copy()
+
+    # cell positions, and metrics; inverse widths (c), and inverse distances to the left (l) and right (r) centers
+    with h5py.File(directory / 'Test_hdf5_grd_0000', 'w') as grid:
+        for axis, name, size in ((0, 'x', nx), (1, 'y', ny)):
+            widths = (bndbox[:, axis, 1] - bndbox[:, axis, 0]) / size
+            lower, upper = (gid[:, 0], gid[:, 1]) if axis == 0 else (gid[:, 3], gid[:, 2])
+            distances = {'c': numpy.repeat(widths[:, None], size, axis=1)}
+            distances['l'], distances['r'] = distances['c'].copy(), distances['c'].copy()
+            distances['l'][:, 0] = numpy.where(lower >= 0, (widths + widths[numpy.maximum(lower, 0)]) / 2, widths)
+            distances['r'][:, -1] = numpy.where(upper >= 0, (widths + widths[numpy.maximum(upper, 0)]) / 2, widths)
+            shape = (number, 1, 1, size) if axis == 0 else (number, 1, size, 1)
+            for face, shift in (('l', 0.0), ('c', 0.5), ('r', 1.0)):
+                points = bndbox[:, axis, 0][:, None] + widths[:, None] * (numpy.arange(size) + shift)[None, :]
+                grid[name * 3 + face] = numpy.broadcast_to(points.reshape(shape), (number, 1, ny, nx))
+                metric = 1.0 / distances[face].reshape(shape)
+                grid['dd' + name + face] = numpy.broadcast_to(metric, (number, 1, ny, nx))
+        for face in 'lcr':
+            grid['zzz' + face] = numpy.zeros((number, 1, ny, nx))
+            grid['ddz' + face] = numpy.ones((number, 1, ny, nx))
+
+    # cell centers and face positions of each block
+    xc, yc = (coordinates(axis, 0.5, size) for axis, size in ((0, nx), (1, ny)))
+    width = ((bndbox[:, 0, 1] - bndbox[:, 0, 0]) / nx)[:, None, None, None]
+    height = ((bndbox[:, 1, 1] - bndbox[:, 1, 0]) / ny)[:, None, None, None]
+    xf = numpy.concatenate([xc - width / 2, xc[..., -1:] + width / 2], axis=3)
+    yf = numpy.concatenate([yc - height / 2, yc[..., -1:, :] + height / 2], axis=2)
+
+    boundaries = {'xl_boundary_type': 'noslip_ins', 'xr_boundary_type': 'noslip_ins',
+                  'yl_boundary_type': 'noslip_ins', 'yr_boundary_type': 'noslip_ins',
+                  'zl_boundary_type': 'periodic', 'zr_boundary_type': 'periodic',
+                  'txl_boundary_type': 'neumann_ht', 'txr_boundary_type': 'neumann_ht',
+                  'tyl_boundary_type': 'dirichlet_ht', 'tyr_boundary_type': 'dirichlet_ht',
+                  'tzl_boundary_type': 'dirichlet_ht', 'tzr_boundary_type': 'dirichlet_ht'}
+    values = {f't{axis}{side}_boundary_value': 0.0 for axis in 'xyz' for side in 'lr'}
+
+    for step in range(steps):
+        with h5py.File(directory / f'Test_hdf5_plt_cnt_{step:04d}', 'w') as file:
+            info = numpy.array([(9, b' setup.py INavierStokes -2d -auto +rg')],
+                               dtype=[('file format version', '<i4'), ('setup call', 'S400')])
+            file['sim info'] = info
+            file['coordinates'] = bndbox.mean(axis=2)
+            file['bounding box'] = bndbox
+            file['gid'] = gid
+            file['integer runtime parameters'] = _records({'iprocs': nbx, 'jprocs': nby, 'kprocs': 1,
+                                                           'iguard': 2 * nbx}, '<i4')
+            file['real runtime parameters'] = _records({'xmin': 0.0, 'xmax': 2.0, 'ymin': 0.0, 'ymax': 1.0,
+                                                        'zmin': 0.0, 'zmax': 0.0, **values}, '<f8')
+            file['string runtime parameters'] = _records(boundaries, 'S80')
+            file['logical runtime parameters'] = _records({'restart': 0}, '<i4')
+            file['integer scalars'] = _records({'nxb': nx, 'nyb': ny, 'nzb': 1, 'dimensionality': 2,
+                                                'globalnumblocks': number, 'nstep': 10 * step, 'nbegin': 1}, '<i4')
+            file['real scalars'] = _records({'time': float(times[step]), 'dt': 0.1}, '<f8')
+            file['logical scalars'] = _records({'corners': 0}, '<i4')
+            file['string scalars'] = _records({'geometry': 'cartesian'}, 'S80')
+            file['unknown names'] = numpy.array([[b'temp'], [b'pres']])
+            file['temp'] = xc + 2.0 * yc + step
+            file['pres'] = numpy.sin(xc) * numpy.cos(yc) * (step + 1)
+            file['fcx2'] = numpy.broadcast_to(xf * yc[..., :1] + step, (number, 1, ny, nx + 1))
+            file['fcy2'] = numpy.broadcast_to(-yf * xc[..., :1, :] - step, (number, 1, ny + 1, nx))
+
+
+@pytest.fixture
+def flash(tmp_path):
+    """Provides a factory of SimulationData objects reading a synthetic series of plot files."""
+    def factory(*, steps=3, blocks=(4, 2), cells=(8, 8), stretch=1.0, times=None, max_bytes=None):
+        times = range(steps) if times is None else times
+        _write_series(tmp_path, steps=steps, blocks=blocks, cells=cells, stretch=stretch, times=times)
+        return SimulationData.from_list(range(steps), path=f'{tmp_path}/', basename='Test_',
+                                        header='hdf5_plt_cnt_', max_bytes=max_bytes)
+    return factory
@@ -0,0 +1,85 @@
+"""Tests of the memoization of post-processing sources."""
+import numpy
+import pytest
+
+from pyioflash.postprocess import cache
+from pyioflash.postprocess.sources import fields
+
+
+def test_memoized_results_are_writable_copies(flash):
+    data = flash()
+    first = fields.velocity_mean(data)
+    shared = fields.velocity_mean.shared(data)
+
+    assert all(component.flags.writeable for component in first)
+    first[0][...] = 0.0
+    assert numpy.any(fields.velocity_mean(data)[0])
+    assert fields.velocity_mean.shared(data) is shared
+    with pytest.raises(ValueError):
+        shared[0][...] = 0.0
+
+
+def test_velocity_is_not_memoized(flash):
+    data = flash()
+    fields.velocity(data, 1)
+
+    assert cache.stats(data)['items'] == 0
+
+
+def test_mean_is_recomputed_after_setting_field(flash):
+    data = flash()
+    before = fields.velocity_mean(data)
+    member, = data.fields[1]
+
+    member._fcx2 = numpy.zeros_like(member._fcx2)
+    after = fields.velocity_mean(data)
+
+    assert not numpy.allclose(after[0], before[0]) and numpy.array_equal(after[1], before[1])
+
+
+def test_modified_data_is_not_persisted(flash, tmp_path):
+    data = flash()
+    cache.configure(directory=str(tmp_path / 'cache'))
+    try:
+        member, = data.fields[0]
+        member.fcy2 = numpy.ones_like(member.fcy2)
+        fields.velocity_mean(data)
+        assert not list((tmp_path / 'cache').iterdir())
+    finally:
+        cache.configure()
+
+
+def test_qualify_distinguishes_constants():
+    def scaled(value):
+        return value * 2.0
+
+    first = cache._qualify(scaled)
+
+    def scaled(value):
+        return value * 3.0
+
+    assert cache._qualify(scaled) != first
+    assert cache._qualify(scaled) == cache._qualify(scaled)
+
+
+def test_qualify_distinguishes_names():
+    def reduced(value):
+        return numpy.sum(value)
+
+    first = cache._qualify(reduced)
+
+    def reduced(value):
+        return numpy.mean(value)
+
+    assert cache._qualify(reduced) != first
+
+
+def test_qualify_includes_package_source(monkeypatch):
+    def scaled(value):
+        return value * 2.0
+
+    first = cache._qualify(scaled)
+    monkeypatch.setattr(cache, '_SOURCE_DIGEST', 'modified')
+
+    assert cache._source_digest() == 'modified'
+    assert cache._qualify(scaled) != first
@@ -0,0 +1,24 @@
+"""Tests of the columnar store matching the lookup conventions of the sorted collections."""
+import numpy
+import pytest
+
+
+@pytest.mark.parametrize('times', [1.0, 1.5, 2, slice(0.5, 1.5), slice(None, None, 2), [0, 2.0, 1.5]])
+def test_columns_select_as_collections(flash, times):
+    data = flash(times=[0.0, 1.0, 2.0])
+
+    expected = [item.key for time in (times if isinstance(times, list) else [times])
+                for item in data.scalars[time]]
+    assert numpy.array_equal(data.columns.keys[data.columns.indices(times)], expected)
+
+
+def test_columns_reject_time_beyond_last(flash):
+    data = flash(times=[0.0, 1.0, 2.0])
+
+    # neither the sorted collections nor the columns select an entry beyond the last time
+    with pytest.raises(StopIteration):
+        data.scalars[5.0]
+    with pytest.raises(KeyError, match='beyond the last key'):
+        data.columns.indices(5.0)
+    with pytest.raises(KeyError):
+        data.columns.select('real_scalars', [0.0, 5.0])
@@ -0,0 +1,81 @@
+"""Tests of the derivatives of fields on uniform and stretched lattices of blocks."""
+import numpy
+import pytest
+
+from pyioflash.postprocess.elements import derivative
+
+
+def _interior(data, field):
+    """Returns the assembled field, excluding the cells adjacent to the domain boundaries (no guard data)."""
+    return data.utility.assemble(field)[:, 1:-1, 1:-1]
+
+
+def _smooth(data, field):
+    """Returns the assembled field on cells not adjacent to a block face (i.e., with locally uniform spacing)."""
+    cells = numpy.arange(data.geometry.blk_size_x * data.geometry.blk_num_x) % data.geometry.blk_size_x
+    keep = (cells > 0) & (cells < data.geometry.blk_size_x - 1)
+    return data.utility.assemble(field)[:, 1:-1, keep]
+
+
+def _centers(data):
+    """Returns the guard cell padded x and y positions of the cell centers."""
+    return data.geometry._grd_mesh_x[1], data.geometry._grd_mesh_y[1]
+
+
+@pytest.mark.parametrize('stretch', [1.0, 2.0])
+def test_gradient_of_linear_fields(flash, stretch):
+    data = flash(stretch=stretch)
+    member, = data.fields[1]
+    x, y = data.geometry.grd_mesh_x[1], data.geometry.grd_mesh_y[1]
+
+    # temp = x + 2y + 1, cell centered
+    gradient = derivative.gradient(data, member._temp)
+    assert numpy.allclose(_interior(data, gradient[0]), 1.0)
+    assert numpy.allclose(_interior(data, gradient[1]), 2.0)
+
+    # fcx2 = x * y + 1, face centered along x; staggered along x and transverse along y
+    gradient = derivative.gradient(data, member._fcx2, location='x')
+    assert numpy.allclose(_interior(data, gradient[0]), _interior(data, y))
+    assert numpy.allclose(_interior(data, gradient[1]), _interior(data, x))
+
+
+@pytest.mark.parametrize('stretch', [1.0, 2.0])
+def test_gradient_of_quadratic_field(flash, stretch):
+    data = flash(stretch=stretch)
+    xg, yg = _centers(data)
+    x, y = data.geometry.grd_mesh_x[1], data.geometry.grd_mesh_y[1]
+
+    gradient = derivative.gradient(data, xg**2 + yg**2)
+    assert numpy.allclose(_smooth(data, gradient[0]), _smooth(data, 2.0 * x))
+    assert numpy.allclose(_interior(data, gradient[1]), _interior(data, 2.0 * y))
+    if stretch == 1.0:
+        assert numpy.allclose(_interior(data, gradient[0]), _interior(data, 2.0 * x))
+
+
+@pytest.mark.parametrize('stretch', [1.0, 2.0])
+def test_divergence_of_staggered_components(flash, stretch):
+    data = flash(stretch=stretch)
+    member, = data.fields[0]
+    x, y = data.geometry.grd_mesh_x[1], data.geometry.grd_mesh_y[1]
+
+    # d(x y)/dx + d(-y x)/dy = y - x; exact for the (bilinear) face fields of the fixture
+    result = derivative.divergence(data, numpy.stack([member._fcx2, member._fcy2]))
+    assert numpy.allclose(_interior(data, result), _interior(data, y - x))
+
+    # quadratic along its own axis; the staggered difference is exact on any spacing
+    xf = data.geometry._grd_mesh_x[2]
+    yf = data.geometry._grd_mesh_y[2]
+    result = derivative.divergence(data, numpy.stack([xf**2, yf**2]))
+    assert numpy.allclose(_interior(data, result), _interior(data, 2.0 * x + 2.0 * y))
+
+
+@pytest.mark.parametrize('stretch', [1.0, 2.0])
+def test_laplacian_of_linear_and_quadratic_fields(flash, stretch):
+    data = flash(stretch=stretch)
+    member, = data.fields[2]
+    xg, yg = _centers(data)
+
+    assert numpy.allclose(_interior(data, derivative.laplacian(data, member._temp)), 0.0)
+    assert numpy.allclose(_smooth(data, derivative.laplacian(data, xg**2 + 3.0 * yg**2)), 8.0)
+    if stretch == 1.0:
+        assert numpy.allclose(_interior(data, derivative.laplacian(data, xg**2 + 3.0 * yg**2)), 8.0)
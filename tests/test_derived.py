@@ -0,0 +1,24 @@
+"""Tests of the built-in derived fields, registered with the simulation subpackage."""
+import numpy
+
+from pyioflash.simulation import derived
+
+
+def test_builtins_registered_by_simulation():
+    # the built-in derived fields must not depend upon importing the post-processing subpackage
+    for name in ('velx', 'vely', 'kinetic', 'vel_mag', 'vort_z'):
+        assert derived.lookup(name, 2).function.__module__ == 'pyioflash.simulation.derived'
+
+
+def test_builtins_evaluate_analytic_fields(flash):
+    data = flash()
+    member, = data.fields[1]
+    x, y = data.geometry.grd_mesh_x[1], data.geometry.grd_mesh_y[1]
+
+    # fcx2 = x y + 1 and fcy2 = -x y - 1 for step 1; such that dv/dx - du/dy = -y - x
+    velx, vely, vort_z = member.velx, member.vely, member.vort_z
+    assert numpy.allclose(velx, x * y + 1.0) and numpy.allclose(vely, -x * y - 1.0)
+    assert numpy.allclose(member.kinetic, velx**2 + vely**2)
+    assert numpy.allclose(member.vel_mag, numpy.sqrt(member.kinetic))
+    interior = (slice(None), slice(1, -1), slice(1, -1))
+    assert numpy.allclose(data.utility.assemble(vort_z)[interior], data.utility.assemble(-x - y)[interior])
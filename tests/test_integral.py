@@ -0,0 +1,121 @@
+"""Tests of the spatial integrals on uniform and stretched lattices of blocks."""
+import numpy
+import pytest
+
+from pyioflash.postprocess.elements import integral
+
+
+@pytest.mark.parametrize('stretch', [1.0, 2.0])
+def test_space_single_is_exact_for_linear_field(flash, stretch):
+    data = flash(stretch=stretch)
+    member, = data.fields[1]
+
+    # temp = x + 2y + 1 for step 1; the midpoint rule is exact over x in [0, 2]
+    result = integral.space_single(data, member.temp, axis='x')
+    average = integral.space_single(data, member.temp, axis='x', average=True)
+
+    y = (numpy.arange(16) + 0.5) / 16
+    assert result.shape == (1, 16)
+    assert numpy.allclose(result[0], 2.0 * (1.0 + 2.0 * y + 1.0))
+    assert numpy.allclose(average[0], 1.0 + 2.0 * y + 1.0)
+
+
+def test_assemble_orders_stretched_blocks(flash):
+    data = flash(stretch=2.0)
+    member, = data.fields[0]
+
+    assembled = data.utility.assemble(member.temp)
+    x = assembled[0] - 2.0 * ((numpy.arange(16) + 0.5) / 16)[:, None]
+
+    assert assembled.shape == (1, 16, 32)
+    assert numpy.all(numpy.diff(x, axis=1) > 0) and numpy.allclose(x, x[0])
+    assert numpy.array_equal(data.utility.scatter(assembled), member.temp)
+
+
+def test_block_positions_rank_stretched_blocks(flash):
+    from pyioflash.simulation.utility import _block_positions
+
+    data = flash(blocks=(4, 2), stretch=3.0)
+    positions = _block_positions(data.geometry)
+
+    block = numpy.arange(8)
+    assert numpy.array_equal(positions, numpy.stack([block % 4, block // 4, 0 * block], axis=1))
+
+
+TIMES = [0.0, 0.3, 1.0, 1.4, 2.5, 3.0]
+
+
+@pytest.mark.parametrize('steps', [3, 4, 5, 6])
+def test_time_simpson_is_exact_for_quadratic(flash, steps):
+    data = flash(steps=steps, times=TIMES[:steps])
+    fields = [numpy.full(2, t**2) for t in TIMES[:steps]]
+
+    result = integral.time(data, fields, method='simpson')
+    running = integral.time(data, fields, method='simpson', cumulative=True)
+
+    assert numpy.allclose(result, TIMES[steps - 1]**3 / 3)
+    assert running.shape == (steps, 2)
+    assert numpy.allclose(running[:, 0], numpy.array(TIMES[:steps])**3 / 3)
+
+
+@pytest.mark.parametrize('method', ['left', 'right', 'center'])
+def test_time_methods_match_reference(flash, method):
+    # left and right previously raised NameError (integrands) when not cumulative
+    data = flash(steps=6, times=TIMES)
+    fields = [numpy.full(2, numpy.sin(t)) for t in TIMES]
+    values, dt = numpy.sin(TIMES), numpy.diff(TIMES)
+    terms = {'left': values[:-1] * dt, 'right': values[1:] * dt, 'center': 0.5 * (values[1:] + values[:-1]) * dt}
+
+    result = integral.time(data, fields, method=method)
+    running = integral.time(data, fields, method=method, cumulative=True)
+
+    assert numpy.allclose(result, terms[method].sum())
+    assert numpy.allclose(running[:, 0], numpy.concatenate([[0.0], numpy.cumsum(terms[method])]))
+
+
+@pytest.mark.parametrize('method', ['left', 'right', 'center', 'simpson'])
+@pytest.mark.parametrize('cumulative', [False, True])
+def test_time_accumulator_matches_whole_series(flash, method, cumulative):
+    data = flash(steps=5, times=TIMES[:5])
+    fields = [numpy.array([numpy.exp(t), t**3]) for t in TIMES[:5]]
+
+    accumulator = integral._time_accumulator(data, method=method, cumulative=cumulative)
+    for field in fields:
+        accumulator.push(field)
+
+    expected = integral.time(data, fields, method=method, cumulative=cumulative)
+    assert numpy.allclose(accumulator.result(), expected)
+
+
+def test_simpson_rules_on_nonuniform_intervals():
+    h0, h1 = 0.4, 1.1
+    first, middle, last = 0.0, h0**2, (h0 + h1)**2
+
+    assert numpy.isclose(integral._simpson_pair(first, middle, last, h0, h1), (h0 + h1)**3 / 3)
+    assert numpy.isclose(integral._simpson_interval(first, middle, last, h0, h1), ((h0 + h1)**3 - h0**3) / 3)
+    assert numpy.isclose(integral._simpson_interval(last, middle, first, h1, h0), h0**3 / 3)
+
+
+def test_space_single_with_dropped_dimensions(flash):
+    data = flash(stretch=2.0)
+    member, = data.fields[1]
+
+    kept = integral.space_single(data, member.temp, axis='x')
+    dropped = integral.space_single(data, member.temp[:, 0], axis='x', keepdims=False)
+
+    assert dropped.shape == (16, ) and numpy.allclose(dropped, kept[0])
+
+
+def test_space_region_batches_regions(flash):
+    data = flash(stretch=2.0)
+    member, = data.fields[1]
+    times = numpy.stack([member.temp, 2.0 * member.temp])
+
+    # the whole domain, partial cells of several blocks, and a region outside the domain
+    regions = numpy.array([[[0.0, 2.0], [0.0, 1.0]], [[0.3, 1.7], [0.1, 0.65]], [[5.0, 6.0], [5.0, 6.0]]])
+    batched = integral.space_region(data, times, regions)
+    single = numpy.stack([integral.space_region(data, times, region) for region in regions], axis=-1)
+
+    # temp = x + 2y + 1 for step 1; the midpoint rule is exact over the domain
+    assert batched.shape == (2, 3) and numpy.allclose(batched, single)
+    assert numpy.allclose(batched[:, 0], [6.0, 12.0]) and numpy.allclose(batched[:, 2], 0.0)
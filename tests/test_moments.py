@@ -0,0 +1,97 @@
+"""Tests of the streaming, mergeable, weighted moments of a series."""
+import numpy
+import pytest
+
+from pyioflash.postprocess.sources import fields, moments
+
+
+def _reference(series, weights):
+    """Returns the brute-force weighted mean and covariance of a series stacked as [t, n, ...]."""
+    weights = numpy.asarray(weights)[(slice(None), ) + (None, ) * (series.ndim - 1)]
+    mean = (series * weights).sum(0) / weights.sum()
+    fluctuation = series - mean
+    covariance = numpy.einsum('t,ti...,tj...->ij...', weights.ravel(), fluctuation, fluctuation) / weights.sum()
+    return mean, covariance
+
+
+@pytest.fixture
+def series():
+    generator = numpy.random.default_rng(42)
+    return generator.normal(size=(9, 3, 4)), generator.uniform(0.1, 2.0, size=9)
+
+
+def test_update_matches_brute_force(series):
+    items, weights = series
+    accumulator = moments.Moments(weights, names=('a', 'b', 'c'))
+    for item in items:
+        accumulator.push(item)
+    result = accumulator.result()
+
+    mean, covariance = _reference(items, weights)
+    assert result.names == ('a', 'b', 'c') and numpy.isclose(result.weight, weights.sum())
+    assert numpy.allclose(result.mean, mean) and numpy.allclose(result.covariance, covariance)
+    assert numpy.allclose(result.variance, covariance[[0, 1, 2], [0, 1, 2]])
+
+
+@pytest.mark.parametrize('splits', [(1, ), (4, ), (2, 5, 7)])
+def test_chunked_merge_matches_whole(series, splits):
+    items, weights = series
+    parts = []
+    for chunk, chunk_weights in zip(numpy.split(items, splits), numpy.split(weights, splits)):
+        accumulator = moments.Moments(chunk_weights)
+        for item in chunk:
+            accumulator.push(item)
+        parts.append(accumulator.result())
+
+    result = moments.merge(*parts)
+    mean, covariance = _reference(items, weights)
+    assert numpy.allclose(result.mean, mean) and numpy.allclose(result.covariance, covariance)
+
+    merged = moments.Moments.from_statistics(parts[0])
+    for part in parts[1:]:
+        merged.merge(moments.Moments.from_statistics(part))
+    assert numpy.allclose(merged.result().covariance, covariance)
+
+
+def test_zero_total_weight_raises():
+    accumulator = moments.Moments([0.0, 0.0])
+    accumulator.push(numpy.ones((2, 3)))
+    accumulator.push(numpy.zeros((2, 3)))
+
+    with pytest.raises(ValueError, match='total weight is zero'):
+        accumulator.result()
+    with pytest.raises(ValueError, match='negative weight'):
+        accumulator.update(numpy.ones((2, 3)), -1.0)
+
+
+def test_leading_zero_weight_is_ignored():
+    accumulator = moments.Moments([0.0, 1.0, 1.0])
+    for value in (100.0, 1.0, 3.0):
+        accumulator.push(numpy.full((1, 2), value))
+    result = accumulator.result()
+
+    assert numpy.allclose(result.mean, 2.0) and numpy.allclose(result.variance, 1.0)
+
+
+def test_time_weights_average_piecewise_linear_series():
+    times = [0.0, 0.5, 2.0, 2.25, 4.0]
+    weights = moments.time_weights(times)
+
+    assert numpy.isclose(sum(weights), 4.0)
+    assert numpy.isclose(numpy.dot(weights, times) / sum(weights), 2.0)
+    assert moments.time_weights([3.0]) == [1.0]
+
+
+def test_velocity_matches_brute_force(flash):
+    times = [0.0, 0.4, 1.5, 2.0]
+    data = flash(steps=4, times=times)
+    result = moments.velocity(data, scalars=('temp', ))
+
+    stacked = []
+    for step in range(4):
+        member, = data.fields[step]
+        stacked.append(numpy.stack(list(fields.velocity(data, step)) + [member.temp]))
+    mean, covariance = _reference(numpy.array(stacked), moments.time_weights(times))
+
+    assert result.names == ('u', 'v', 'temp')
+    assert numpy.allclose(result.mean, mean) and numpy.allclose(result.covariance, covariance)
@@ -0,0 +1,81 @@
+"""Tests of the memory bounded residency of field data."""
+import numpy
+
+from pyioflash.postprocess.sources import energy
+
+
+def test_lru_evicts_least_recently_used():
+    from pyioflash.simulation.collections import LRUDict
+
+    cache = LRUDict(max_bytes=16, sizer=lambda value: value.nbytes)
+    cache.put('a', numpy.zeros(1))
+    cache.put('b', numpy.zeros(1))
+    cache.get('a')
+    cache.put('c', numpy.zeros(1))
+
+    assert 'a' in cache and 'c' in cache and 'b' not in cache
+    assert cache.evictions == 1
+
+
+def test_kinetic_reads_each_component_once_per_step(flash):
+    data = flash(steps=4, max_bytes=1)
+    residency = data.residency
+
+    for step in range(4):
+        misses = residency.misses
+        energy.kinetic(data, step)
+        assert residency.misses - misses == data.geometry.grd_dim
+
+    assert residency.stats()['items'] == 1
+
+
+def test_fields_are_read_on_first_access(flash):
+    data = flash(steps=3)
+    residency = data.residency
+    assert residency.stats()['items'] == 0
+
+    member, = data.fields[1]
+    assert member.temp_max == member.summary('temp', 'max').max()
+    assert residency.stats()['items'] == 1 and residency.misses == 1
+
+    data.fields.summary('pres', 'mean')
+    assert residency.stats()['items'] == 4
+
+
+def test_lru_unpins_and_reports_pinned_bytes():
+    from pyioflash.simulation.collections import LRUDict
+
+    cache = LRUDict(max_bytes=16, sizer=lambda value: value.nbytes)
+    cache.put('a', numpy.zeros(1), pinned=True)
+    cache.put('b', numpy.zeros(1))
+    cache.put('c', numpy.zeros(1))
+
+    assert 'a' in cache and 'b' not in cache and cache.pinned('a')
+    assert cache.stats()['pinned'] == 1 and cache.stats()['pinned_nbytes'] == 8
+
+    cache.unpin('a')
+    cache.put('d', numpy.zeros(1))
+    assert 'a' not in cache and cache.stats()['pinned_nbytes'] == 0
+
+
+def test_set_fields_are_pinned_until_unpinned(flash):
+    data = flash(steps=2, max_bytes=1)
+    member, = data.fields[0]
+    other, = data.fields[1]
+    original = member.temp.copy()
+
+    # modified field data is held (and reported) beyond the budget
+    member.temp = original + 10.0
+    other.pres
+    report = member.memory_report()
+    assert report['fields']['temp']['pinned'] and report['pinned'] == report['fields']['temp']['nbytes']
+    assert data.residency.stats()['pinned_nbytes'] == report['pinned']
+    assert numpy.array_equal(member.temp, original + 10.0)
+
+    # once unpinned and evicted, the field data (and its summaries) are reloaded from the file
+    version = member._version
+    member.unpin()
+    other.temp
+    assert member.memory_report()['pinned'] == 0 and data.residency.stats()['pinned'] == 0
+    assert numpy.array_equal(member.temp, original) and member._version > version
+    assert numpy.isclose(member.temp_max, original.max())
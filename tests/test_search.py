@@ -0,0 +1,39 @@
+"""Tests of searching the field data of a simulation using the block summaries."""
+import numpy
+
+
+def test_where_matches_brute_force(flash):
+    data = flash()
+    found = data.fields.where('temp', '>', 3.5)
+
+    stacked = numpy.array([getattr(member, 'temp') for member in data.fields])
+    assert all(numpy.array_equal(a, b) for a, b in zip(found, numpy.nonzero(stacked > 3.5)))
+
+
+def test_where_after_setting_interior(flash):
+    data = flash()
+    data.fields.where('temp', '>', 100.0)
+    member, = data.fields[1]
+
+    temp = member.temp.copy()
+    temp[5, 0, 2, 3] = 1000.0
+    member.temp = temp
+
+    assert member.summary('temp', 'max')[5] == 1000.0
+    assert member.temp_max == 1000.0
+    found = data.fields.where('temp', '>', 100.0)
+    assert [index.tolist() for index in found] == [[1], [5], [0], [2], [3]]
+
+
+def test_where_after_setting_field(flash):
+    data = flash()
+    data.fields.summary('temp', 'min')
+    member, = data.fields[-1]
+
+    temp = member._temp.copy()
+    temp[:] = -1.0
+    member._temp = temp
+
+    found = data.fields.where('temp', '<', 0.0)
+    assert numpy.all(found[0] == 2) and len(found[0]) == member.temp.size
+    assert numpy.all(data.fields.summary('temp', 'mean')[2] == -1.0)
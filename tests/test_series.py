@@ -0,0 +1,28 @@
+"""Tests of the time-series analysis and the consistency of its execution options."""
+import numpy
+import pytest
+
+from pyioflash.postprocess.analyses import series
+from pyioflash.postprocess.utility import Sourceable
+
+
+def _source():
+    return Sourceable(lambda step: numpy.full(2, float(step)))
+
+
+@pytest.mark.parametrize('options', [dict(prefetch=2), dict(stream=True, report={}),
+                                     dict(executor='process'), dict(workers=2, executor='fiber'),
+                                     dict(workers=0), dict(stream=True, prefetch=-1), dict(batch=0)])
+def test_simple_rejects_inconsistent_options(options):
+    with pytest.raises(ValueError):
+        series.simple(_source(), range(4), **options)
+
+
+@pytest.mark.parametrize('options', [dict(), dict(stream=True, prefetch=2, report={}),
+                                     dict(workers=2), dict(workers=2, executor='process', stream=True)])
+def test_simple_accepts_consistent_options(options):
+    result = series.simple(_source(), range(4), **options)
+
+    assert numpy.array_equal(numpy.asarray(result), numpy.repeat(numpy.arange(4.0)[:, None], 2, axis=1))
+    if 'report' in options:
+        assert options['report']
@@ -0,0 +1,53 @@
+"""Tests of the internal utilities of the post-processing subpackage."""
+import numpy
+import pytest
+
+from pyioflash.postprocess import utility
+
+
+def _ramp(step):
+    return numpy.arange(4.0) + step
+
+
+@pytest.mark.parametrize('executor', ['thread', 'process'])
+def test_map_ordered_preserves_order(executor):
+    results = list(utility._map_ordered(_ramp, range(6), workers=2, executor=executor))
+
+    assert len(results) == 6
+    assert all(numpy.array_equal(result, _ramp(step)) for step, result in enumerate(results))
+
+
+def test_profiler_stops_tracing_it_started():
+    import tracemalloc
+
+    profiler = utility.Profiler(memory=True)
+    outer = profiler.wrap(lambda size: inner(size).sum(), name='outer')
+    inner = profiler.wrap(lambda size: numpy.ones(size), name='inner')
+
+    outer(2**16)
+
+    assert not tracemalloc.is_tracing()
+    report = profiler.report()
+    assert report['inner']['peak'] >= 8 * 2**16 and report['outer']['calls'] == 1
+
+
+def test_profiler_leaves_user_tracing_running():
+    import tracemalloc
+
+    tracemalloc.start()
+    try:
+        profiler = utility.Profiler(memory=True)
+        profiler.wrap(lambda size: numpy.ones(size), name='ones')(2**16)
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+
+def test_workspace_retains_one_buffer_per_tag():
+    utility.release_workspace()
+    first = utility._workspace((4, 4), float, 'test')
+
+    assert utility._workspace((4, 4), float, 'test') is first
+    assert utility._workspace((8, 4), float, 'test').shape == (8, 4)
+    assert utility.release_workspace() == 8 * 4 * 8
+    assert utility.release_workspace() == 0